@@ -10,6 +10,8 @@ python -m arcade.examples.starting_template
 import arcade
 import random
 
+from game_utils.batch import RectangleBatch
+
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 WINDOW_TITLE = "Object-Oriented Programming with Classes"
@@ -110,6 +112,9 @@ class GameView(arcade.View):
         # List to store food objects
         self.food = []
 
+        # All food squares are drawn together from one batch (one draw call)
+        self.food_batch = RectangleBatch()
+
         # Generate some initial food squares
         self.spawn_squares(INITIAL_SQUARE_COUNT)
 
@@ -119,7 +124,12 @@ class GameView(arcade.View):
     def spawn_squares(self, count):
         """Spawn a specified number of square objects."""
         for _ in range(count):
-            self.food.append(Food())
+            self.add_food(Food())
+
+    def add_food(self, food):
+        """Add a food item to the game and to the draw batch."""
+        self.food.append(food)
+        self.food_batch.add(food, food.x, food.y, food.size, food.size, food.color)
 
     def reset(self):
         """Reset the game to the initial state."""
@@ -135,9 +145,8 @@ class GameView(arcade.View):
         # the screen to the background color, and erase what we drew last frame.
         self.clear()
 
-        # Draw all food items
-        for food in self.food:
-            food.draw()
+        # Draw all food items (a single draw call for the whole batch)
+        self.food_batch.draw()
 
         # Draw the player character
         self.character.draw()
@@ -164,11 +173,12 @@ class GameView(arcade.View):
         
         # Generate a food item when SPACE is pressed
         if key == arcade.key.SPACE:
-            self.food.append(Food())
+            self.add_food(Food())
 
         # Clear all food items when C is pressed
         if key == arcade.key.C:
             self.food.clear()
+            self.food_batch.clear()
 
     def on_key_release(self, key, key_modifiers):
         """
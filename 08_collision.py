@@ -10,6 +10,9 @@ python -m arcade.examples.starting_template
 import arcade
 import random
 
+from game_utils.batch import RectangleBatch
+from game_utils.spawning import around, spawn_points
+
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 WINDOW_TITLE = "Collision Detection - Eat the Food"
@@ -18,6 +21,11 @@ CHARACTER_SIZE = 30
 FOOD_SIZE = 20
 INITIAL_FOOD_COUNT = 5
 
+# Where new food may appear
+SPAWN_SPACING = 100     # food never spawns closer than this to other food
+PLAYER_CLEARANCE = 100  # ...or this close to the player
+HUD_PANEL = (0, WINDOW_HEIGHT - 60, 260, WINDOW_HEIGHT)  # left, bottom, right, top of the score text
+
 
 class Character:
     """Class to represent the player ball."""
@@ -148,6 +156,9 @@ class GameView(arcade.View):
         # List to store food objects
         self.food = []
 
+        # All food squares are drawn together from one batch (one draw call)
+        self.food_batch = RectangleBatch()
+
         # Generate some initial food squares
         self.spawn_food(INITIAL_FOOD_COUNT)
 
@@ -155,22 +166,40 @@ class GameView(arcade.View):
         # and set them to None
 
     def spawn_food(self, count):
-        """Spawn a specified number of food objects."""
-        for _ in range(count):
-            self.food.append(Food())
+        """Spawn a specified number of food objects, spread out evenly."""
+        half = FOOD_SIZE / 2
+        player = (self.character.x + self.character.size / 2,
+                  self.character.y + self.character.size / 2)
+        # Points are food centers; keep them away from the player and the HUD
+        points = spawn_points(
+            count,
+            (FOOD_SIZE, FOOD_SIZE, WINDOW_WIDTH - FOOD_SIZE, WINDOW_HEIGHT - FOOD_SIZE),
+            SPAWN_SPACING,
+            exclude=[HUD_PANEL, around(player, PLAYER_CLEARANCE)],
+            existing=[(f.x + f.size / 2, f.y + f.size / 2) for f in self.food],
+            clearance=half,
+        )
+        for x, y in points:
+            self.add_food(Food(x - half, y - half))
+
+    def add_food(self, food):
+        """Add a food item to the game and to the draw batch."""
+        self.food.append(food)
+        self.food_batch.add(food, food.x, food.y, food.size, food.size, food.color)
 
     def reset(self):
         """Reset the game to the initial state."""
         # Reset score
         self.score = 0
         
+        # Reset character position (first, so food doesn't spawn on top of it)
+        self.character.x = 100
+        self.character.y = 100
+
         # Clear existing food and create new food items
         self.food.clear()
+        self.food_batch.clear()
         self.spawn_food(INITIAL_FOOD_COUNT)
-        
-        # Reset character position
-        self.character.x = 100
-        self.character.y = 100
 
     def on_draw(self):
         """
@@ -181,9 +210,8 @@ class GameView(arcade.View):
         # the screen to the background color, and erase what we drew last frame.
         self.clear()
 
-        # Draw all food items
-        for food in self.food:
-            food.draw()
+        # Draw all food items (a single draw call for the whole batch)
+        self.food_batch.draw()
 
         # Draw the player character
         self.character.draw()
@@ -210,6 +238,7 @@ class GameView(arcade.View):
         for eaten_food in collided_food:
             if eaten_food in self.food:
                 self.food.remove(eaten_food)
+                self.food_batch.remove(eaten_food)
                 self.score += 1  # Increment score for each food item eaten
         
         # Optionally: spawn new food when all food is eaten
@@ -228,11 +257,12 @@ class GameView(arcade.View):
         
         # Generate a food item when SPACE is pressed
         if key == arcade.key.SPACE:
-            self.food.append(Food())
+            self.spawn_food(1)
 
         # Clear all food items when C is pressed
         if key == arcade.key.C:
             self.food.clear()
+            self.food_batch.clear()
         
         # Reset the game when R is pressed
         if key == arcade.key.R:
@@ -10,6 +10,10 @@ python -m arcade.examples.starting_template
 import arcade
 import random
 
+from game_utils.batch import RectangleBatch
+from game_utils.collision import CollisionWorld, square_bounds
+from game_utils.spawning import around, spawn_points
+
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 WINDOW_TITLE = "Collision Detection - Eat the Food Within 1 Minute"
@@ -19,6 +23,11 @@ FOOD_SIZE = 20
 GAME_DURATION = 60.0  # Game duration in seconds (1 minute)
 INITIAL_FOOD_COUNT = 5
 
+# Where new food may appear
+SPAWN_SPACING = 100     # food never spawns closer than this to other food
+PLAYER_CLEARANCE = 100  # ...or this close to the player
+HUD_PANEL = (0, WINDOW_HEIGHT - 100, 320, WINDOW_HEIGHT)  # left, bottom, right, top of the score text
+
 
 class Character:
     """Class to represent the player ball."""
@@ -54,41 +63,6 @@ class Character:
         """Draw the ball."""
         arcade.draw_lbwh_rectangle_filled(self.x, self.y, self.size, self.size, self.color)
 
-    def detect_collisions(self, food_list):
-        """
-        Detect collisions with food items.
-        
-        Args:
-            food_list: List of Food objects to check for collisions
-            
-        Returns:
-            List of Food objects that intersect with this character, or empty list if no collisions
-        """
-        collided_food = []
-        
-        for food in food_list:
-            # Check if rectangles overlap using AABB (Axis-Aligned Bounding Box) collision detection
-            # Character bounds (drawn from bottom-left corner)
-            char_left = self.x
-            char_right = self.x + self.size
-            char_bottom = self.y
-            char_top = self.y + self.size
-            
-            # Food bounds (also drawn from bottom-left corner)
-            food_left = food.x
-            food_right = food.x + food.size
-            food_bottom = food.y
-            food_top = food.y + food.size
-            
-            # Check for overlap - rectangles overlap if they overlap on both x and y axes
-            if (char_left < food_right and 
-                char_right > food_left and 
-                char_bottom < food_top and 
-                char_top > food_bottom):
-                collided_food.append(food)
-        
-        return collided_food
-
 
 class Food:
     """Class to represent a square object."""
@@ -153,6 +127,13 @@ class GameView(arcade.View):
         # List to store food objects
         self.food = []
 
+        # All food squares are drawn together from one batch (one draw call)
+        self.food_batch = RectangleBatch()
+
+        # Collision events: eat_food runs once when the character starts touching a food item
+        self.collisions = CollisionWorld(bounds=square_bounds)
+        self.collisions.watch(self.character, self.food, on_enter=self.eat_food)
+
         # Generate some initial food squares
         self.spawn_food(INITIAL_FOOD_COUNT)
 
@@ -160,9 +141,34 @@ class GameView(arcade.View):
         # and set them to None
 
     def spawn_food(self, count):
-        """Spawn a specified number of food objects."""
-        for _ in range(count):
-            self.food.append(Food())
+        """Spawn a specified number of food objects, spread out evenly."""
+        half = FOOD_SIZE / 2
+        player = (self.character.x + self.character.size / 2,
+                  self.character.y + self.character.size / 2)
+        # Points are food centers; keep them away from the player and the HUD
+        points = spawn_points(
+            count,
+            (FOOD_SIZE, FOOD_SIZE, WINDOW_WIDTH - FOOD_SIZE, WINDOW_HEIGHT - FOOD_SIZE),
+            SPAWN_SPACING,
+            exclude=[HUD_PANEL, around(player, PLAYER_CLEARANCE)],
+            existing=[(f.x + f.size / 2, f.y + f.size / 2) for f in self.food],
+            clearance=half,
+        )
+        for x, y in points:
+            self.add_food(Food(x - half, y - half))
+
+    def add_food(self, food):
+        """Add a food item to the game and to the draw batch."""
+        self.food.append(food)
+        self.food_batch.add(food, food.x, food.y, food.size, food.size, food.color)
+
+    def eat_food(self, character, food):
+        """Collision callback: remove eaten food and update score."""
+        if food in self.food:
+            self.food.remove(food)
+            self.food_batch.remove(food)
+            self.collisions.forget(food)
+            self.score += 1  # Increment score for each food item eaten
 
     def reset(self):
         """Reset the game to the initial state."""
@@ -173,13 +179,14 @@ class GameView(arcade.View):
         self.time_remaining = GAME_DURATION
         self.game_over = False
         
+        # Reset character position (first, so food doesn't spawn on top of it)
+        self.character.x = 100
+        self.character.y = 100
+
         # Clear existing food and create new food items
         self.food.clear()
+        self.food_batch.clear()
         self.spawn_food(INITIAL_FOOD_COUNT)
-        
-        # Reset character position
-        self.character.x = 100
-        self.character.y = 100
 
     def on_draw(self):
         """
@@ -190,9 +197,8 @@ class GameView(arcade.View):
         # the screen to the background color, and erase what we drew last frame.
         self.clear()
 
-        # Draw all food items
-        for food in self.food:
-            food.draw()
+        # Draw all food items (a single draw call for the whole batch)
+        self.food_batch.draw()
 
         # Draw the player character
         self.character.draw()
@@ -247,14 +253,8 @@ class GameView(arcade.View):
             # Update the character position based on key input
             self.character.update(self.key_pressed)
             
-            # Check for collisions with food
-            collided_food = self.character.detect_collisions(self.food)
-            
-            # Process collisions: remove eaten food and update score
-            for eaten_food in collided_food:
-                if eaten_food in self.food:
-                    self.food.remove(eaten_food)
-                    self.score += 1  # Increment score for each food item eaten
+            # Check for collisions with food (calls eat_food for new contacts)
+            self.collisions.update()
             
             # Optionally: spawn new food when all food is eaten
             if len(self.food) == 0:
@@ -272,11 +272,12 @@ class GameView(arcade.View):
         
         # Generate a food item when SPACE is pressed (only if game is not over)
         if key == arcade.key.SPACE and not self.game_over:
-            self.food.append(Food())
+            self.spawn_food(1)
 
         # Clear all food items when C is pressed (only if game is not over)
         if key == arcade.key.C and not self.game_over:
             self.food.clear()
+            self.food_batch.clear()
         
         # Reset the game when R is pressed (works anytime)
         if key == arcade.key.R:
@@ -10,6 +10,12 @@ python 11_sprite_collision.py
 import arcade
 import random
 
+from game_utils.colliders import AABB, CIRCLE, collides
+from game_utils.hitbox_cache import load_texture
+from game_utils.preloader import LoadingView, Preloader, load_now
+from game_utils.quadtree import LooseQuadtree
+from game_utils.spawning import around, spawn_points
+
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 WINDOW_TITLE = "Sprite Collision Detection - Collect Mushrooms"
@@ -23,26 +29,41 @@ MOVEMENT_SPEED = 5
 
 # Spawning configuration
 INITIAL_MUSHROOM_COUNT = 5  # Number of mushrooms to spawn initially
+SPAWN_SPACING = 100         # Mushrooms never spawn closer than this to each other
+PLAYER_CLEARANCE = 100      # ...or this close to the player
+HUD_PANEL = (0, WINDOW_HEIGHT - 110, 480, WINDOW_HEIGHT)  # left, bottom, right, top of the text
 
 # Global texture cache - load textures once and reuse them
 TEXTURES = {}
 
+# One loading job per texture, so a loading screen can load them side by side.
+# Passing the draw scale lets the hit box be simplified for that size
+# and cached on disk next to the image (see game_utils/hitbox_cache.py)
+TEXTURE_JOBS = {
+    "character": lambda: load_texture("assets/ball.png", CHARACTER_SCALING),
+    "mushroom": lambda: load_texture("assets/05.png", MUSHROOM_SCALING),
+}
+
 def load_textures():
-    """Load all textures once at startup."""
-    global TEXTURES
-    TEXTURES["character"] = arcade.load_texture("assets/ball.png")
-    TEXTURES["mushroom"] = arcade.load_texture("assets/05.png")
+    """Load all textures once at startup, without a loading screen."""
+    TEXTURES.update(load_now(TEXTURE_JOBS))
 
 
 class CharacterSprite(arcade.Sprite):
-    """Player character sprite class."""
+    """Player character sprite class.
+
+    Args:
+        collider: Collision shape (CIRCLE, AABB or POLYGON from game_utils.colliders).
+            The ball is round, so a circle is both accurate and the cheapest test.
+    """
     
-    def __init__(self):
+    def __init__(self, collider=CIRCLE):
         super().__init__()
         
         # Use pre-loaded texture
         self.texture = TEXTURES["character"]
         self.scale = CHARACTER_SCALING
+        self.collider = collider
     
     def update(self, delta_time=None):
         """Update the sprite position."""
@@ -62,18 +83,24 @@ class CharacterSprite(arcade.Sprite):
 
 
 class MushroomSprite(arcade.Sprite):
-    """Mushroom food sprite class."""
+    """Mushroom food sprite class.
+
+    Args:
+        x, y: Where to put the mushroom (a random spot if not given).
+    """
     
-    def __init__(self):
+    def __init__(self, x=None, y=None):
         super().__init__()
         
         # Use pre-loaded texture
         self.texture = TEXTURES["mushroom"]
         self.scale = MUSHROOM_SCALING
+        # A box around the hit box is plenty for picking food up
+        self.collider = AABB
         
-        # Set random position
-        self.center_x = random.randint(50, WINDOW_WIDTH - 50)
-        self.center_y = random.randint(50, WINDOW_HEIGHT - 50)
+        # Set position (random if not given)
+        self.center_x = random.randint(50, WINDOW_WIDTH - 50) if x is None else x
+        self.center_y = random.randint(50, WINDOW_HEIGHT - 50) if y is None else y
 
 
 class GameView(arcade.View):
@@ -92,6 +119,9 @@ class GameView(arcade.View):
         # Sprite lists
         self.player_list = None
         self.mushroom_list = None
+
+        # Spatial index of the mushrooms so we only test the ones near the player
+        self.mushroom_index = None
         
         # Player sprite
         self.player_sprite = None
@@ -108,6 +138,7 @@ class GameView(arcade.View):
         # Create sprite lists
         self.player_list = arcade.SpriteList()
         self.mushroom_list = arcade.SpriteList()
+        self.mushroom_index = LooseQuadtree(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
         
         # Create player sprite
         self.player_sprite = CharacterSprite()
@@ -119,10 +150,19 @@ class GameView(arcade.View):
         self.spawn_mushrooms(INITIAL_MUSHROOM_COUNT)
 
     def spawn_mushrooms(self, count):
-        """Spawn a specified number of mushroom sprites."""
-        for _ in range(count):
-            mushroom = MushroomSprite()
-            self.mushroom_list.append(mushroom)
+        """Spawn a specified number of mushroom sprites, spread out evenly."""
+        # Keep new mushrooms apart from each other, the player and the text
+        points = spawn_points(
+            count,
+            (50, 50, WINDOW_WIDTH - 50, WINDOW_HEIGHT - 50),
+            SPAWN_SPACING,
+            exclude=[HUD_PANEL, around(self.player_sprite.position, PLAYER_CLEARANCE)],
+            existing=[m.position for m in self.mushroom_list],
+        )
+        new_mushrooms = [MushroomSprite(x, y) for x, y in points]
+        self.mushroom_list.extend(new_mushrooms)
+        # Add them to the spatial index in one go
+        self.mushroom_index.extend(new_mushrooms)
 
     def on_draw(self):
         """Render the screen."""
@@ -164,13 +204,17 @@ class GameView(arcade.View):
         # Update sprites
         self.player_list.update()
         
-        # Check for collisions between player and mushrooms
-        hit_list = arcade.check_for_collision_with_list(self.player_sprite, self.mushroom_list)
+        # Check for collisions between player and mushrooms.
+        # The quadtree hands us only the mushrooms around the player,
+        # so we don't have to test every mushroom on the screen.
+        nearby = self.mushroom_index.query_around(self.player_sprite)
+        hit_list = [m for m in nearby if collides(self.player_sprite, m)]
         
         # Process collisions
         for mushroom in hit_list:
-            # Remove the mushroom
+            # Remove the mushroom (from the sprite list and the index)
             mushroom.remove_from_sprite_lists()
+            self.mushroom_index.remove(mushroom)
             # Increase score
             self.score += 1
         
@@ -191,8 +235,7 @@ class GameView(arcade.View):
             self.right_pressed = True
         elif key == arcade.key.SPACE:
             # Add a new mushroom
-            mushroom = MushroomSprite()
-            self.mushroom_list.append(mushroom)
+            self.spawn_mushrooms(1)
 
     def on_key_release(self, key, modifiers):
         """Called when the user releases a key."""
@@ -207,18 +250,22 @@ class GameView(arcade.View):
             self.right_pressed = False
 
 
+def start_game(results):
+    """Create the game once the loading screen has loaded the textures."""
+    TEXTURES.update(results)
+    game_view = GameView()
+    game_view.setup()
+    return game_view
+
+
 def main():
     """Main function"""
-    # Load all textures once at startup
-    load_textures()
-    
     # Create a window
     window = arcade.Window(WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE)
 
-    # Create and setup the game view
-    game_view = GameView()
-    window.show_view(game_view)
-    game_view.setup()
+    # Show a loading screen while the textures load in the background,
+    # then switch to the game (see game_utils/preloader.py)
+    window.show_view(LoadingView(Preloader(TEXTURE_JOBS), start_game))
 
     # Start the arcade game loop
     arcade.run()
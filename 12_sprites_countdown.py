@@ -10,6 +10,13 @@ python 11_sprite_collision.py
 import arcade
 import random
 
+from game_utils.colliders import AABB, CIRCLE, collides
+from game_utils.collision import CollisionWorld
+from game_utils.hitbox_cache import load_texture
+from game_utils.preloader import LoadingView, Preloader, load_now
+from game_utils.quadtree import LooseQuadtree
+from game_utils.spawning import around, spawn_points
+
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 WINDOW_TITLE = "Sprite Collision with Countdown - Collect Mushrooms in 60 Seconds"
@@ -26,26 +33,41 @@ GAME_DURATION = 60.0  # Game duration in seconds (1 minute)
 
 # Spawning configuration
 INITIAL_MUSHROOM_COUNT = 5  # Number of mushrooms to spawn initially
+SPAWN_SPACING = 100         # Mushrooms never spawn closer than this to each other
+PLAYER_CLEARANCE = 100      # ...or this close to the player
+HUD_PANEL = (0, WINDOW_HEIGHT - 150, 480, WINDOW_HEIGHT)  # left, bottom, right, top of the text
 
 # Global texture cache - load textures once and reuse them
 TEXTURES = {}
 
+# One loading job per texture, so a loading screen can load them side by side.
+# Passing the draw scale lets the hit box be simplified for that size
+# and cached on disk next to the image (see game_utils/hitbox_cache.py)
+TEXTURE_JOBS = {
+    "character": lambda: load_texture("assets/ball.png", CHARACTER_SCALING),
+    "mushroom": lambda: load_texture("assets/05.png", MUSHROOM_SCALING),
+}
+
 def load_textures():
-    """Load all textures once at startup."""
-    global TEXTURES
-    TEXTURES["character"] = arcade.load_texture("assets/ball.png")
-    TEXTURES["mushroom"] = arcade.load_texture("assets/05.png")
+    """Load all textures once at startup, without a loading screen."""
+    TEXTURES.update(load_now(TEXTURE_JOBS))
 
 
 class CharacterSprite(arcade.Sprite):
-    """Player character sprite class."""
+    """Player character sprite class.
+
+    Args:
+        collider: Collision shape (CIRCLE, AABB or POLYGON from game_utils.colliders).
+            The ball is round, so a circle is both accurate and the cheapest test.
+    """
     
-    def __init__(self):
+    def __init__(self, collider=CIRCLE):
         super().__init__()
         
         # Use pre-loaded texture
         self.texture = TEXTURES["character"]
         self.scale = CHARACTER_SCALING
+        self.collider = collider
     
     def update(self, delta_time=None):
         """Update the sprite position."""
@@ -65,18 +87,24 @@ class CharacterSprite(arcade.Sprite):
 
 
 class MushroomSprite(arcade.Sprite):
-    """Mushroom food sprite class."""
+    """Mushroom food sprite class.
+
+    Args:
+        x, y: Where to put the mushroom (a random spot if not given).
+    """
     
-    def __init__(self):
+    def __init__(self, x=None, y=None):
         super().__init__()
         
         # Use pre-loaded texture
         self.texture = TEXTURES["mushroom"]
         self.scale = MUSHROOM_SCALING
+        # A box around the hit box is plenty for picking food up
+        self.collider = AABB
         
-        # Set random position
-        self.center_x = random.randint(50, WINDOW_WIDTH - 50)
-        self.center_y = random.randint(50, WINDOW_HEIGHT - 50)
+        # Set position (random if not given)
+        self.center_x = random.randint(50, WINDOW_WIDTH - 50) if x is None else x
+        self.center_y = random.randint(50, WINDOW_HEIGHT - 50) if y is None else y
 
 
 class GameView(arcade.View):
@@ -99,6 +127,12 @@ class GameView(arcade.View):
         # Sprite lists
         self.player_list = None
         self.mushroom_list = None
+
+        # Spatial index of the mushrooms so we only test the ones near the player
+        self.mushroom_index = None
+
+        # Collision events (enter/stay/exit) between the player and mushrooms
+        self.collisions = None
         
         # Player sprite
         self.player_sprite = None
@@ -115,21 +149,51 @@ class GameView(arcade.View):
         # Create sprite lists
         self.player_list = arcade.SpriteList()
         self.mushroom_list = arcade.SpriteList()
+        self.mushroom_index = LooseQuadtree(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
         
         # Create player sprite
         self.player_sprite = CharacterSprite()
         self.player_sprite.center_x = 100
         self.player_sprite.center_y = 100
         self.player_list.append(self.player_sprite)
+
+        # Ask the collision world to call collect_mushroom when the player
+        # starts touching a mushroom. Only mushrooms near the player (from the
+        # quadtree) are tested, and the exact sprite check is skipped for
+        # pairs that haven't moved since the last frame.
+        self.collisions = CollisionWorld(narrow_phase=collides)
+        self.collisions.watch(
+            self.player_sprite,
+            lambda: self.mushroom_index.query_around(self.player_sprite),
+            on_enter=self.collect_mushroom,
+        )
         
         # Create mushroom sprites
         self.spawn_mushrooms(INITIAL_MUSHROOM_COUNT)
 
     def spawn_mushrooms(self, count):
-        """Spawn a specified number of mushroom sprites."""
-        for _ in range(count):
-            mushroom = MushroomSprite()
-            self.mushroom_list.append(mushroom)
+        """Spawn a specified number of mushroom sprites, spread out evenly."""
+        # Keep new mushrooms apart from each other, the player and the text
+        points = spawn_points(
+            count,
+            (50, 50, WINDOW_WIDTH - 50, WINDOW_HEIGHT - 50),
+            SPAWN_SPACING,
+            exclude=[HUD_PANEL, around(self.player_sprite.position, PLAYER_CLEARANCE)],
+            existing=[m.position for m in self.mushroom_list],
+        )
+        new_mushrooms = [MushroomSprite(x, y) for x, y in points]
+        self.mushroom_list.extend(new_mushrooms)
+        # Add them to the spatial index in one go
+        self.mushroom_index.extend(new_mushrooms)
+
+    def collect_mushroom(self, player, mushroom):
+        """Collision callback: the player just touched a mushroom."""
+        # Remove the mushroom (from the sprite list, the index and the collision world)
+        mushroom.remove_from_sprite_lists()
+        self.mushroom_index.remove(mushroom)
+        self.collisions.forget(mushroom)
+        # Increase score
+        self.score += 1
 
     def on_draw(self):
         """Render the screen."""
@@ -203,14 +267,8 @@ class GameView(arcade.View):
             self.player_list.update()
             
             # Check for collisions between player and mushrooms
-            hit_list = arcade.check_for_collision_with_list(self.player_sprite, self.mushroom_list)
-            
-            # Process collisions
-            for mushroom in hit_list:
-                # Remove the mushroom
-                mushroom.remove_from_sprite_lists()
-                # Increase score
-                self.score += 1
+            # (calls collect_mushroom for every mushroom we just touched)
+            self.collisions.update()
             
             # Spawn new mushrooms if all are collected
             if len(self.mushroom_list) == 0:
@@ -231,8 +289,7 @@ class GameView(arcade.View):
                 self.right_pressed = True
             elif key == arcade.key.SPACE:
                 # Add a new mushroom
-                mushroom = MushroomSprite()
-                self.mushroom_list.append(mushroom)
+                self.spawn_mushrooms(1)
         
         # Reset game (works anytime)
         if key == arcade.key.R:
@@ -273,21 +330,26 @@ class GameView(arcade.View):
         
         # Clear and recreate mushrooms
         self.mushroom_list.clear()
+        self.mushroom_index.clear()
         self.spawn_mushrooms(INITIAL_MUSHROOM_COUNT)
 
 
+def start_game(results):
+    """Create the game once the loading screen has loaded the textures."""
+    TEXTURES.update(results)
+    game_view = GameView()
+    game_view.setup()
+    return game_view
+
+
 def main():
     """Main function"""
-    # Load all textures once at startup
-    load_textures()
-    
     # Create a window
     window = arcade.Window(WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE)
 
-    # Create and setup the game view
-    game_view = GameView()
-    window.show_view(game_view)
-    game_view.setup()
+    # Show a loading screen while the textures load in the background,
+    # then switch to the game (see game_utils/preloader.py)
+    window.show_view(LoadingView(Preloader(TEXTURE_JOBS), start_game))
 
     # Start the arcade game loop
     arcade.run()
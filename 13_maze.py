@@ -11,6 +11,10 @@ python 13_maze.py
 import arcade
 import random
 
+from game_utils.atlas import load_atlas
+from game_utils.colliders import AABB, CIRCLE, collisions_with_list
+from game_utils.preloader import LoadingView, Preloader
+
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 WINDOW_TITLE = "Maze Navigation with Countdown - Collect Food and Find Exit"
@@ -64,13 +68,25 @@ MAZE_LAYOUT = """
 # Global texture cache - load textures once and reuse them
 TEXTURES = {}
 
+def load_atlas_textures():
+    """The game's textures by name, from its sprite atlas."""
+    # Every picture, shrunk to the size it is drawn at, comes from one atlas
+    # image that is built on the first run (see game_utils/atlas.py). The
+    # textures already have their on-screen size, so sprites keep scale 1.
+    return load_atlas("13_maze", {
+        "character": ("assets/ball.png", CHARACTER_SCALING),
+        "stone": ("assets/04.png", STONE_SCALING),
+        "mushroom": ("assets/05.png", MUSHROOM_SCALING),
+        "exit": ("assets/06.png", STONE_SCALING),
+    }).textures
+
+
+# The atlas is the one loading job (see game_utils/preloader.py)
+TEXTURE_JOBS = {"atlas": load_atlas_textures}
+
 def load_textures():
-    """Load all textures once at startup."""
-    global TEXTURES
-    TEXTURES["character"] = arcade.load_texture("assets/ball.png")
-    TEXTURES["stone"] = arcade.load_texture("assets/04.png")
-    TEXTURES["mushroom"] = arcade.load_texture("assets/05.png")
-    TEXTURES["exit"] = arcade.load_texture("assets/06.png")
+    """Load all textures once at startup, without a loading screen."""
+    TEXTURES.update(load_atlas_textures())
 
 
 class StoneSprite(arcade.Sprite):
@@ -81,7 +97,8 @@ class StoneSprite(arcade.Sprite):
         
         # Use pre-loaded texture
         self.texture = TEXTURES["stone"]
-        self.scale = STONE_SCALING
+        # Wall tiles are squares
+        self.collider = AABB
 
 
 class ExitSprite(arcade.Sprite):
@@ -92,18 +109,23 @@ class ExitSprite(arcade.Sprite):
         
         # Use pre-loaded texture
         self.texture = TEXTURES["exit"]
-        self.scale = STONE_SCALING
+        self.collider = AABB
 
 
 class CharacterSprite(arcade.Sprite):
-    """Player character sprite class."""
+    """Player character sprite class.
+
+    Args:
+        collider: Collision shape (CIRCLE, AABB or POLYGON from game_utils.colliders).
+            The ball is round, so a circle is both accurate and the cheapest test.
+    """
     
-    def __init__(self):
+    def __init__(self, collider=CIRCLE):
         super().__init__()
         
         # Use pre-loaded texture
         self.texture = TEXTURES["character"]
-        self.scale = CHARACTER_SCALING
+        self.collider = collider
     
     def update(self, delta_time=None):
         """Update the sprite position."""
@@ -130,7 +152,8 @@ class MushroomSprite(arcade.Sprite):
         
         # Use pre-loaded texture
         self.texture = TEXTURES["mushroom"]
-        self.scale = MUSHROOM_SCALING
+        # A box around the hit box is plenty for picking food up
+        self.collider = AABB
         
         # Set random position
         self.center_x = random.randint(50, WINDOW_WIDTH - 50)
@@ -328,7 +351,7 @@ class GameView(arcade.View):
             self.player_list.update()
             
             # Check for collisions with walls
-            wall_collision_list = arcade.check_for_collision_with_list(self.player_sprite, self.wall_list)
+            wall_collision_list = collisions_with_list(self.player_sprite, self.wall_list)
             
             if wall_collision_list:
                 # If collision with wall, restore original position
@@ -336,7 +359,7 @@ class GameView(arcade.View):
                 self.player_sprite.center_y = original_y
             
             # Check for collisions between player and mushrooms (food)
-            hit_list = arcade.check_for_collision_with_list(self.player_sprite, self.mushroom_list)
+            hit_list = collisions_with_list(self.player_sprite, self.mushroom_list)
             
             # Process collisions with mushrooms (eating food)
             for mushroom in hit_list:
@@ -347,7 +370,7 @@ class GameView(arcade.View):
             
             # Check for collision with exit (only if all food is collected)
             if len(self.mushroom_list) == 0:
-                exit_collision_list = arcade.check_for_collision_with_list(self.player_sprite, self.exit_list)
+                exit_collision_list = collisions_with_list(self.player_sprite, self.exit_list)
                 if exit_collision_list:
                     # Player reached the exit with all food collected - Victory!
                     self.game_over = True  # This will trigger victory screen
@@ -414,18 +437,22 @@ class GameView(arcade.View):
         self.create_maze()
 
 
+def start_game(results):
+    """Create the game once the loading screen has loaded the textures."""
+    TEXTURES.update(results["atlas"])
+    game_view = GameView()
+    game_view.setup()
+    return game_view
+
+
 def main():
     """Main function"""
-    # Load all textures once at startup
-    load_textures()
-    
     # Create a window
     window = arcade.Window(WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE)
 
-    # Create and setup the game view
-    game_view = GameView()
-    window.show_view(game_view)
-    game_view.setup()
+    # Show a loading screen while the textures load in the background,
+    # then switch to the game (see game_utils/preloader.py)
+    window.show_view(LoadingView(Preloader(TEXTURE_JOBS), start_game))
 
     # Start the arcade game loop
     arcade.run()
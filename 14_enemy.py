@@ -11,6 +11,11 @@ python 13_maze.py
 import arcade
 import random
 
+from game_utils.atlas import load_atlas
+from game_utils.colliders import AABB, CIRCLE, collides
+from game_utils.collision import BroadPhase, CollisionLayers, CollisionWorld
+from game_utils.preloader import LoadingView, Preloader
+
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 WINDOW_TITLE = "Maze Navigation with Countdown - Collect Food and Find Exit"
@@ -64,16 +69,37 @@ MAZE_LAYOUT = """
 ########################################
 """
 
+# Collision layers: which groups of sprites can touch each other.
+# The player meets everything. Every check in this game is the player against
+# one group, so the layers only choose which group a query looks at; the pair
+# tests saved each frame come from the broad-phase grid.
+COLLISION_LAYERS = CollisionLayers("player", "wall", "pickup", "enemy", "exit")
+COLLISION_LAYERS.interact("player", "wall", "pickup", "enemy", "exit")
+BROAD_PHASE_CELL_SIZE = TILE_SIZE * 2
+
 # Global texture cache - load textures once and reuse them
 TEXTURES = {}
 
+def load_atlas_textures():
+    """The game's textures by name, from its sprite atlas."""
+    # Every picture, shrunk to the size it is drawn at, comes from one atlas
+    # image that is built on the first run (see game_utils/atlas.py). The
+    # textures already have their on-screen size, so sprites keep scale 1.
+    return load_atlas("14_enemy", {
+        "character": ("assets/ball.png", CHARACTER_SCALING),
+        "enemy": ("assets/ball.png", ENEMY_SCALING),
+        "stone": ("assets/04.png", STONE_SCALING),
+        "mushroom": ("assets/05.png", MUSHROOM_SCALING),
+        "exit": ("assets/06.png", STONE_SCALING),
+    }).textures
+
+
+# The atlas is the one loading job (see game_utils/preloader.py)
+TEXTURE_JOBS = {"atlas": load_atlas_textures}
+
 def load_textures():
-    """Load all textures once at startup."""
-    global TEXTURES
-    TEXTURES["character"] = arcade.load_texture("assets/ball.png")
-    TEXTURES["stone"] = arcade.load_texture("assets/04.png")
-    TEXTURES["mushroom"] = arcade.load_texture("assets/05.png")
-    TEXTURES["exit"] = arcade.load_texture("assets/06.png")
+    """Load all textures once at startup, without a loading screen."""
+    TEXTURES.update(load_atlas_textures())
 
 
 class StoneSprite(arcade.Sprite):
@@ -84,7 +110,8 @@ class StoneSprite(arcade.Sprite):
         
         # Use pre-loaded texture
         self.texture = TEXTURES["stone"]
-        self.scale = STONE_SCALING
+        # Wall tiles are squares
+        self.collider = AABB
 
 
 class ExitSprite(arcade.Sprite):
@@ -95,18 +122,23 @@ class ExitSprite(arcade.Sprite):
         
         # Use pre-loaded texture
         self.texture = TEXTURES["exit"]
-        self.scale = STONE_SCALING
+        self.collider = AABB
 
 
 class CharacterSprite(arcade.Sprite):
-    """Player character sprite class."""
+    """Player character sprite class.
+
+    Args:
+        collider: Collision shape (CIRCLE, AABB or POLYGON from game_utils.colliders).
+            The ball is round, so a circle is both accurate and the cheapest test.
+    """
     
-    def __init__(self):
+    def __init__(self, collider=CIRCLE):
         super().__init__()
         
         # Use pre-loaded texture
         self.texture = TEXTURES["character"]
-        self.scale = CHARACTER_SCALING
+        self.collider = collider
     
     def update(self, delta_time=None):
         """Update the sprite position."""
@@ -136,10 +168,11 @@ class EnemySprite(arcade.Sprite):
     - Movement: steps toward the center of the next grid cell at ENEMY_SPEED pixels per frame.
     - Game over: if the enemy collides with the player, the game ends with a "CAUGHT!" overlay.
     """
-    def __init__(self):
+    def __init__(self, collider=CIRCLE):
         super().__init__()
-        self.texture = TEXTURES["character"]
-        self.scale = ENEMY_SCALING
+        self.texture = TEXTURES["enemy"]  # The ball at ENEMY_SCALING size
+        # Same round ball as the player: circle-vs-circle is the cheapest test
+        self.collider = collider
         # Tint enemy to red to distinguish from player
         self.color = arcade.color.RED
         # Movement target (world coordinates)
@@ -155,7 +188,8 @@ class MushroomSprite(arcade.Sprite):
         
         # Use pre-loaded texture
         self.texture = TEXTURES["mushroom"]
-        self.scale = MUSHROOM_SCALING
+        # A box around the hit box is plenty for picking food up
+        self.collider = AABB
         
         # Set random position
         self.center_x = random.randint(50, WINDOW_WIDTH - 50)
@@ -198,6 +232,15 @@ class GameView(arcade.View):
         self.enemy_path = []  # list of (row, col)
         self.enemy_recalc_timer = 0.0
         self.caught_by_enemy = False
+
+        # Shared broad phase for every sprite in the level (bucketed by layer)
+        self.broad_phase = BroadPhase(COLLISION_LAYERS, cell_size=BROAD_PHASE_CELL_SIZE,
+                                      narrow_phase=collides)
+        # Pair tests a separate check_for_collision_with_list per list would do
+        self.pair_tests_brute_force = 0
+
+        # Collision events (enemy touching the player)
+        self.collisions = CollisionWorld(narrow_phase=collides)
         
         # Track keys for movement
         self.left_pressed = False
@@ -217,6 +260,33 @@ class GameView(arcade.View):
         
         # Create the maze from the layout string
         self.create_maze()
+        self.setup_collisions()
+
+    def setup_collisions(self):
+        """Register the sprites created by create_maze() for collision checks.
+
+        Every sprite goes into the shared broad phase on its layer, and the
+        collision world watches the player against nearby enemies.
+        """
+        self.broad_phase.clear()
+        self.broad_phase.add(self.player_sprite, "player")
+        self.broad_phase.extend(self.wall_list, "wall")
+        self.broad_phase.extend(self.mushroom_list, "pickup")
+        self.broad_phase.extend(self.exit_list, "exit")
+        self.broad_phase.extend(self.enemy_list, "enemy")
+
+        self.collisions.clear()
+        self.collisions.watch(
+            self.player_sprite,
+            lambda: self.broad_phase.nearby(self.player_sprite, "enemy"),
+            on_enter=self.on_enemy_contact,
+        )
+
+    def on_enemy_contact(self, player, enemy):
+        """Collision callback: the enemy caught the player, the game ends."""
+        self.game_over = True
+        self.caught_by_enemy = True
+        self.won = False
 
     def create_maze(self):
         """Create all level sprites from MAZE_LAYOUT.
@@ -351,6 +421,7 @@ class GameView(arcade.View):
         for _ in range(count):
             mushroom = MushroomSprite()
             self.mushroom_list.append(mushroom)
+            self.broad_phase.add(mushroom, "pickup")
 
     def on_draw(self):
         """Render the screen."""
@@ -390,6 +461,13 @@ class GameView(arcade.View):
         arcade.draw_text(time_text, WINDOW_WIDTH - 180, PANEL_HEIGHT - 35, 
                         arcade.color.WHITE, 24)
 
+        # Draw collision pair tests this frame (middle): the broad-phase grid
+        # only tests sprites in the player's cells
+        pair_text = (f"Broad phase: {self.broad_phase.pair_tests} pair tests "
+                     f"(vs {self.pair_tests_brute_force} checking every sprite)")
+        arcade.draw_text(pair_text, WINDOW_WIDTH // 2, PANEL_HEIGHT - 30,
+                        arcade.color.LIGHT_GRAY, 14, anchor_x="center")
+
     def draw_game_state_overlays(self):
         """Draw state overlays.
 
@@ -470,30 +548,38 @@ class GameView(arcade.View):
             original_x = self.player_sprite.center_x
             original_y = self.player_sprite.center_y
             
+            # Count pair tests from here on (shown in the game panel)
+            self.broad_phase.reset_counters()
+            self.pair_tests_brute_force = len(self.wall_list) + len(self.mushroom_list) + len(self.enemy_list)
+
             # Update sprites
             self.player_list.update()
+            self.broad_phase.move(self.player_sprite)
             
-            # Check for collisions with walls
-            wall_collision_list = arcade.check_for_collision_with_list(self.player_sprite, self.wall_list)
+            # Check for collisions with walls (only walls near the player are tested)
+            wall_collision_list = self.broad_phase.collisions(self.player_sprite, "wall")
             
             if wall_collision_list:
                 # If collision with wall, restore original position
                 self.player_sprite.center_x = original_x
                 self.player_sprite.center_y = original_y
+                self.broad_phase.move(self.player_sprite)
             
             # Check for collisions between player and mushrooms (food)
-            hit_list = arcade.check_for_collision_with_list(self.player_sprite, self.mushroom_list)
+            hit_list = self.broad_phase.collisions(self.player_sprite, "pickup")
             
             # Process collisions with mushrooms (eating food)
             for mushroom in hit_list:
                 # Remove the mushroom (eat the food)
                 mushroom.remove_from_sprite_lists()
+                self.broad_phase.remove(mushroom)
                 # Increase score
                 self.score += 1
             
             # Check for collision with exit (only if all food is collected)
             if len(self.mushroom_list) == 0:
-                exit_collision_list = arcade.check_for_collision_with_list(self.player_sprite, self.exit_list)
+                self.pair_tests_brute_force += len(self.exit_list)
+                exit_collision_list = self.broad_phase.collisions(self.player_sprite, "exit")
                 if exit_collision_list:
                     # Player reached the exit with all food collected - Victory!
                     self.game_over = True
@@ -526,12 +612,10 @@ class GameView(arcade.View):
                     else:
                         self.enemy_sprite.center_x = tx
                         self.enemy_sprite.center_y = ty
+                self.broad_phase.move(self.enemy_sprite)
 
-                # Collision with player ends game
-                if arcade.check_for_collision(self.player_sprite, self.enemy_sprite):
-                    self.game_over = True
-                    self.caught_by_enemy = True
-                    self.won = False
+                # Collision with player ends game (calls on_enemy_contact)
+                self.collisions.update()
 
     def on_key_press(self, key, modifiers):
         """Called whenever a key is pressed."""
@@ -550,6 +634,7 @@ class GameView(arcade.View):
                 # Add a new mushroom
                 mushroom = MushroomSprite()
                 self.mushroom_list.append(mushroom)
+                self.broad_phase.add(mushroom, "pickup")
         
         # Reset game (works anytime)
         if key == arcade.key.R:
@@ -593,20 +678,25 @@ class GameView(arcade.View):
         self.enemy_list.clear()
         self.player_list.clear()
         self.create_maze()
+        self.setup_collisions()
+
+
+def start_game(results):
+    """Create the game once the loading screen has loaded the textures."""
+    TEXTURES.update(results["atlas"])
+    game_view = GameView()
+    game_view.setup()
+    return game_view
 
 
 def main():
     """Main function"""
-    # Load all textures once at startup
-    load_textures()
-    
     # Create a window
     window = arcade.Window(WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE)
 
-    # Create and setup the game view
-    game_view = GameView()
-    window.show_view(game_view)
-    game_view.setup()
+    # Show a loading screen while the textures load in the background,
+    # then switch to the game (see game_utils/preloader.py)
+    window.show_view(LoadingView(Preloader(TEXTURE_JOBS), start_game))
 
     # Start the arcade game loop
     arcade.run()
@@ -6,10 +6,14 @@ Slime Animation Demo (based on 06_geometry_awareness)
 - Demonstrates boundary/geometry awareness (keeps sprite inside window)
 """
 import arcade
-import glob
 import os
 from datetime import datetime
-from typing import List
+
+from game_utils.anim_bundle import DEFAULT_FOLDER, load_bundle
+from game_utils.animation import PHASE_CLOCK, FrameClock
+from game_utils.gif_clips import GIF_CLIPS
+from game_utils.preloader import LoadingView, Preloader
+from game_utils.state_machine import State, StateMachine, compile_machine
 
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
@@ -26,178 +30,131 @@ ANIM_WALK_FRAME_TIME = 0.12   # seconds per frame while walking
 SLIME_SCALE = 1.0             # Adjust if frames are too large/small
 MOVE_BREAK_GRACE = 0.20       # brief stop under this time still counts as moving
 TIRED_LOCK_DURATION = 10.0     # seconds to remain in very tired (no input) state
+SYNC_ANIMATIONS = False       # True: every slime on the same clip shows the same frame
+USE_GIF_CLIPS = False         # True: play assets/SLIME/<clip>/Gif/*.gif with the artist's frame times
 
-# Asset roots (individual frames)
+# Slime frames: one folder per animation clip (assets/SLIME/<clip>/Frame),
+# packed into a single bundle image the first time (see game_utils/anim_bundle.py)
 ASSETS_ROOT = os.path.join("assets", "SLIME")
-IDLE_DIR = os.path.join(ASSETS_ROOT, "IDLE", "Frame")
-IDLE_SLOW_DIR = os.path.join(ASSETS_ROOT, "IDLE_SLOW", "Frame")
-BONUS_DIR = os.path.join(ASSETS_ROOT, "BONUS", "Frame")
-WALK_R_DIR = os.path.join(ASSETS_ROOT, "WALK_R", "Frame")
-WALK_L_DIR = os.path.join(ASSETS_ROOT, "WALK_L", "Frame")
-
-
-def load_textures_from(dir_path: str) -> List[arcade.Texture]:
-    """Load all .png textures from a directory, sorted naturally by trailing number.
-
-    This ensures frames like 5,6,7,8,9,10,11 sort in numeric order.
+BUNDLE_FOLDER = DEFAULT_FOLDER   # where the bundle is kept (assets/.cache/bundles)
+CLIP_FRAME_TIMES = {
+    "IDLE": ANIM_IDLE_FRAME_TIME,
+    "IDLE_SLOW": ANIM_IDLE_SLOW_FRAME_TIME,
+    "BONUS": ANIM_TIRED_FRAME_TIME,
+    "WALK_R": ANIM_WALK_FRAME_TIME,
+    "WALK_L": ANIM_WALK_FRAME_TIME,
+}
+
+
+# The slime's states: which clip each one shows, which input moves it on
+# ("left", "right" or "still") and how long it stays before moving on by itself.
+# Walking and short stops are one "walking" group, so the time until the
+# slime gets tired keeps counting when it turns around or pauses briefly.
+TO_WALK = {"left": "WALK_L", "right": "WALK_R"}
+SLIME_STATES = {
+    "REST": State("IDLE_SLOW", on=TO_WALK),
+    "IDLE": State("IDLE", on=TO_WALK, after=[(ANIM_IDLE_REST_DELAY, "REST")]),
+    "WALK_L": State("WALK_L", on={"right": "WALK_R", "still": "STOP_L"}, group="walking"),
+    "WALK_R": State("WALK_R", on={"left": "WALK_L", "still": "STOP_R"}, group="walking"),
+    # Stopped for less than MOVE_BREAK_GRACE: still counts as walking
+    "STOP_L": State("WALK_L", on=TO_WALK, after=[(MOVE_BREAK_GRACE, "IDLE")], group="walking"),
+    "STOP_R": State("WALK_R", on=TO_WALK, after=[(MOVE_BREAK_GRACE, "IDLE")], group="walking"),
+    # Very tired: ignores input until the lock is over
+    "TIRED": State("BONUS", after=[(TIRED_LOCK_DURATION, "IDLE")]),
+}
+SLIME_MACHINE = compile_machine(
+    SLIME_STATES, initial="REST", group_timers={"walking": [(TIRED_WALK_DELAY, "TIRED")]}
+)
+TIRED = SLIME_MACHINE.index("TIRED")
+
+
+def preload_jobs() -> tuple[dict, list[str]]:
+    """Loading jobs for the loading screen, and which ones the game needs first.
+
+    With the bundle, that is one image. With GIF clips the game only needs
+    the clip list to start; every clip's frames are then decoded in the
+    background, so they are ready by the time the slime plays them.
     """
-    def key_numeric(path: str) -> tuple:
-        base = os.path.basename(path)
-        num = ''
-        # Extract trailing digits
-        for ch in reversed(base.split('.')[0]):
-            if ch.isdigit():
-                num = ch + num
-            else:
-                break
-        return (base.rstrip('0123456789'), int(num) if num else -1)
-
-    files = sorted(glob.glob(os.path.join(dir_path, "*.png")), key=key_numeric)
-    return [arcade.load_texture(f) for f in files]
+    if not USE_GIF_CLIPS:
+        bundle = lambda: load_bundle("slime", ASSETS_ROOT, CLIP_FRAME_TIMES, folder=BUNDLE_FOLDER)
+        return {"slime": bundle}, ["slime"]
+    jobs = {"slime": lambda: GIF_CLIPS.clips_in(ASSETS_ROOT)}
+    for name in CLIP_FRAME_TIMES:
+        jobs[name] = lambda name=name: list(GIF_CLIPS.clips_in(ASSETS_ROOT)[name])
+    return jobs, ["slime"]
 
 
 class AnimatedSlime(arcade.Sprite):
-    """A simple animated sprite using separate frame lists.
+    """A simple animated sprite driven by a table-driven state machine.
 
-    Animation states:
-    - idle_textures: loops when not moving
-    - walk_left_textures: loops when moving left
-    - walk_right_textures: loops when moving right
+    Animation states (see SLIME_STATES):
+    - REST / IDLE: slow or normal idle loop when not moving
+    - WALK_L / WALK_R: walking loops, kept for short stops (STOP_L / STOP_R)
+    - TIRED: very tired lock after walking for too long
 
-    update_animation() advances frames based on elapsed time and current state.
+    update_animation() only changes clip when the state machine changes state,
+    and advances frames with a FrameClock, which keeps the time left over after
+    each frame so the animation keeps its speed at low frame rates.
     """
     def __init__(self):
         super().__init__()
-        # Load textures
-        self.idle_textures = load_textures_from(IDLE_DIR)
-        self.idle_slow_textures = load_textures_from(IDLE_SLOW_DIR)
+        if USE_GIF_CLIPS:
+            # One GIF per clip, each frame decoded the first time it is shown
+            # and kept in the shared GIF_CLIPS cache
+            self.clips = GIF_CLIPS.clips_in(ASSETS_ROOT)
+            self.frame_times = {name: clip.durations for name, clip in self.clips.items()}
+        else:
+            # Every clip comes from one prebaked bundle image, decoded once and
+            # shared by all slimes
+            bundle = load_bundle("slime", ASSETS_ROOT, CLIP_FRAME_TIMES, folder=BUNDLE_FOLDER)
+            self.clips = {name: bundle.textures(name) for name in CLIP_FRAME_TIMES}
+            self.frame_times = CLIP_FRAME_TIMES
+        self.idle_textures = self.clips["IDLE"]
+        self.idle_slow_textures = self.clips["IDLE_SLOW"]
         # BONUS frames represent a very tired animation in our demo
-        self.tired_textures = load_textures_from(BONUS_DIR)
-        self.walk_right_textures = load_textures_from(WALK_R_DIR)
-        self.walk_left_textures = load_textures_from(WALK_L_DIR)
+        self.tired_textures = self.clips["BONUS"]
+        self.walk_right_textures = self.clips["WALK_R"]
+        self.walk_left_textures = self.clips["WALK_L"]
 
-        # Start in resting (slow idle) if available
-        if self.idle_slow_textures:
-            self.textures = self.idle_slow_textures
-        else:
-            self.textures = self.idle_textures
-        self.texture = self.textures[0] if self.textures else None
+        # Start in resting (slow idle) until you move
+        self.machine = StateMachine(SLIME_MACHINE)
+        self.facing = "right"  # or "left"
+        clip = self.machine.clip
+        self.clock = FrameClock(self.frame_times[clip], len(self.clips[clip]),
+                                phase=PHASE_CLOCK if SYNC_ANIMATIONS else None)
         self.scale = SLIME_SCALE
+        self.show_state()
 
-        # Animation timing
-        self.elapsed = 0.0
-        self.frame_index = 0
-        if self.textures is self.idle_slow_textures:
-            self.frame_duration = ANIM_IDLE_SLOW_FRAME_TIME
-        else:
-            self.frame_duration = ANIM_IDLE_FRAME_TIME
-        # Treat as already resting so the state machine keeps slow idle until you move
-        self.idle_time = ANIM_IDLE_REST_DELAY
-        self.moving_time = 0.0  # time spent moving (walking)
-        self.since_stop = MOVE_BREAK_GRACE  # time since last non-moving; start beyond grace
-
-        # Exhaustion lock (very tired)
-        self.is_tired_active = False
-        self.tired_time_left = 0.0
-
-        # State
-        self.is_moving = False
-        self.facing = "right"  # or "left"
+    @property
+    def state(self) -> str:
+        return self.machine.name
 
-    def set_state_from_velocity(self, delta_time: float):
-        """Pick texture set and frame timing from current velocity, idle, and walking time.
-
-    - After ANIM_IDLE_REST_DELAY of not moving, switch to idle_slow animations.
-    - After TIRED_WALK_DELAY of continuous walking, enter very tired lock (BONUS frames) for TIRED_LOCK_DURATION.
-    - During very tired lock, ignore input (no movement) and show tired animation.
-    - Short breaks under MOVE_BREAK_GRACE keep the slime in moving state.
-        """
-        # If currently exhausted, stay in tired lock
-        if self.is_tired_active:
-            self.is_moving = False
-            if self.tired_textures:
-                self.textures = self.tired_textures
-                self.frame_duration = ANIM_TIRED_FRAME_TIME
-            else:
-                self.textures = self.idle_textures
-                self.frame_duration = ANIM_IDLE_FRAME_TIME
-            self.tired_time_left -= delta_time
-            if self.tired_time_left <= 0:
-                # Exit tired lock into normal idle state
-                self.is_tired_active = False
-                self.tired_time_left = 0.0
-                self.idle_time = 0.0
-                self.moving_time = 0.0
-                self.since_stop = MOVE_BREAK_GRACE
-            # Ensure frame index is valid for current textures
-            if self.textures:
-                self.frame_index %= len(self.textures)
-                self.texture = self.textures[self.frame_index]
-            return
+    @property
+    def is_tired_active(self) -> bool:
+        return self.machine.state == TIRED
 
-        raw_moving = abs(self.change_x) > 0.01 or abs(self.change_y) > 0.01
-        # Update stop-grace timer
-        if raw_moving:
-            self.since_stop = 0.0
-        else:
-            self.since_stop += delta_time
-
-        effective_moving = raw_moving or (self.since_stop < MOVE_BREAK_GRACE)
-
-        if effective_moving:
-            # Pick by horizontal direction; if none, keep last facing
-            if self.change_x < -0.01:
-                self.facing = "left"
-            elif self.change_x > 0.01:
-                self.facing = "right"
-            self.is_moving = True
-            # After long walking, enter very tired lock; otherwise walk
-            if self.moving_time >= TIRED_WALK_DELAY and self.tired_textures:
-                self.is_tired_active = True
-                self.tired_time_left = TIRED_LOCK_DURATION
-                # Immediately switch to tired visuals
-                self.textures = self.tired_textures
-                self.frame_duration = ANIM_TIRED_FRAME_TIME
-            else:
-                self.textures = self.walk_left_textures if self.facing == "left" else self.walk_right_textures
-                self.frame_duration = ANIM_WALK_FRAME_TIME
-            self.idle_time = 0.0
-        else:
-            self.is_moving = False
-            # when idle: slow idle after rest, else normal idle
-            if self.idle_time >= ANIM_IDLE_REST_DELAY and self.idle_slow_textures:
-                self.textures = self.idle_slow_textures
-                self.frame_duration = ANIM_IDLE_SLOW_FRAME_TIME
-            else:
-                self.textures = self.idle_textures
-                self.frame_duration = ANIM_IDLE_FRAME_TIME
-
-        # Keep current frame index within new list
-        if self.textures:
-            self.frame_index %= len(self.textures)
-            self.texture = self.textures[self.frame_index]
+    def show_state(self):
+        """Switch to the clip of the current state, keeping the frame number."""
+        clip = self.machine.clip
+        self.textures = self.clips[clip]
+        self.clock.switch(self.frame_times[clip], len(self.textures))
+        self.texture = self.textures[self.clock.frame]
 
     def update_animation(self, delta_time: float = 1/60):
-        # Update the state from current velocity (with short-break grace)
-        self.set_state_from_velocity(delta_time)
-        if not self.textures:
-            return
-        # Track idle vs moving durations
-        if self.is_tired_active:
-            # While exhausted, don't accumulate idle or moving timers
-            self.idle_time = 0.0
-            self.moving_time = 0.0
-        elif not self.is_moving:
-            self.idle_time += delta_time
-            self.moving_time = 0.0
+        # Which way the player is pushing; up/down alone walks the way we face
+        if self.change_x < -0.01:
+            key = self.facing = "left"
+        elif self.change_x > 0.01:
+            key = self.facing = "right"
+        elif abs(self.change_y) > 0.01:
+            key = self.facing
         else:
-            self.idle_time = 0.0
-            self.moving_time += delta_time
-        self.elapsed += delta_time
-        if self.elapsed >= self.frame_duration:
-            self.elapsed = 0.0
-            self.frame_index = (self.frame_index + 1) % len(self.textures)
-            self.texture = self.textures[self.frame_index]
+            key = "still"
+        if self.machine.update(delta_time, key):
+            self.show_state()
+
+        if self.clock.advance(delta_time):
+            self.texture = self.textures[self.clock.frame]
 
 
 class GameView(arcade.View):
@@ -256,6 +213,7 @@ class GameView(arcade.View):
             self.player.change_y = 0
 
         # Update sprite (position + animation)
+        PHASE_CLOCK.tick(delta_time)
         self.player_list.update()
         self.player_list.update_animation(delta_time)
 
@@ -301,12 +259,19 @@ class GameView(arcade.View):
             self.down_pressed = False
 
 
-def main():
-    # Create a window and start the view
-    window = arcade.Window(WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE)
+def start_game(results):
+    """Create the game once the loading screen has loaded the slime's frames."""
     game_view = GameView()
-    window.show_view(game_view)
     game_view.setup()
+    return game_view
+
+
+def main():
+    # Create a window and show a loading screen until the slime's frames are
+    # loaded, then start the view (see game_utils/preloader.py)
+    window = arcade.Window(WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE)
+    jobs, required = preload_jobs()
+    window.show_view(LoadingView(Preloader(jobs, required), start_game))
     arcade.run()
 
 
@@ -14,9 +14,11 @@ Art credit: "cactusturtle" — CC BY 4.0 (see assets/Blue Idle - no slime/LICENS
 from __future__ import annotations
 
 import arcade
-from PIL import Image
 from typing import List
 
+from game_utils.animation import PHASE_CLOCK, FrameClock
+from game_utils.spritesheets import SPRITE_SHEETS
+
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 WINDOW_TITLE = "Gravity + Sprite Sheet Animation"
@@ -36,6 +38,7 @@ TEXTURE_HEIGHT = 32
 IDLE_FRAME_TIME = 0.12
 JUMP_FRAME_TIME = 0.09
 CHAR_SCALE = 2.0
+SYNC_ANIMATIONS = False  # True: every character on the same clip shows the same frame
 
 
 def load_strip_spritesheet(path: str, texture_width: int = None, texture_height: int = None) -> List[arcade.Texture]:
@@ -43,32 +46,12 @@ def load_strip_spritesheet(path: str, texture_width: int = None, texture_height:
 
     Rule: frame_size = image_height, columns = image_width // image_height
     If texture_width and texture_height are not provided, they are auto-calculated.
+
+    Sheets come from the shared SPRITE_SHEETS cache (game_utils/spritesheets.py):
+    each file is decoded once and sliced once per frame size, so creating
+    more characters reuses the same textures.
     """
-    # Get image dimensions to auto-calculate frame size
-    img = Image.open(path)
-    width, height = img.size
-    
-    # Auto-calculate frame dimensions if not provided (square frames assumption)
-    if texture_width is None:
-        texture_width = height  # frame_width = image_height for square frames
-    if texture_height is None:
-        texture_height = height  # frame_height = image_height for square frames
-    
-    columns = max(1, width // texture_width)
-    rows = max(1, height // texture_height)
-    
-    # Use arcade.load_spritesheet to get a SpriteSheet object, then slice textures
-    # https://api.arcade.academy/en/3.3.2/api/api_docs/api/texture.html#arcade.load_spritesheet
-    sprite_sheet = arcade.load_spritesheet(file_name=path)
-    
-    # Use get_texture_grid to slice the horizontal strip into individual textures
-    textures = sprite_sheet.get_texture_grid(
-        size=(texture_width, texture_height),
-        columns=columns,
-        count=columns * rows
-    )
-    
-    return textures
+    return SPRITE_SHEETS.strip(path, texture_width, texture_height)
 
 
 class AnimatedCharacter(arcade.Sprite):
@@ -83,10 +66,10 @@ class AnimatedCharacter(arcade.Sprite):
             self.texture = self.textures[0]
         self.scale = CHAR_SCALE
 
-        # Animation state
-        self.elapsed = 0.0
-        self.frame_index = 0
-        self.frame_duration = IDLE_FRAME_TIME
+        # Animation clock: keeps the time left over after each frame, so the
+        # animation keeps its speed when the game runs slowly
+        self.clock = FrameClock(IDLE_FRAME_TIME, max(1, len(self.textures)),
+                                phase=PHASE_CLOCK if SYNC_ANIMATIONS else None)
 
         # Physics state provided by GameView
         self.vertical_speed = 0.0
@@ -95,25 +78,26 @@ class AnimatedCharacter(arcade.Sprite):
     def set_anim_state(self):
         # Choose textures based on grounded state / motion
         if self.on_ground and abs(self.vertical_speed) < 1.0:
-            self.textures = self.idle_textures or []
-            self.frame_duration = IDLE_FRAME_TIME
+            textures = self.idle_textures or []
+            frame_time = IDLE_FRAME_TIME
         else:
             # In air: play jump textures
-            self.textures = self.jump_textures or self.idle_textures
-            self.frame_duration = JUMP_FRAME_TIME
-        if self.textures:
-            self.frame_index %= len(self.textures)
-            self.texture = self.textures[self.frame_index]
+            textures = self.jump_textures or self.idle_textures
+            frame_time = JUMP_FRAME_TIME
+        # Nothing to do if the clock already plays these frames at this speed.
+        # Without a jump sheet the idle frames stay, but at jump speed.
+        if not textures or (textures is self.textures and self.clock.base_time == frame_time):
+            return
+        self.textures = textures
+        self.clock.switch(frame_time, len(textures))
+        self.texture = textures[self.clock.frame]
 
     def update_animation(self, delta_time: float = 1/60):
         self.set_anim_state()
         if not self.textures:
             return
-        self.elapsed += delta_time
-        if self.elapsed >= self.frame_duration:
-            self.elapsed = 0.0
-            self.frame_index = (self.frame_index + 1) % len(self.textures)
-            self.texture = self.textures[self.frame_index]
+        if self.clock.advance(delta_time):
+            self.texture = self.textures[self.clock.frame]
 
 
 class GameView(arcade.View):
@@ -170,6 +154,7 @@ class GameView(arcade.View):
                 self.player.vertical_speed = 0
 
         # Animate
+        PHASE_CLOCK.tick(delta_time)
         self.player_list.update_animation(delta_time)
 
     def on_key_press(self, key, modifiers):
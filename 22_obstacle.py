@@ -9,6 +9,9 @@ python -m arcade.examples.starting_template
 """
 import arcade
 
+from game_utils.atlas import load_atlas
+from game_utils.preloader import LoadingView, Preloader
+
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 WINDOW_TITLE = "Obstacle Avoidance Game"
@@ -20,6 +23,19 @@ BONUS_ACCELERATIONS = 2
 
 OBSTACLE_TIME_DELTA = 2.0  # Time in seconds between obstacles
 
+def load_game_atlas():
+    """The ball and the 13 obstacle pictures, shrunk to the size they are
+    drawn at, in one atlas image built on the first run (see game_utils/atlas.py)."""
+    return load_atlas("22_obstacle", {
+        "ball": ("assets/ball.png", 0.05),
+        **{f"{i:02d}": (f"assets/{i:02d}.png", 0.04) for i in range(1, 14)},
+    })
+
+
+# The atlas is the one loading job (see game_utils/preloader.py)
+TEXTURE_JOBS = {"atlas": load_game_atlas}
+
+
 class GameView(arcade.View):
     """
     Main application class.
@@ -29,19 +45,23 @@ class GameView(arcade.View):
     with your own code. Don't leave 'pass' in this program.
     """
 
-    def __init__(self):
+    def __init__(self, atlas=None):
         super().__init__()
 
         self.background_color = arcade.color.AMAZON
 
-        self.player_sprite = arcade.Sprite("./assets/ball.png", scale=0.05)
+        # The textures already have their on-screen size, so the sprites are
+        # drawn at scale 1. The loading screen passes the atlas in.
+        if atlas is None:
+            atlas = load_game_atlas()
+
+        self.player_sprite = arcade.Sprite(atlas["ball"])
         self.player_sprite.center_x = 150 
         self.player_sprite.center_y = WINDOW_HEIGHT // 2
 
         self.obstacles = arcade.SpriteList()
         for i in range(13):
-            s = f"./assets/{i + 1:02d}.png"
-            obstacle = arcade.Sprite(s, scale=0.04)
+            obstacle = arcade.Sprite(atlas[f"{i + 1:02d}"])
             obstacle.center_x = 100 + i * 90
             obstacle.center_y = SCREEN_BOTTOM + obstacle.height // 2 - 20
             self.obstacles.append(obstacle)
@@ -137,16 +157,19 @@ class GameView(arcade.View):
         pass
 
 
+def start_game(results):
+    """Create the game with the atlas the loading screen has loaded."""
+    return GameView(atlas=results["atlas"])
+
+
 def main():
     """ Main function """
     # Create a window class. This is what actually shows up on screen
     window = arcade.Window(WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE)
 
-    # Create and setup the GameView
-    game = GameView()
-
-    # Show GameView on screen
-    window.show_view(game)
+    # Show a loading screen while the atlas loads in the background, then
+    # create the GameView with it (see game_utils/preloader.py)
+    window.show_view(LoadingView(Preloader(TEXTURE_JOBS), start_game))
 
     # Start the arcade game loop
     arcade.run()
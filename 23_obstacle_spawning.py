@@ -7,8 +7,16 @@ template.
 If Python and Arcade are installed, this example can be run from the command line with:
 python -m arcade.examples.starting_template
 """
+import time
+
 import arcade
-import random
+
+from game_utils.atlas import load_atlas
+from game_utils.colliders import CIRCLE, collides
+from game_utils.conveyor import Conveyor
+from game_utils.preloader import LoadingView, Preloader
+from game_utils.pool import SpritePool
+from game_utils.timeline import SpawnTimeline, exponential, ramp
 
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
@@ -18,9 +26,34 @@ SCREEN_BOTTOM = 50
 GRAVITY = 200
 JUMP_SPEED = 200
 BONUS_ACCELERATIONS = 2
+PLAYER_X = 150  # The player stays in this screen column
 
-OBSTACLE_TIME_DELTA = 2.0  # Time in seconds between obstacles
+OBSTACLE_TIME_DELTA = 2.0  # Time in seconds between obstacles at the start
+OBSTACLE_TIME_DELTA_MIN = 1.0  # ...shrinking to this
+DIFFICULTY_RAMP_TIME = 120  # ...over this many seconds
+SPAWN_SEED = None  # Set a number to get the same obstacles every game
+FAST_FORWARD_SECONDS = 10  # Press F to skip ahead this far
 OBSTACLE_SPEED = 100  # Speed at which obstacles move leftward
+OBSTACLE_SCALING = 0.04
+OBSTACLE_POOL_SIZE = 16  # Obstacle sprites made up front (the pool grows if needed)
+
+# Stress mode (press S): ramp up until thousands of obstacles are on screen
+STRESS_TIME_DELTA_MIN = 0.0005  # Gap between obstacles at the end of the ramp
+STRESS_SPEED_MAX = 400  # Obstacle speed at the end of the ramp
+STRESS_RAMP_TIME = 60  # Seconds to reach the end of the ramp
+
+def load_game_atlas():
+    """The ball and the 13 obstacle pictures, shrunk to the size they are
+    drawn at, in one atlas image built on the first run (see game_utils/atlas.py)."""
+    return load_atlas("23_obstacle_spawning", {
+        "ball": ("assets/ball.png", 0.05),
+        **{f"{i:02d}": (f"assets/{i:02d}.png", OBSTACLE_SCALING) for i in range(1, 14)},
+    })
+
+
+# The atlas is the one loading job (see game_utils/preloader.py)
+TEXTURE_JOBS = {"atlas": load_game_atlas}
+
 
 class GameView(arcade.View):
     """
@@ -31,64 +64,177 @@ class GameView(arcade.View):
     with your own code. Don't leave 'pass' in this program.
     """
 
-    def __init__(self):
+    def __init__(self, stress=False, atlas=None):
         super().__init__()
+        self.stress = stress  # Stress mode: spawn faster and faster, can't lose
 
         self.background_color = arcade.color.BABY_BLUE_EYES
 
-        self.player_sprite = arcade.Sprite("./assets/ball.png", scale=0.05)
-        self.player_sprite.center_x = 150 
+        # The textures already have their on-screen size, so the sprites are
+        # drawn at scale 1. The loading screen passes the atlas in.
+        if atlas is None:
+            atlas = load_game_atlas()
+
+        self.player_sprite = arcade.Sprite(atlas["ball"])
+        self.player_sprite.center_x = PLAYER_X
         self.player_sprite.center_y = WINDOW_HEIGHT // 2
+        self.player_sprite.collider = CIRCLE  # The ball is round: cheap circle test
         self.player_sprites = arcade.SpriteList()
         self.player_sprites.append(self.player_sprite)
 
-        self.obstacle_textures = []
-        for i in range(1, 14):
-            self.obstacle_textures.append(arcade.load_texture(f"./assets/{i:02d}.png"))
-        self.obstacle_timer = 0.0  # Timer to track obstacle spawning
-        self.obstacle_sprites = arcade.SpriteList()
+        self.obstacle_textures = [atlas[f"{i:02d}"] for i in range(1, 14)]
+        self.spawn_timeline = self.make_spawn_timeline()
+        # Obstacles are recycled: hidden when they leave, shown again when spawned
+        self.obstacle_pool = SpritePool(OBSTACLE_POOL_SIZE)
+        self.obstacle_sprites = self.obstacle_pool.sprite_list
+        # Obstacles stay put in the world; the camera scrolls past them
+        self.conveyor = Conveyor()
+        self.obstacle_camera = arcade.Camera2D()
 
         self.key_pressed = None  # Track the currently pressed key
         self.bonus_acceleration = 0
 
         self.speed = 0  # Vertical velocity
+        self.obstacle_speed = OBSTACLE_SPEED  # Scroll speed (ramps up in stress mode)
+        self.game_over = False
+        self.obstacles_tested = 0  # Obstacles checked against the player last frame
+
+        # How long the last on_update / on_draw took, in seconds
+        self.update_time = 0.0
+        self.draw_time = 0.0
+        # Text objects are much cheaper than draw_text for text that changes every frame
+        self.stress_hud = [
+            arcade.Text("", 10, WINDOW_HEIGHT - 30 * (i + 1), arcade.color.BLACK, 16)
+            for i in range(3)
+        ]
+
+    def make_spawn_timeline(self):
+        """When each obstacle spawns is worked out ahead of time from a seed.
+
+        With SPAWN_SEED = None every game gets a new random seed; with a
+        number every game replays the same obstacles.
+        """
+        if self.stress:
+            # The gap shrinks by the same factor every second, so the number of
+            # obstacles grows steadily from a few to thousands
+            return SpawnTimeline(
+                len(self.obstacle_textures),
+                curve=exponential(OBSTACLE_TIME_DELTA, STRESS_TIME_DELTA_MIN, STRESS_RAMP_TIME),
+                seed=SPAWN_SEED,
+                lookahead=1.0,
+            )
+        return SpawnTimeline(
+            len(self.obstacle_textures),
+            curve=ramp(OBSTACLE_TIME_DELTA, OBSTACLE_TIME_DELTA_MIN, DIFFICULTY_RAMP_TIME),
+            seed=SPAWN_SEED,
+        )
 
     def reset(self):
         """Reset the game to the initial state."""
-        # Do changes needed to restart the game here if you want to support that
-        pass
+        self.obstacle_pool.release_all()
+        self.conveyor.clear()
+        self.spawn_timeline = self.make_spawn_timeline()
+        self.obstacle_camera.position = (WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2)
+        self.obstacle_speed = OBSTACLE_SPEED
+
+        self.player_sprite.center_x = PLAYER_X
+        self.player_sprite.center_y = WINDOW_HEIGHT // 2
+        self.speed = 0
+        self.bonus_acceleration = 0
+        self.key_pressed = None
+        self.game_over = False
 
     def on_draw(self):
         """
         Render the screen.
         """
+        start = time.perf_counter()
 
         # This command should happen before we start drawing. It will clear
         # the screen to the background color, and erase what we drew last frame.
         self.clear()
         arcade.draw_lbwh_rectangle_filled(0, 0, WINDOW_WIDTH, SCREEN_BOTTOM, arcade.color.DARK_BROWN)
-        self.obstacle_sprites.draw()
-        self.player_sprites.draw()
-
-    def spawn_obstacle(self, delta_time):
-        if self.obstacle_timer >= OBSTACLE_TIME_DELTA:
-            self.obstacle_timer = 0.0  # Reset timer
-
-            # Spawn a new obstacle
-            obstacle_index = random.randint(0, len(self.obstacle_textures) - 1)
-            obstacle = arcade.Sprite(self.obstacle_textures[obstacle_index], scale=0.04)
-            obstacle.center_x = WINDOW_WIDTH + obstacle.width // 2
-            obstacle.center_y = SCREEN_BOTTOM + obstacle.height // 2 - 20
-            self.obstacle_sprites.append(obstacle)
-        else:
-            self.obstacle_timer += delta_time
+        # Obstacles and player are in world coordinates: draw them through the scrolling camera
+        with self.obstacle_camera.activate():
+            self.obstacle_sprites.draw()
+            self.player_sprites.draw()
+        self.draw_time = time.perf_counter() - start
+
+        if self.stress:
+            self.draw_stress_hud()
+
+        if self.game_over:
+            arcade.draw_text("GAME OVER!", WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 25,
+                             arcade.color.RED, 48, anchor_x="center")
+            arcade.draw_text("Press R to restart", WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 25,
+                             arcade.color.WHITE, 24, anchor_x="center")
+
+    def draw_stress_hud(self):
+        """Live obstacle count and how long updating and drawing take."""
+        gap = self.spawn_timeline.curve(self.spawn_timeline.time)
+        lines = [
+            f"Live obstacles: {len(self.conveyor)}   (pool: {self.obstacle_pool.capacity})",
+            f"Update: {self.update_time * 1000:.2f} ms   Draw: {self.draw_time * 1000:.2f} ms",
+            f"Spawn gap: {gap * 1000:.1f} ms   Speed: {self.obstacle_speed:.0f} px/s   (S: stress off)",
+        ]
+        for text, line in zip(self.stress_hud, lines):
+            text.text = line
+            text.draw()
+
+    def spawn_obstacle(self, event):
+        """Spawn the obstacle for one timeline event."""
+        texture = self.obstacle_textures[event.variant]
+        # After a long frame the event may be a bit late: put the obstacle
+        # where it would be by now if it had spawned right on time
+        late = self.spawn_timeline.time - event.time
+        left = self.conveyor.to_world(WINDOW_WIDTH) - late * self.obstacle_speed
+        if left + texture.width < self.conveyor.scroll_x:
+            return  # Already scrolled past (e.g. when fast-forwarding)
+
+        # Spawn an obstacle (a recycled sprite with a new texture). The texture
+        # is already at on-screen size, so it is drawn at scale 1
+        obstacle = self.obstacle_pool.acquire(texture, 1.0)
+        obstacle.center_x = left + obstacle.width // 2
+        obstacle.center_y = SCREEN_BOTTOM + obstacle.height // 2 - 20
+        self.conveyor.push(obstacle)
 
     def move_obstacles(self, delta_time):
-        for obstacle in self.obstacle_sprites:
-            if obstacle.center_x < -obstacle.width // 2:
-                self.obstacle_sprites.remove(obstacle)
-            else:
-                obstacle.center_x -= OBSTACLE_SPEED * delta_time
+        # Scroll the world instead of moving every obstacle: one number changes
+        self.conveyor.scroll(self.obstacle_speed * delta_time)
+        self.obstacle_camera.position = (
+            self.conveyor.to_world(WINDOW_WIDTH / 2),
+            WINDOW_HEIGHT / 2,
+        )
+
+        # Only the leftmost obstacles can have left the screen
+        for obstacle in self.conveyor.expire():
+            self.obstacle_pool.release(obstacle)
+
+    def update_obstacles(self, delta_time):
+        """Scroll the world and spawn every obstacle that is due."""
+        if self.stress:
+            progress = min(self.spawn_timeline.time / STRESS_RAMP_TIME, 1.0)
+            self.obstacle_speed = OBSTACLE_SPEED + (STRESS_SPEED_MAX - OBSTACLE_SPEED) * progress
+        self.move_obstacles(delta_time)
+        for event in self.spawn_timeline.advance(delta_time):
+            self.spawn_obstacle(event)
+
+    def fast_forward(self, seconds):
+        """Skip ahead without drawing: one big step gives the same obstacles."""
+        self.update_obstacles(seconds)
+        self.player_sprite.center_x = self.conveyor.to_world(PLAYER_X)
+
+    def check_obstacle_collisions(self):
+        """Game over if the player touches an obstacle."""
+        # The conveyor is sorted by x, so it can hand us just the obstacles
+        # in the player's column (usually none, sometimes one or two)
+        player = self.player_sprite
+        nearby = self.conveyor.overlapping(player.left, player.right)
+        self.obstacles_tested = len(nearby)
+        for obstacle in nearby:
+            # In stress mode the player can't lose, so the test keeps going
+            if collides(player, obstacle) and not self.stress:
+                self.game_over = True
 
     def on_update(self, delta_time):
         """
@@ -96,6 +242,10 @@ class GameView(arcade.View):
         Normally, you'll call update() on the sprite lists that
         need it.
         """
+        if self.game_over:
+            return
+        start = time.perf_counter()
+
         if self.key_pressed == arcade.key.W or self.key_pressed == arcade.key.UP:
             if self.player_sprite.center_y <= SCREEN_BOTTOM + self.player_sprite.height // 2 + 5:
                 self.bonus_acceleration = 0  # Reset bonus acceleration when on the ground
@@ -117,9 +267,11 @@ class GameView(arcade.View):
         if self.player_sprite.center_y > WINDOW_HEIGHT - self.player_sprite.height // 2:
             self.player_sprite.center_y = WINDOW_HEIGHT - self.player_sprite.height // 2
 
-       # Handle obstacles
-        self.spawn_obstacle(delta_time)
-        self.move_obstacles(delta_time)
+        # Handle obstacles; the player keeps its screen column as the world scrolls
+        self.update_obstacles(delta_time)
+        self.player_sprite.center_x = self.conveyor.to_world(PLAYER_X)
+        self.check_obstacle_collisions()
+        self.update_time = time.perf_counter() - start
 
     def on_key_press(self, key, key_modifiers):
         """
@@ -130,6 +282,14 @@ class GameView(arcade.View):
         """
         self.key_pressed = key
 
+        if key == arcade.key.F and not self.game_over:
+            self.fast_forward(FAST_FORWARD_SECONDS)
+        if key == arcade.key.R:
+            self.reset()
+        if key == arcade.key.S:
+            self.stress = not self.stress
+            self.reset()
+
     def on_key_release(self, key, key_modifiers):
         """
         Called whenever the user lets off a previously pressed key.
@@ -155,16 +315,19 @@ class GameView(arcade.View):
         pass
 
 
+def start_game(results):
+    """Create the game with the atlas the loading screen has loaded."""
+    return GameView(atlas=results["atlas"])
+
+
 def main():
     """ Main function """
     # Create a window class. This is what actually shows up on screen
     window = arcade.Window(WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE)
 
-    # Create and setup the GameView
-    game = GameView()
-
-    # Show GameView on screen
-    window.show_view(game)
+    # Show a loading screen while the atlas loads in the background, then
+    # create the GameView with it (see game_utils/preloader.py)
+    window.show_view(LoadingView(Preloader(TEXTURE_JOBS), start_game))
 
     # Start the arcade game loop
     arcade.run()
@@ -0,0 +1,55 @@
+"""
+How much the asset pipeline saves: time to get each picture at its drawn
+size by decoding the original versus the smallest covering cached variant.
+
+Builds the cache first if needed (``python -m game_utils.asset_pipeline``).
+
+Run from the repo root:
+    python -m benchmarks.asset_pipeline
+"""
+from __future__ import annotations
+
+import time
+
+from PIL import Image
+
+from game_utils.asset_pipeline import build, find_variant, read_manifest, scaled_size
+
+
+def shrink(path, target) -> Image.Image:
+    with Image.open(path) as image:
+        image = image.convert("RGBA")
+    return image.resize(target, Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    build()
+    print(f"{'asset':<16} {'scale':>6} {'original ms':>12} {'variant':>10} {'variant ms':>11} {'speedup':>8}")
+    total_original = total_variant = 0.0
+    for path, scales in read_manifest().items():
+        if not path.exists():
+            continue
+        with Image.open(path) as image:
+            size = image.size
+        for scale in scales:
+            target = scaled_size(size, scale)
+            variant = find_variant(path, scale)
+            t_original = timed(lambda: shrink(path, target))
+            t_variant = timed(lambda: shrink(variant.path, target))
+            total_original += t_original
+            total_variant += t_variant
+            print(f"{path.name:<16} {scale:>6g} {t_original * 1e3:>12.1f} "
+                  f"{f'{variant.width}x{variant.height}':>10} {t_variant * 1e3:>11.2f} "
+                  f"{t_original / t_variant:>7.0f}x")
+    print(f"{'total':<23} {total_original * 1e3:>12.1f} {'':>10} {total_variant * 1e3:>11.2f} "
+          f"{total_original / total_variant:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
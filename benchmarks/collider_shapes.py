@@ -0,0 +1,68 @@
+"""
+Player-vs-pickups narrow phase in 12_sprites_countdown.py: Arcade's polygon
+check versus the circle-vs-box fast path from ``game_utils.colliders``.
+
+Every mushroom is tested against the player (no broad phase) so the numbers
+show the raw cost per pair. Mushrooms are placed close to the player so most
+pairs get past Arcade's quick distance reject and reach the polygon test.
+
+Run from the repo root:
+    python -m benchmarks.collider_shapes
+"""
+from __future__ import annotations
+
+import importlib.util
+import random
+import time
+from pathlib import Path
+
+import arcade
+
+from game_utils.colliders import collides
+
+ROOT = Path(__file__).resolve().parents[1]
+COUNTS = [10, 100, 1_000, 10_000]
+ROUNDS = 20
+
+
+def load_game():
+    path = ROOT / "12_sprites_countdown.py"
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.load_textures()
+    return module
+
+
+def per_pair(test, player, mushrooms):
+    start = time.perf_counter()
+    hits = 0
+    for _ in range(ROUNDS):
+        for mushroom in mushrooms:
+            if test(player, mushroom):
+                hits += 1
+    return (time.perf_counter() - start) / (ROUNDS * len(mushrooms)), hits // ROUNDS
+
+
+def main():
+    game = load_game()
+    rng = random.Random(12)
+    player = game.CharacterSprite()
+    player.position = (640, 360)
+
+    print(f"{'mushrooms':>10} {'polygon ns':>11} {'shapes ns':>10} {'speedup':>8} {'hits':>11}")
+    for count in COUNTS:
+        mushrooms = []
+        for _ in range(count):
+            mushroom = game.MushroomSprite()
+            mushroom.position = (640 + rng.uniform(-45, 45), 360 + rng.uniform(-45, 45))
+            mushrooms.append(mushroom)
+        polygon, polygon_hits = per_pair(arcade.check_for_collision, player, mushrooms)
+        shapes, shape_hits = per_pair(collides, player, mushrooms)
+        print(f"{count:>10} {polygon * 1e9:>11.0f} {shapes * 1e9:>10.0f} {polygon / shapes:>7.1f}x "
+              f"{polygon_hits:>5}/{shape_hits:<5}")
+    print("(hits: polygon/shape results; the AABB around a mushroom is a bit more generous)")
+
+
+if __name__ == "__main__":
+    main()
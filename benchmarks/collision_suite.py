@@ -0,0 +1,324 @@
+"""
+Collision benchmark suite: brute force versus indexed lookups.
+
+Two kinds of seeded scenes, from 10 to 100,000 objects at the same density
+as the games (about one object per 100x100 px):
+
+squares (08_collision.py)
+    ``Food`` squares and one ``Character``.
+    - ``08 detect_collisions``: the loop in ``Character.detect_collisions``
+    - ``quadtree``: ``LooseQuadtree`` query, then the same edge test
+    - ``broad phase``: the layered grid from ``game_utils.collision``
+
+sprites (11_sprite_collision.py / 12_sprites_countdown.py)
+    ``MushroomSprite``\\ s and one ``CharacterSprite``.
+    - ``arcade list``: ``arcade.check_for_collision_with_list`` on a plain
+      SpriteList (CPU method, what 11/12 did before the quadtree)
+    - ``arcade spatial hash``: the same call on ``SpriteList(use_spatial_hash=True)``
+    - ``quadtree + collides``: what 11/12 do now
+    - ``broad phase + collides``: the grid 14_enemy.py uses
+
+For every row we report:
+
+- ``build_ms``: time to build the structure (0 for brute force)
+- ``ns_per_query``: one player lookup, averaged over many player positions
+- ``memory_kb``: memory allocated by the structure itself (tracemalloc)
+- ``hits``: total hits over the lookups every strategy of a scene shares.
+  Strategies with the same narrow phase must agree, otherwise one of them is
+  wrong. (``collides`` treats mushrooms as boxes, which is a little more
+  generous than Arcade's polygons, so those rows find a few more.)
+
+Results are printed and written as JSON (with the git commit and versions),
+and ``--baseline old.json`` flags rows that got slower than ``--tolerance``.
+
+Run from the repo root:
+    python -m benchmarks.collision_suite
+    python -m benchmarks.collision_suite --max-count 10000 --output /tmp/now.json
+    python -m benchmarks.collision_suite --baseline benchmarks/results/collision_suite.json
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import gc
+import importlib.util
+import json
+import math
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import arcade
+
+from game_utils.collision import BroadPhase, CollisionLayers, boxes_overlap, square_bounds
+from game_utils.colliders import collides
+from game_utils.quadtree import LooseQuadtree
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_OUTPUT = ROOT / "benchmarks" / "results" / "collision_suite.json"
+COUNTS = [10, 100, 1_000, 10_000, 100_000]
+TILE = 100             # one object per TILE x TILE pixels
+QUERY_BUDGET = 2_000_000  # object visits per brute-force strategy, caps the run time
+
+
+def load_script(name: str):
+    path = ROOT / name
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(build, query, queries, checked):
+    """Time ``build()`` once and ``query(structure, position)`` for every position.
+
+    Hits are only counted for the first ``checked`` positions, which every
+    strategy of a scene shares.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    structure = build()
+    build_time = time.perf_counter() - start
+
+    hits = [0] * len(queries)
+    start = time.perf_counter()
+    for i, position in enumerate(queries):
+        hits[i] = len(query(structure, position))
+    query_time = time.perf_counter() - start
+
+    # Second build under tracemalloc, so tracing doesn't skew the timings
+    del structure
+    gc.collect()
+    tracemalloc.start()
+    structure = build()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return build_time, query_time / len(queries), memory, sum(hits[:checked])
+
+
+# --- squares: 08_collision.py ---
+
+def square_strategies(game, side):
+    def brute(food):
+        return food
+
+    def brute_query(food, position):
+        character = game.Character(*position)
+        return character.detect_collisions(food)
+
+    def quadtree(food):
+        tree = LooseQuadtree(0, 0, side, side, max_depth=12, bounds=square_bounds)
+        tree.extend(food)
+        return tree
+
+    def quadtree_query(tree, position):
+        box = square_bounds(game.Character(*position))
+        return [f for f in tree.query(*box) if boxes_overlap(box, square_bounds(f))]
+
+    layers = CollisionLayers("player", "food")
+    layers.interact("player", "food")
+
+    def grid(food):
+        broad = BroadPhase(layers, cell_size=TILE, bounds=square_bounds)
+        broad.extend(food, "food")
+        return broad
+
+    def grid_query(broad, position):
+        character = game.Character(*position)
+        broad.add(character, "player")
+        box = square_bounds(character)
+        found = [f for f in broad.nearby(character) if boxes_overlap(box, square_bounds(f))]
+        broad.remove(character)
+        return found
+
+    return [
+        ("08 detect_collisions", brute, brute_query, True),
+        ("quadtree", quadtree, quadtree_query, False),
+        ("broad phase", grid, grid_query, False),
+    ]
+
+
+def square_scene(game, count, rng):
+    side = math.sqrt(count) * TILE
+    food = [
+        game.Food(rng.uniform(0, side), rng.uniform(0, side), game.FOOD_SIZE, arcade.color.WHITE)
+        for _ in range(count)
+    ]
+    return side, food
+
+
+# --- sprites: 11/12 ---
+
+def sprite_strategies(game, side):
+    def plain_list(mushrooms):
+        sprite_list = arcade.SpriteList()
+        sprite_list.extend(mushrooms)
+        return sprite_list
+
+    def hashed_list(mushrooms):
+        sprite_list = arcade.SpriteList(use_spatial_hash=True)
+        sprite_list.extend(mushrooms)
+        return sprite_list
+
+    player = game.CharacterSprite()
+
+    def arcade_query(sprite_list, position):
+        player.position = position
+        # method=3: plain CPU check, as 11/12 used for their few mushrooms
+        return arcade.check_for_collision_with_list(player, sprite_list, method=3)
+
+    def arcade_hash_query(sprite_list, position):
+        player.position = position
+        return arcade.check_for_collision_with_list(player, sprite_list)
+
+    def quadtree(mushrooms):
+        tree = LooseQuadtree(0, 0, side, side, max_depth=12)
+        tree.extend(mushrooms)
+        return tree
+
+    def quadtree_query(tree, position):
+        player.position = position
+        return [m for m in tree.query_around(player) if collides(player, m)]
+
+    layers = CollisionLayers("player", "pickup")
+    layers.interact("player", "pickup")
+
+    def grid(mushrooms):
+        broad = BroadPhase(layers, cell_size=TILE, narrow_phase=collides)
+        broad.extend(mushrooms, "pickup")
+        broad.add(player, "player")
+        return broad
+
+    def grid_query(broad, position):
+        player.position = position
+        broad.move(player)
+        return broad.collisions(player)
+
+    return [
+        ("arcade list", plain_list, arcade_query, True),
+        ("arcade spatial hash", hashed_list, arcade_hash_query, False),
+        ("quadtree + collides", quadtree, quadtree_query, False),
+        ("broad phase + collides", grid, grid_query, False),
+    ]
+
+
+def sprite_scene(game, count, rng):
+    side = math.sqrt(count) * TILE
+    mushrooms = [game.MushroomSprite(rng.uniform(0, side), rng.uniform(0, side)) for _ in range(count)]
+    return side, mushrooms
+
+
+SCENES = {
+    "squares": ("08_collision.py", square_scene, square_strategies),
+    "sprites": ("12_sprites_countdown.py", sprite_scene, sprite_strategies),
+}
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(counts, seed, max_queries):
+    results = []
+    for scene_name, (script, make_scene, strategies) in SCENES.items():
+        game = load_script(script)
+        if hasattr(game, "load_textures"):
+            game.load_textures()
+        for count in counts:
+            rng = random.Random(f"{seed}-{scene_name}-{count}")
+            side, objects = make_scene(game, count, rng)
+            # Same player positions for every strategy of this scene
+            queries = [(rng.uniform(0, side), rng.uniform(0, side)) for _ in range(max_queries)]
+            # Brute force gets fewer lookups on big scenes so it finishes in time
+            brute_queries = min(max_queries, max(5, QUERY_BUDGET // count))
+            for name, build, query, brute_force in strategies(game, side):
+                n = brute_queries if brute_force else max_queries
+                build_time, per_query, memory, hits = measure(
+                    lambda: build(objects), query, queries[:n], brute_queries)
+                row = {
+                    "scene": scene_name,
+                    "strategy": name,
+                    "count": count,
+                    "queries": n,
+                    "build_ms": round(build_time * 1e3, 3),
+                    "ns_per_query": round(per_query * 1e9),
+                    "memory_kb": round(memory / 1024, 1),
+                    "hits": hits,
+                }
+                results.append(row)
+                print(f"{scene_name:>8} {name:>24} {count:>7} {row['build_ms']:>10.2f} "
+                      f"{row['ns_per_query']:>13,} {row['memory_kb']:>10.1f} {hits:>7}",
+                      flush=True)
+    return results
+
+
+def compare(results, baseline_path, tolerance) -> int:
+    """Print rows slower than the baseline by more than ``tolerance``; return how many."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {
+            (r["scene"], r["strategy"], r["count"]): r for r in json.load(f)["results"]
+        }
+    slower = 0
+    print(f"\nCompared with {baseline_path}:")
+    for row in results:
+        old = baseline.get((row["scene"], row["strategy"], row["count"]))
+        if old is None or not old["ns_per_query"]:
+            continue
+        ratio = row["ns_per_query"] / old["ns_per_query"]
+        if ratio > 1 + tolerance:
+            slower += 1
+            print(f"  SLOWER {row['scene']} / {row['strategy']} / {row['count']}: "
+                  f"{old['ns_per_query']:,} -> {row['ns_per_query']:,} ns ({ratio:.2f}x)")
+    if not slower:
+        print(f"  nothing got more than {tolerance:.0%} slower")
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--queries", type=int, default=500, help="player lookups per row")
+    parser.add_argument("--max-count", type=int, default=COUNTS[-1])
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="JSON file to write")
+    parser.add_argument("--baseline", type=Path, help="earlier JSON output to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown against the baseline (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    counts = [c for c in COUNTS if c <= args.max_count]
+    print(f"{'scene':>8} {'strategy':>24} {'count':>7} {'build ms':>10} "
+          f"{'ns/query':>13} {'memory kB':>10} {'hits':>7}")
+    results = run(counts, args.seed, args.queries)
+
+    report = {
+        "benchmark": "collision_suite",
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "arcade": arcade.version.VERSION,
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {args.output}")
+
+    if args.baseline:
+        if compare(results, args.baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Texture load + collision cost with Arcade's own hit boxes versus the cached,
+simplified ones from ``game_utils.hitbox_cache``.
+
+Run from the repo root:
+    python -m benchmarks.hitbox_cache
+"""
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import arcade
+
+from game_utils import hitbox_cache
+
+# (asset, scale) pairs used by 11-14
+ASSETS = [("assets/ball.png", 0.05), ("assets/05.png", 0.015), ("assets/06.png", 0.01)]
+CHECKS = 20_000
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def collision_cost(texture, scale):
+    """Seconds per arcade.check_for_collision for two overlapping sprites."""
+    a = arcade.Sprite(texture, scale=scale)
+    b = arcade.Sprite(texture, scale=scale, center_x=a.width * 0.5, center_y=a.height * 0.3)
+    _, seconds = timed(lambda: [arcade.check_for_collision(a, b) for _ in range(CHECKS)])
+    return seconds / CHECKS
+
+
+def main():
+    print(f"{'asset':<18} {'arcade ms':>10} {'cold ms':>9} {'warm ms':>9} "
+          f"{'points':>7} {'arcade us/check':>16} {'cached us/check':>16}")
+    for path, scale in ASSETS:
+        sidecar = Path(path + hitbox_cache.HIT_BOX_SUFFIX)
+        sidecar.unlink(missing_ok=True)
+
+        plain, t_plain = timed(lambda: arcade.load_texture(path))
+        _, t_cold = timed(lambda: hitbox_cache.load_texture(path, scale))
+        cached, t_warm = timed(lambda: hitbox_cache.load_texture(path, scale))
+
+        print(f"{path:<18} {t_plain * 1e3:>10.1f} {t_cold * 1e3:>9.1f} {t_warm * 1e3:>9.1f} "
+              f"{len(plain.hit_box_points)}->{len(cached.hit_box_points):<4} "
+              f"{collision_cost(plain, scale) * 1e6:>16.2f} {collision_cost(cached, scale) * 1e6:>16.2f}")
+    print("(warm loads defer pixel decoding until the texture is first drawn)")
+
+
+if __name__ == "__main__":
+    main()
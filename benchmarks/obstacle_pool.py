@@ -0,0 +1,98 @@
+"""
+Obstacle churn: new sprite per spawn versus a recycled SpritePool.
+
+Simulates 23_obstacle_spawning.py at a high spawn rate: every step spawns a
+few obstacles and despawns the same number of old ones, so a fixed number is
+alive at any time. Compares:
+
+- "new + remove": ``arcade.Sprite(...)`` + ``SpriteList.append`` on spawn and
+  ``SpriteList.remove`` on despawn (what 23 did)
+- "pool": ``SpritePool.acquire`` / ``release`` (what 23 does now)
+
+and reports the time per spawn and the memory blocks allocated during the
+steady-state part of the run (tracemalloc).
+
+Run from the repo root:
+    python -m benchmarks.obstacle_pool
+"""
+from __future__ import annotations
+
+import random
+import time
+import tracemalloc
+from collections import deque
+
+import arcade
+
+from game_utils.pool import SpritePool
+
+LIVE = [10, 100, 1_000]
+SPAWNS = 20_000
+SCALE = 0.04
+
+
+def textures():
+    colors = [arcade.color.RED, arcade.color.GREEN, arcade.color.BLUE, arcade.color.YELLOW]
+    return [arcade.make_soft_square_texture(64, c, name=f"obstacle-{i}") for i, c in enumerate(colors)]
+
+
+def churn_new(live, texs, rng):
+    sprite_list = arcade.SpriteList()
+    alive = deque()
+
+    def step():
+        sprite = arcade.Sprite(rng.choice(texs), scale=SCALE)
+        sprite_list.append(sprite)
+        alive.append(sprite)
+        if len(alive) > live:
+            sprite_list.remove(alive.popleft())
+
+    return step
+
+
+def churn_pool(live, texs, rng):
+    pool = SpritePool(live + 1)
+
+    def step():
+        pool.acquire(rng.choice(texs), SCALE)
+        if len(pool) > live:
+            pool.release(pool.oldest())
+
+    return step, pool
+
+
+def run(step, live):
+    for _ in range(live * 2):  # warm up to steady state
+        step()
+    start = time.perf_counter()
+    for _ in range(SPAWNS):
+        step()
+    elapsed = time.perf_counter() - start
+
+    # Same again under tracemalloc (separately, so tracing doesn't skew the timing)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(SPAWNS):
+        step()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    return elapsed / SPAWNS, blocks
+
+
+def main():
+    texs = textures()
+    print(f"{'live':>6} {'new us/spawn':>13} {'pool us/spawn':>14} {'speedup':>8} "
+          f"{'new +blocks':>12} {'pool +blocks':>13}")
+    for live in LIVE:
+        new_time, new_blocks = run(churn_new(live, texs, random.Random(live)), live)
+        step, pool = churn_pool(live, texs, random.Random(live))
+        pool_time, pool_blocks = run(step, live)
+        print(f"{live:>6} {new_time * 1e6:>13.2f} {pool_time * 1e6:>14.2f} {new_time / pool_time:>7.1f}x "
+              f"{new_blocks:>12} {pool_blocks:>13}")
+        assert pool.allocations == live + 1, "pool grew during steady state"
+    print(f"(+blocks = memory blocks still held after {SPAWNS:,} more spawns)")
+
+
+if __name__ == "__main__":
+    main()
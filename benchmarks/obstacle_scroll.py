@@ -0,0 +1,66 @@
+"""
+Obstacle scrolling: move every sprite versus scroll one camera offset.
+
+23_obstacle_spawning.py used to subtract ``OBSTACLE_SPEED * delta_time`` from
+every obstacle each frame. With a ``Conveyor`` the obstacles stay put in the
+world and only ``scroll_x`` (and the camera) changes. This measures the
+per-frame update cost of both for a growing number of live obstacles. Drawing
+is not included (both draw the same SpriteList).
+
+Run from the repo root:
+    python -m benchmarks.obstacle_scroll
+"""
+from __future__ import annotations
+
+import time
+
+import arcade
+
+from game_utils.conveyor import Conveyor
+
+COUNTS = [10, 100, 1_000, 10_000]
+FRAMES = 300
+SPEED = 100
+DT = 1 / 60
+SPACING = 60
+
+
+def make_obstacles(count):
+    texture = arcade.make_soft_square_texture(64, arcade.color.BROWN, name="scroll-obstacle")
+    sprite_list = arcade.SpriteList(capacity=count)
+    for i in range(count):
+        sprite_list.append(arcade.Sprite(texture, center_x=i * SPACING, center_y=60))
+    return sprite_list
+
+
+def move_every_sprite(sprite_list):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for obstacle in sprite_list:
+            obstacle.center_x -= SPEED * DT
+    return (time.perf_counter() - start) / FRAMES
+
+
+def scroll_conveyor(sprite_list):
+    conveyor = Conveyor()
+    for obstacle in sprite_list:
+        conveyor.push(obstacle)
+    camera_position = [0.0, 360.0]
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        conveyor.scroll(SPEED * DT)
+        camera_position[0] = conveyor.to_world(640)
+        conveyor.expire(-1e9)  # the despawn check still looks at the front
+    return (time.perf_counter() - start) / FRAMES
+
+
+def main():
+    print(f"{'obstacles':>10} {'move all us':>12} {'scroll us':>10} {'speedup':>9}")
+    for count in COUNTS:
+        moved = move_every_sprite(make_obstacles(count))
+        scrolled = scroll_conveyor(make_obstacles(count))
+        print(f"{count:>10} {moved * 1e6:>12.1f} {scrolled * 1e6:>10.2f} {moved / scrolled:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
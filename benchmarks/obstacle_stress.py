@@ -0,0 +1,105 @@
+"""
+Headless stress run of 23_obstacle_spawning.py.
+
+Runs the game in stress mode (spawn gap and speed ramp up until thousands of
+obstacles are alive) with a fixed 1/60 s step, without showing a window, and
+writes one CSV row per simulated second:
+
+    seconds, live_obstacles, pool_capacity, spawn_gap_ms, speed,
+    update_ms, draw_ms, frame_ms, fps
+
+``update_ms`` and ``draw_ms`` are averages over that second. ``draw_ms``
+waits for the GPU to finish (``ctx.finish()``), so it is the real cost of a
+frame, not just the time to queue the commands. ``fps`` is the frame rate
+the game could reach at that load.
+
+Run from the repo root (use ARCADE_HEADLESS=1 on machines without a display):
+    python -m benchmarks.obstacle_stress
+    python -m benchmarks.obstacle_stress --seconds 90 --output /tmp/stress.csv
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import importlib.util
+import time
+from pathlib import Path
+
+import arcade
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_OUTPUT = ROOT / "benchmarks" / "results" / "obstacle_stress.csv"
+STEP = 1 / 60
+FIELDS = ["seconds", "live_obstacles", "pool_capacity", "spawn_gap_ms", "speed",
+          "update_ms", "draw_ms", "frame_ms", "fps"]
+
+
+def load_game():
+    path = ROOT / "23_obstacle_spawning.py"
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=int, default=75, help="simulated seconds to run")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--max-frame-ms", type=float, default=500,
+                        help="stop once a second averages slower frames than this")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    game_module = load_game()
+    game_module.SPAWN_SEED = args.seed
+    window = arcade.Window(game_module.WINDOW_WIDTH, game_module.WINDOW_HEIGHT,
+                           "Obstacle stress", visible=False)
+    game = game_module.GameView(stress=True)
+    window.show_view(game)
+
+    rows = []
+    frames_per_second = round(1 / STEP)
+    print(f"{'sec':>4} {'live':>7} {'gap ms':>8} {'update ms':>10} {'draw ms':>8} {'fps':>7}")
+    for second in range(1, args.seconds + 1):
+        update_total = draw_total = 0.0
+        for _ in range(frames_per_second):
+            game.on_update(STEP)
+            update_total += game.update_time
+            start = time.perf_counter()
+            game.on_draw()
+            window.ctx.finish()
+            draw_total += time.perf_counter() - start
+
+        update_ms = update_total / frames_per_second * 1000
+        draw_ms = draw_total / frames_per_second * 1000
+        frame_ms = update_ms + draw_ms
+        row = {
+            "seconds": second,
+            "live_obstacles": len(game.conveyor),
+            "pool_capacity": game.obstacle_pool.capacity,
+            "spawn_gap_ms": round(game.spawn_timeline.curve(game.spawn_timeline.time) * 1000, 3),
+            "speed": round(game.obstacle_speed, 1),
+            "update_ms": round(update_ms, 3),
+            "draw_ms": round(draw_ms, 3),
+            "frame_ms": round(frame_ms, 3),
+            "fps": round(1000 / frame_ms, 1),
+        }
+        rows.append(row)
+        print(f"{second:>4} {row['live_obstacles']:>7} {row['spawn_gap_ms']:>8} "
+              f"{row['update_ms']:>10.2f} {row['draw_ms']:>8.2f} {row['fps']:>7.1f}", flush=True)
+        if frame_ms > args.max_frame_ms:
+            print(f"Stopping: frames take {frame_ms:.0f} ms")
+            break
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"Wrote {args.output}")
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
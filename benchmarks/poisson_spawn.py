@@ -0,0 +1,60 @@
+"""
+Spawn placement benchmark: Poisson-disk fill versus retry-until-it-fits.
+
+"Retry" is the obvious way to keep spawns apart: throw a random point and
+check it against every point placed so far, giving up after a number of
+misses in a row. Each check is O(points), so filling a board is quadratic.
+``PoissonDiskSampler.fill`` uses a background grid and is linear.
+
+Run from the repo root:
+    python -m benchmarks.poisson_spawn
+"""
+from __future__ import annotations
+
+import math
+import random
+import time
+
+from game_utils.spawning import PoissonDiskSampler
+
+MIN_DISTANCE = 40
+SIDES = [500, 1000, 2000, 4000]
+RETRY_LIMIT = 30      # misses in a row before "retry" decides the board is full
+RETRY_MAX_SIDE = 2000  # retry gets too slow to wait for beyond this
+
+
+def retry_fill(side, rng):
+    points = []
+    misses = 0
+    limit = MIN_DISTANCE * MIN_DISTANCE
+    while misses < RETRY_LIMIT:
+        x, y = rng.uniform(0, side), rng.uniform(0, side)
+        if all((px - x) ** 2 + (py - y) ** 2 >= limit for px, py in points):
+            points.append((x, y))
+            misses = 0
+        else:
+            misses += 1
+    return points
+
+
+def main():
+    print(f"{'board':>11} {'poisson pts':>12} {'ms':>9} {'us/pt':>7} {'retry pts':>10} {'ms':>9} {'us/pt':>7}")
+    for side in SIDES:
+        rng = random.Random(side)
+        start = time.perf_counter()
+        points = PoissonDiskSampler(0, 0, side, side, MIN_DISTANCE, rng=rng).fill()
+        poisson = time.perf_counter() - start
+        line = (f"{side:>5}x{side:<5} {len(points):>12} {poisson * 1e3:>9.1f} "
+                f"{poisson / len(points) * 1e6:>7.0f}")
+        if side <= RETRY_MAX_SIDE:
+            start = time.perf_counter()
+            retried = retry_fill(side, rng)
+            retry = time.perf_counter() - start
+            line += f" {len(retried):>10} {retry * 1e3:>9.1f} {retry / len(retried) * 1e6:>7.0f}"
+        print(line)
+    print(f"(min distance {MIN_DISTANCE} px; a perfect hex packing would hold "
+          f"{2 / (math.sqrt(3) * MIN_DISTANCE ** 2) * 1e6:.0f} points per 1000x1000)")
+
+
+if __name__ == "__main__":
+    main()
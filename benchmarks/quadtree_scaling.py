@@ -0,0 +1,93 @@
+"""
+Quadtree scaling benchmark.
+
+Compares the mushroom lookup used in 11_sprite_collision.py and
+12_sprites_countdown.py before (scan every mushroom) and after
+(``LooseQuadtree.query_around``) for 10 up to 200,000 mushrooms.
+
+The board grows with the mushroom count so the density stays the same as in
+the game (5 mushrooms of about 37 px on a 1280x720 window would be far too
+empty, so we use roughly one mushroom per 100x100 px tile).
+
+Run from the repo root:
+    python -m benchmarks.quadtree_scaling
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+
+from game_utils.quadtree import LooseQuadtree
+
+MUSHROOM_SIZE = 37.5  # 2500 px texture * MUSHROOM_SCALING (0.015)
+PLAYER_SIZE = 41.7    # 834 px ball texture * CHARACTER_SCALING (0.05)
+COUNTS = [10, 100, 1_000, 10_000, 50_000, 100_000, 200_000]
+
+
+class Box:
+    __slots__ = ("left", "bottom", "right", "top")
+
+    def __init__(self, x, y, size):
+        half = size / 2
+        self.left = x - half
+        self.bottom = y - half
+        self.right = x + half
+        self.top = y + half
+
+
+def scan_all(player, boxes):
+    """What check_for_collision_with_list does for small lists: look at everything."""
+    return [
+        b for b in boxes
+        if b.left <= player.right and b.right >= player.left
+        and b.bottom <= player.top and b.top >= player.bottom
+    ]
+
+
+def run(count, queries, rng):
+    side = math.sqrt(count) * 100
+    boxes = [Box(rng.uniform(0, side), rng.uniform(0, side), MUSHROOM_SIZE) for _ in range(count)]
+    players = [Box(rng.uniform(0, side), rng.uniform(0, side), PLAYER_SIZE) for _ in range(queries)]
+
+    start = time.perf_counter()
+    tree = LooseQuadtree(0, 0, side, side, max_depth=12)
+    tree.extend(boxes)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for p in players:
+        scan_all(p, boxes)
+    scan = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    for p in players:
+        tree.query_around(p)
+    indexed = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    for b in boxes[: count // 10 or 1]:
+        tree.remove(b)
+    removed = count // 10 or 1
+    remove = (time.perf_counter() - start) / removed
+
+    return build, scan, indexed, remove
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--queries", type=int, default=200, help="player lookups per size")
+    parser.add_argument("--seed", type=int, default=2024)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'mushrooms':>10} {'build ms':>10} {'scan us':>10} {'tree us':>10} {'speedup':>8} {'remove us':>10}")
+    for count in COUNTS:
+        build, scan, indexed, remove = run(count, args.queries, rng)
+        print(f"{count:>10} {build * 1e3:>10.2f} {scan * 1e6:>10.1f} {indexed * 1e6:>10.1f} "
+              f"{scan / indexed:>7.1f}x {remove * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
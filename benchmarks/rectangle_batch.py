@@ -0,0 +1,63 @@
+"""
+Food-square draw benchmark: one ``draw_lbwh_rectangle_filled`` per square
+(what 07/08/09 used to do) versus a single ``RectangleBatch.draw()``.
+
+This one needs a real window (or Xvfb on Linux). Run from the repo root:
+    python -m benchmarks.rectangle_batch
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import arcade
+
+from game_utils.batch import RectangleBatch
+
+COUNTS = [10, 100, 1_000, 10_000, 50_000]
+FOOD_SIZE = 20
+COLORS = [arcade.color.YELLOW, arcade.color.GOLD, arcade.color.ORANGE, arcade.color.WHITE]
+
+
+def time_frames(window, draw, frames):
+    """Average milliseconds for ``draw`` including a GPU sync (finish)."""
+    ctx = window.ctx
+    draw()  # warm-up: uploads buffers, compiles shaders
+    ctx.finish()
+    start = time.perf_counter()
+    for _ in range(frames):
+        window.clear()
+        draw()
+        ctx.finish()
+    return (time.perf_counter() - start) / frames * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Immediate vs batched food drawing")
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    window = arcade.Window(1280, 720, "rectangle batch benchmark", visible=False)
+    rng = random.Random(args.seed)
+    print(f"{'squares':>8} {'immediate ms':>13} {'batch ms':>9}")
+    for count in COUNTS:
+        squares = [(rng.randint(0, 1260), rng.randint(0, 700), rng.choice(COLORS)) for _ in range(count)]
+        batch = RectangleBatch(capacity=count)
+        for i, (x, y, color) in enumerate(squares):
+            batch.add(i, x, y, FOOD_SIZE, FOOD_SIZE, color)
+
+        def immediate():
+            for x, y, color in squares:
+                arcade.draw_lbwh_rectangle_filled(x, y, FOOD_SIZE, FOOD_SIZE, color)
+
+        # The immediate path gets very slow; fewer frames keep the run short
+        slow_frames = max(1, args.frames * 100 // max(count, 100))
+        print(f"{count:>8} {time_frames(window, immediate, slow_frames):>13.2f} "
+              f"{time_frames(window, batch.draw, args.frames):>9.2f}")
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Cost of creating many ``AnimatedSlime`` sprites from 15_slime_animation.py,
+depending on where their frame textures come from:
+
+- "separate files": every slime lists, sorts and decodes every frame file,
+  like the game first did (measured on a few slimes and scaled up),
+- "frame cache": frame files are kept in a dictionary shared by all
+  slimes, so each file is decoded once,
+- "bundle": the game as it is now, one prebaked image for all clips
+  (``game_utils.anim_bundle``),
+- "gif clips": ``USE_GIF_CLIPS = True``, one animated GIF per clip whose
+  frames are decoded when first shown (``game_utils.gif_clips``).
+
+"first ms" is the cost of the first slime, i.e. the startup cost; "decodes"
+is how many images were read from disk. For GIF clips it counts decoded
+frames, and "after 5 s" shows how many more one slime needs by the time it
+has rested, walked both ways and stood still for 5 seconds.
+
+Run from the repo root:
+    python -m benchmarks.slime_spawn
+    python -m benchmarks.slime_spawn --count 5000
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import importlib.util
+import os
+import time
+from pathlib import Path
+
+import arcade
+
+from game_utils import anim_bundle
+from game_utils.gif_clips import GIF_CLIPS
+
+ROOT = Path(__file__).resolve().parents[1]
+UNCACHED_SAMPLE = 10  # slimes actually created without any cache
+CLIPS = {"IDLE": "idle_textures", "IDLE_SLOW": "idle_slow_textures", "BONUS": "tired_textures",
+         "WALK_R": "walk_right_textures", "WALK_L": "walk_left_textures"}
+
+
+def load_game():
+    path = ROOT / "15_slime_animation.py"
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+GAME = load_game()
+
+
+class FrameFileSlime(GAME.AnimatedSlime):
+    """The slime loading its frames file by file, each file once if ``shared``."""
+
+    shared = False
+    listings: dict[str, list[str]] = {}            # folder -> sorted frame files
+    frames: dict[str, arcade.Texture] = {}         # frame file -> texture
+
+    def __init__(self):
+        super().__init__()
+        for clip, attr in CLIPS.items():
+            folder = os.path.join(GAME.ASSETS_ROOT, clip, anim_bundle.FRAME_FOLDER)
+            if not self.shared:
+                files = sorted(glob.glob(os.path.join(folder, "*.png")), key=anim_bundle.natural_key)
+                setattr(self, attr, [arcade.load_texture(f) for f in files])
+                continue
+            if folder not in self.listings:
+                self.listings[folder] = sorted(glob.glob(os.path.join(folder, "*.png")),
+                                               key=anim_bundle.natural_key)
+            for f in self.listings[folder]:
+                if f not in self.frames:
+                    self.frames[f] = arcade.load_texture(f)
+            setattr(self, attr, [self.frames[f] for f in self.listings[folder]])
+        self.textures = self.idle_slow_textures
+        self.texture = self.textures[0]
+
+
+def spawn(factory, count):
+    start = time.perf_counter()
+    first = factory()
+    first_time = time.perf_counter() - start
+    for _ in range(count - 1):
+        factory()
+    return first_time, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1000)
+    args = parser.parse_args()
+
+    GAME.AnimatedSlime()  # make sure the bundle is built, then start cold
+    frame_files = sum(len(f) for f in anim_bundle.find_clips(GAME.ASSETS_ROOT).values())
+    rows = []
+
+    # The subclasses also load the bundle in super().__init__; it is already
+    # in memory by now, so only their own frame loading is measured
+    first, total = spawn(FrameFileSlime, UNCACHED_SAMPLE)
+    rows.append(("separate files", first, total / UNCACHED_SAMPLE * args.count,
+                 frame_files * args.count, True))
+
+    FrameFileSlime.shared = True
+    first, total = spawn(FrameFileSlime, args.count)
+    rows.append(("frame cache", first, total, len(FrameFileSlime.frames), False))
+    FrameFileSlime.shared = False
+
+    anim_bundle._LOADED.clear()
+    first, total = spawn(GAME.AnimatedSlime, args.count)
+    rows.append(("bundle", first, total, 1, False))
+
+    GIF_CLIPS.clear()
+    GAME.USE_GIF_CLIPS = True
+    first, total = spawn(GAME.AnimatedSlime, args.count)
+    rows.append(("gif clips", first, total, GIF_CLIPS.stats.misses, False))
+    slime = GAME.AnimatedSlime()
+    for change_x in [0] * 60 + [1] * 60 + [-1] * 60 + [0] * 120:
+        slime.change_x = change_x
+        slime.update_animation(1 / 60)
+    shown = GIF_CLIPS.stats
+    GAME.USE_GIF_CLIPS = False
+
+    print(f"{args.count} slimes, {frame_files} frame files each")
+    print(f"{'':<15} {'first ms':>9} {'ms/slime':>9} {'total s':>8} {'decodes':>8}")
+    for name, first, total, decodes, estimated in rows:
+        print(f"{name:<15} {first * 1e3:>9.2f} {total / args.count * 1e3:>9.3f} {total:>8.2f} "
+              f"{decodes:>8}{'  (estimated)' if estimated else ''}")
+    print(f"gif clips after 5 s: {shown.misses} of {frame_files} frames decoded, "
+          f"{GIF_CLIPS.opens} file opens, {shown.size_bytes / 1024:.0f} KiB of pixels")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Per-slime cost of ``AnimatedSlime.update_animation`` from 15_slime_animation.py
+for a crowd of slimes that each follow their own made-up keyboard input:
+walking left and right, short stops, long rests and walks long enough to get
+very tired.
+
+The inputs are worked out before timing starts, so only the animation update
+is measured. Reported: average microseconds per slime per frame, and how many
+state changes (idle, rest, walk, tired, ...) happened in total.
+
+Run from the repo root:
+    python -m benchmarks.slime_states
+    python -m benchmarks.slime_states --count 2000 --seconds 60
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import random
+import time
+from pathlib import Path
+
+import arcade
+
+ROOT = Path(__file__).resolve().parents[1]
+STEP = 1 / 60
+
+
+def load_game():
+    path = ROOT / "15_slime_animation.py"
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_input(rng: random.Random, frames: int) -> list[float]:
+    """change_x for every frame: runs of walking left/right and of standing still."""
+    changes = []
+    while len(changes) < frames:
+        kind = rng.random()
+        if kind < 0.15:      # long walk: gets very tired
+            run, speed = rng.randint(960, 1200), rng.choice([-1, 1])
+        elif kind < 0.35:    # long rest: goes to slow idle
+            run, speed = rng.randint(330, 600), 0
+        elif kind < 0.55:    # tiny stop, shorter than the grace time
+            run, speed = rng.randint(1, 10), 0
+        else:
+            run, speed = rng.randint(10, 120), rng.choice([-1, 0, 1])
+        changes.extend([speed * 3.5] * run)
+    return changes[:frames]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--seconds", type=float, default=30.0)
+    args = parser.parse_args()
+
+    game = load_game()
+    rng = random.Random(46)
+    frames = int(args.seconds / STEP)
+    slimes = arcade.SpriteList()
+    inputs = []
+    for _ in range(args.count):
+        slimes.append(game.AnimatedSlime())
+        inputs.append(make_input(rng, frames))
+
+    spent = 0.0
+    changes = 0
+    last = [slime.textures for slime in slimes]
+    for frame in range(frames):
+        for slime, changes_x in zip(slimes, inputs):
+            # Like GameView: no moving while very tired
+            slime.change_x = 0 if slime.is_tired_active else changes_x[frame]
+        start = time.perf_counter()
+        slimes.update_animation(STEP)
+        spent += time.perf_counter() - start
+        for i, slime in enumerate(slimes):
+            if slime.textures is not last[i]:
+                changes += 1
+                last[i] = slime.textures
+
+    updates = frames * args.count
+    print(f"{args.count} slimes, {frames} frames ({args.seconds:g} s at 60 FPS)")
+    print(f"update_animation: {spent / updates * 1e6:.2f} us per slime per frame, "
+          f"{spent / frames * 1e3:.2f} ms per frame")
+    print(f"clip changes: {changes} ({changes / updates * 100:.2f}% of updates)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Startup cost of the pictures of 23_obstacle_spawning.py (the ball and the
+obstacles that exist in this checkout), cold and warm, with the pixel cache
+(``game_utils.pixel_cache``).
+
+The pictures are copied into a temporary folder first, so no cache built by
+the games (asset pipeline, atlases, pixels, hashes) is used or touched.
+
+- "first run": nothing cached. Every picture is hashed, decoded at full size
+  and shrunk, the atlas is packed and saved.
+- "atlas rebuilt": the atlas is gone (say a ``*_SCALING`` constant changed)
+  but the shrunk pixels are cached: nothing is decoded.
+- "later runs, before": what every later start used to cost: hash every
+  picture and decode the atlas page PNG.
+- "later runs, now": ``load_atlas`` with the remembered hashes and the
+  memory-mapped raw page.
+
+Then, per picture: decoding the PNG and shrinking it versus mapping its
+cached raw pixels. Times are medians of ``--repeat`` runs, in milliseconds,
+with the files in the operating system's cache (a truly cold disk adds the
+same reading time to both).
+
+Run from the repo root:
+    python -m benchmarks.startup_decode
+"""
+from __future__ import annotations
+
+import argparse
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image
+
+from game_utils.asset_pipeline import scaled_size
+from game_utils.atlas import load_atlas
+from game_utils.hitbox_cache import file_hash
+from game_utils.pixel_cache import PIXEL_CACHE
+from game_utils.textures import load_scaled_image
+
+SOURCES = {"ball": ("assets/ball.png", 0.05)}
+SOURCES.update({
+    f"{i:02d}": (f"assets/{i:02d}.png", 0.04)
+    for i in range(1, 14) if Path(f"assets/{i:02d}.png").exists()
+})
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def copy_pictures(folder: Path) -> dict:
+    """Copies of the pictures in ``folder``; returns atlas entries for them."""
+    entries = {}
+    for name, (path, scale) in SOURCES.items():
+        copy = folder / Path(path).name
+        if not copy.exists():
+            shutil.copy2(path, copy)
+        entries[name] = (copy, scale)
+    return entries
+
+
+def fresh_cache(folder: Path) -> None:
+    """Forget everything cached in ``folder`` (pictures stay)."""
+    shutil.rmtree(folder / ".cache", ignore_errors=True)
+    shutil.rmtree(folder / "atlases", ignore_errors=True)
+
+
+def load(entries: dict, folder: Path):
+    PIXEL_CACHE.clear()   # like a new start: no hashes remembered in memory
+    return load_atlas("bench", entries, folder / "atlases")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        entries = copy_pictures(folder)
+        paths = [path for path, _ in entries.values()]
+
+        first = []
+        for _ in range(args.repeat):
+            fresh_cache(folder)
+            first.append(timed(lambda: load(entries, folder)))
+
+        rebuilt = []
+        for _ in range(args.repeat):
+            shutil.rmtree(folder / "atlases")
+            rebuilt.append(timed(lambda: load(entries, folder)))
+
+        page = folder / "atlases" / "bench-0.png"
+
+        def before():
+            for path in paths:
+                file_hash(path)
+            with Image.open(page) as image:
+                image.convert("RGBA")
+
+        later_before = [timed(before) for _ in range(args.repeat)]
+        later_now = [timed(lambda: load(entries, folder)) for _ in range(args.repeat)]
+
+        # The biggest picture: full decode and shrink, versus its cached raw pixels
+        path, scale = max(entries.values(), key=lambda entry: entry[0].stat().st_size)
+        with Image.open(path) as image:
+            size = image.size
+        target = scaled_size(size, scale)
+
+        def decode():
+            with Image.open(path) as image:
+                image.convert("RGBA").resize(target, Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+        decoded = [timed(decode) for _ in range(args.repeat)]
+        mapped = [timed(lambda: load_scaled_image(path, scale)) for _ in range(args.repeat)]
+
+    ms = lambda times: statistics.median(times) * 1e3
+    print(f"{len(entries)} pictures of 23_obstacle_spawning.py")
+    print(f"{'first run (nothing cached)':<32} {ms(first):>8.1f} ms")
+    print(f"{'atlas rebuilt, pixels cached':<32} {ms(rebuilt):>8.1f} ms")
+    print(f"{'later runs, before':<32} {ms(later_before):>8.1f} ms")
+    print(f"{'later runs, now':<32} {ms(later_now):>8.1f} ms")
+    print(f"one {size[0]}x{size[1]} picture -> {target[0]}x{target[1]}: "
+          f"decode + shrink {ms(decoded):.1f} ms, cached raw pixels {ms(mapped):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
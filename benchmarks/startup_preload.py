@@ -0,0 +1,117 @@
+"""
+Time to first frame of each game: loading everything before the first frame
+versus a loading screen (``game_utils.preloader``) while the textures load
+on worker threads.
+
+For every game:
+
+- "blocking": load all textures, create the game view, draw it. The window
+  shows nothing until all of that is done (how the games used to start).
+- "first frame": the loading screen's first frame.
+- "game frame": the first frame of the game itself, after the loading
+  screen has switched over.
+
+Caches on disk (atlases, bundles, hit boxes) are warm: run each game once
+first. Times are the median of ``--repeat`` runs, in milliseconds.
+
+Run from the repo root:
+    python -m benchmarks.startup_preload
+    python -m benchmarks.startup_preload --games 13_maze 15_slime_animation
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import os
+import statistics
+import time
+from pathlib import Path
+
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+import arcade
+
+from game_utils import anim_bundle
+from game_utils.gif_clips import GIF_CLIPS
+from game_utils.preloader import LoadingView, Preloader, load_now
+
+ROOT = Path(__file__).resolve().parents[1]
+GAMES = ["11_sprite_collision", "12_sprites_countdown", "13_maze", "14_enemy",
+         "15_slime_animation", "22_obstacle", "23_obstacle_spawning"]
+FRAME = 1 / 60
+
+
+def load_game(name):
+    path = ROOT / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def jobs_of(game):
+    if hasattr(game, "preload_jobs"):
+        return game.preload_jobs()
+    return game.TEXTURE_JOBS, None
+
+
+def forget_loaded():
+    """Drop what earlier runs left in memory, so every run loads again."""
+    anim_bundle._LOADED.clear()
+    GIF_CLIPS.clear()
+
+
+def blocking(window, game):
+    forget_loaded()
+    start = time.perf_counter()
+    jobs, _ = jobs_of(game)
+    view = game.start_game(load_now(jobs))
+    window.show_view(view)
+    view.on_draw()
+    return time.perf_counter() - start
+
+
+def preloaded(window, game):
+    forget_loaded()
+    start = time.perf_counter()
+    jobs, required = jobs_of(game)
+    loading = LoadingView(Preloader(jobs, required), game.start_game)
+    window.show_view(loading)
+    loading.on_draw()
+    first = time.perf_counter() - start
+    while window.current_view is loading:
+        # Paced like the game loop: the rest of each 1/60 s is left to the loaders
+        frame_start = time.perf_counter()
+        loading.on_update(FRAME)
+        if window.current_view is loading:
+            loading.on_draw()
+        time.sleep(max(0.0, FRAME - (time.perf_counter() - frame_start)))
+    window.current_view.on_draw()
+    return first, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", nargs="*", default=GAMES)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    window = arcade.Window(1280, 720, "startup", visible=False)
+    print(f"{'':<22} {'blocking':>9} {'first frame':>12} {'game frame':>11}")
+    for name in args.games:
+        game = load_game(name)
+        try:
+            blocking(window, game)  # warm the caches on disk
+        except FileNotFoundError as e:
+            print(f"{name:<22} skipped: {e}")
+            continue
+        block = [blocking(window, game) for _ in range(args.repeat)]
+        runs = [preloaded(window, game) for _ in range(args.repeat)]
+        print(f"{name:<22} {statistics.median(block) * 1e3:>9.1f} "
+              f"{statistics.median(r[0] for r in runs) * 1e3:>12.1f} "
+              f"{statistics.median(r[1] for r in runs) * 1e3:>11.1f}")
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
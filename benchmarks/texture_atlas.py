@@ -0,0 +1,53 @@
+"""
+Loading a game's pictures one by one versus from a prebuilt sprite atlas.
+
+Uses the pictures of 23_obstacle_spawning.py that exist in this checkout
+(the ball and the obstacles). "separate" is ``arcade.load_texture`` per
+file, as the games used to do; "atlas cold" builds the atlas (shrinking every
+picture once); "atlas warm" is every later start: one small page decode.
+
+Run from the repo root:
+    python -m benchmarks.texture_atlas
+"""
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+
+import arcade
+
+from game_utils.atlas import load_atlas
+
+ENTRIES = {"ball": ("assets/ball.png", 0.05)}
+ENTRIES.update({
+    f"{i:02d}": (f"assets/{i:02d}.png", 0.04)
+    for i in range(1, 14) if Path(f"assets/{i:02d}.png").exists()
+})
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    separate, t_separate = timed(lambda: [arcade.load_texture(path, hash=f"separate:{path}")
+                                          for path, _ in ENTRIES.values()])
+    with tempfile.TemporaryDirectory() as folder:
+        _, t_cold = timed(lambda: load_atlas("bench", ENTRIES, folder))
+        atlas, t_warm = timed(lambda: load_atlas("bench", ENTRIES, folder))
+        page_kb = sum(p.stat().st_size for p in Path(folder).glob("bench-*.png")) / 1024
+
+    held_separate = sum(t.width * t.height * 4 for t in separate) / 1e6
+    held_atlas = sum(t.width * t.height * 4 for t in atlas.textures.values()) / 1e6
+    print(f"{len(ENTRIES)} pictures -> {atlas.page_count} atlas page(s), {page_kb:.0f} KB on disk")
+    print(f"{'':<12} {'load ms':>9} {'pixels MB':>10}")
+    print(f"{'separate':<12} {t_separate * 1e3:>9.1f} {held_separate:>10.2f}")
+    print(f"{'atlas cold':<12} {t_cold * 1e3:>9.1f} {held_atlas:>10.2f}")
+    print(f"{'atlas warm':<12} {t_warm * 1e3:>9.1f} {held_atlas:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+"""
+Shared helpers for the example games.
+
+The numbered scripts in the repo root stay small and readable; anything that
+several of them need (spatial indexes, collision helpers, asset loaders, ...)
+lives in this package so it can be reused and tested on its own.
+
+Run the games from the repo root (``python 11_sprite_collision.py``) so that
+``import game_utils`` resolves.
+"""
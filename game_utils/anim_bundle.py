@@ -0,0 +1,229 @@
+"""
+Animation bundles: every frame of a character in one image.
+
+The slime in 15_slime_animation.py has five animations (IDLE, IDLE_SLOW,
+BONUS, WALK_L, WALK_R), each a folder of separate frame PNGs. Loading them
+means listing five folders, sorting the names so that ``Slime_Idle10`` comes
+after ``Slime_Idle9``, and decoding 29 little files.
+
+A *bundle* is that work done ahead of time:
+
+- ``<name>.png`` -- all the frames packed into one image, and
+- ``<name>.json`` -- the *clips*: for every animation, the rectangle of each
+  frame in the image and how long it is shown.
+
+Loading a bundle decodes a single image and cuts the frames out of it::
+
+    bundle = load_bundle("slime", "assets/SLIME", durations={"WALK_L": 0.12})
+    bundle["WALK_L"].textures     # list of arcade.Texture, in order
+    bundle["WALK_L"].durations    # seconds per frame
+
+Clips are the subfolders of the root that have a ``Frame`` folder; frames
+are sorted by the number at the end of their file name. ``load_bundle``
+builds the bundle in ``assets/.cache/bundles/`` the first time, and again
+whenever a frame file or a duration changes. To build it by hand::
+
+    python -m game_utils.anim_bundle assets/SLIME --name slime
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+import arcade
+from PIL import Image
+
+from game_utils.atlas import PADDING, pack
+from game_utils.hitbox_cache import DEFAULT_MAX_POINTS, compute_hit_box
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_FOLDER = ROOT / "assets" / ".cache" / "bundles"
+FRAME_FOLDER = "Frame"
+DEFAULT_DURATION = 0.1   # seconds per frame for clips without their own
+MAX_IMAGE_SIZE = 4096
+
+
+class Clip(NamedTuple):
+    name: str
+    textures: list      # arcade.Texture per frame
+    durations: list     # seconds each frame is shown
+
+    @property
+    def length(self) -> float:
+        """Seconds for one loop through the clip."""
+        return sum(self.durations)
+
+
+def natural_key(path: str) -> tuple:
+    """Sort key that puts frames like 5,6,7,8,9,10,11 in numeric order."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    digits = len(stem) - len(stem.rstrip("0123456789"))
+    return (stem[:len(stem) - digits], int(stem[len(stem) - digits:]) if digits else -1)
+
+
+def find_clips(root: str | Path) -> dict[str, list[str]]:
+    """Clip name -> sorted frame files, for every ``<root>/<clip>/Frame`` folder."""
+    clips = {}
+    for folder in sorted(glob.glob(os.path.join(root, "*", FRAME_FOLDER))):
+        frames = sorted(glob.glob(os.path.join(folder, "*.png")), key=natural_key)
+        if frames:
+            clips[os.path.basename(os.path.dirname(folder))] = frames
+    return clips
+
+
+def _sources(clips: dict[str, list[str]], durations: dict[str, float]) -> dict:
+    """What the bundle is made from: file sizes/times and durations."""
+    sources = {}
+    for clip, frames in clips.items():
+        stats = [os.stat(f) for f in frames]
+        sources[clip] = {
+            "frames": [[Path(f).as_posix(), s.st_size, s.st_mtime_ns] for f, s in zip(frames, stats)],
+            "duration": durations.get(clip, DEFAULT_DURATION),
+        }
+    return sources
+
+
+def build_bundle(
+    name: str,
+    root: str | Path,
+    durations: dict[str, float] | None = None,
+    folder: str | Path = DEFAULT_FOLDER,
+    max_points: int = DEFAULT_MAX_POINTS,
+) -> Path:
+    """Pack every clip under ``root`` into ``<name>.png``; returns the manifest path."""
+    durations = durations or {}
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    clips = find_clips(root)
+    if not clips:
+        raise FileNotFoundError(f"No <clip>/{FRAME_FOLDER}/*.png folders in {root}")
+
+    frames = [(clip, path) for clip, paths in clips.items() for path in paths]
+    images = []
+    for _, path in frames:
+        with Image.open(path) as image:
+            images.append(image.convert("RGBA"))
+    places = pack([image.size for image in images], MAX_IMAGE_SIZE)
+    if any(page for page, _, _ in places):
+        raise ValueError(f"Frames of {root} don't fit in one {MAX_IMAGE_SIZE} px image")
+
+    width = max(x + image.width for image, (_, x, _) in zip(images, places)) + PADDING
+    height = max(y + image.height for image, (_, _, y) in zip(images, places)) + PADDING
+    sheet = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    manifest_clips = {clip: [] for clip in clips}
+    for (clip, _), image, (_, x, y) in zip(frames, images, places):
+        sheet.paste(image, (x, y))
+        manifest_clips[clip].append({
+            "x": x, "y": y, "width": image.width, "height": image.height,
+            "duration": durations.get(clip, DEFAULT_DURATION),
+            "hit_box": [list(p) for p in compute_hit_box(image, 1.0, max_points)],
+        })
+    sheet.save(folder / f"{name}.png")
+
+    manifest = folder / f"{name}.json"
+    data = {"image": f"{name}.png", "sources": _sources(clips, durations), "clips": manifest_clips}
+    tmp = manifest.with_name(f"{manifest.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp, manifest)
+    return manifest
+
+
+class AnimationBundle:
+    """Clips cut out of a bundle image, which is decoded once.
+
+    Args:
+        manifest: Path of the bundle JSON written by ``build_bundle``.
+    """
+
+    def __init__(self, manifest: str | Path):
+        manifest = Path(manifest)
+        with open(manifest, encoding="utf-8") as f:
+            data = json.load(f)
+        # Textures from a rebuilt bundle must not be mistaken for old ones
+        version = hashlib.sha1(json.dumps(data["sources"], sort_keys=True).encode()).hexdigest()[:16]
+        with Image.open(manifest.parent / data["image"]) as image:
+            sheet = image.convert("RGBA")
+
+        self.clips: dict[str, Clip] = {}
+        for clip, frames in data["clips"].items():
+            textures = []
+            for i, frame in enumerate(frames):
+                x, y = frame["x"], frame["y"]
+                textures.append(arcade.Texture(
+                    sheet.crop((x, y, x + frame["width"], y + frame["height"])),
+                    hit_box_points=tuple(tuple(p) for p in frame["hit_box"]),
+                    hash=f"bundle:{manifest.stem}:{version}:{clip}:{i}",
+                ))
+            self.clips[clip] = Clip(clip, textures, [frame["duration"] for frame in frames])
+
+    def __getitem__(self, clip: str) -> Clip:
+        return self.clips[clip]
+
+    def __contains__(self, clip: str) -> bool:
+        return clip in self.clips
+
+    def textures(self, clip: str) -> list:
+        """Frame textures of ``clip``, or an empty list if there is no such clip."""
+        return self.clips[clip].textures if clip in self.clips else []
+
+
+# Bundles already loaded in this program, by manifest path
+_LOADED: dict[Path, AnimationBundle] = {}
+
+
+def load_bundle(
+    name: str,
+    root: str | Path,
+    durations: dict[str, float] | None = None,
+    folder: str | Path = DEFAULT_FOLDER,
+) -> AnimationBundle:
+    """The bundle of the clips under ``root``, built first if missing or stale.
+
+    Loaded once per program: later calls return the same bundle, so every
+    sprite shares the same textures.
+    """
+    manifest = Path(folder) / f"{name}.json"
+    bundle = _LOADED.get(manifest)
+    if bundle is not None:
+        return bundle
+    try:
+        with open(manifest, encoding="utf-8") as f:
+            up_to_date = json.load(f)["sources"] == _sources(find_clips(root), durations or {})
+    except (OSError, ValueError, KeyError):
+        up_to_date = False
+    if not up_to_date:
+        build_bundle(name, root, durations, folder)
+    bundle = _LOADED[manifest] = AnimationBundle(manifest)
+    return bundle
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack <root>/<clip>/Frame/*.png into one animation bundle.")
+    parser.add_argument("root", type=Path, help="folder with one subfolder per clip, e.g. assets/SLIME")
+    parser.add_argument("--name", help="bundle name (default: the root folder's name, lower case)")
+    parser.add_argument("--duration", action="append", default=[], metavar="CLIP=SECONDS",
+                        help="seconds per frame for one clip (repeatable)")
+    parser.add_argument("--folder", type=Path, default=DEFAULT_FOLDER)
+    args = parser.parse_args()
+
+    durations = {}
+    for item in args.duration:
+        clip, _, seconds = item.partition("=")
+        durations[clip] = float(seconds)
+    name = args.name or args.root.name.lower()
+    manifest = build_bundle(name, args.root, durations, args.folder)
+    with open(manifest, encoding="utf-8") as f:
+        clips = json.load(f)["clips"]
+    for clip, frames in clips.items():
+        print(f"{clip:<10} {len(frames):>3} frames, {frames[0]['duration']:g} s each")
+    print(f"Wrote {manifest} and {manifest.with_suffix('.png').name}")
+
+
+if __name__ == "__main__":
+    main()
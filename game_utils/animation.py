@@ -0,0 +1,143 @@
+"""
+Frame timing for animated sprites.
+
+Animating "one frame when ``elapsed >= frame_time``, then ``elapsed = 0``"
+runs slow whenever the game does: at 20 FPS a clip of 0.12 s frames
+changes frame every 3 updates (0.15 s), and a 0.5 s hitch moves it on by
+one frame instead of four. The timing here keeps the time left over:
+
+- ``FrameClock`` is one sprite's clip clock. ``advance(delta_time)`` keeps
+  the remainder after each frame and moves on as many frames as fit, so a
+  clip plays at its designed speed at any frame rate. It only reports a
+  change when the frame is really different, so the sprite sets
+  ``texture`` only then.
+- ``PhaseClock`` is one clock for the whole game. A ``FrameClock`` made with
+  ``phase=`` reads its frame from it, so every sprite playing the same clip
+  shows the same frame; that frame is worked out once per update per clip.
+
+::
+
+    clock = FrameClock(ANIM_WALK_FRAME_TIME, len(textures))
+    if clock.advance(delta_time):           # True when the frame changed
+        sprite.texture = textures[clock.frame]
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+
+FrameTime = float | Sequence[float]  # seconds per frame, or one number per frame
+
+
+def _clip_timing(frame_time: FrameTime, length: int) -> tuple[float, tuple[float, ...] | None]:
+    """Check a clip's timing; returns (seconds per frame, per-frame seconds or None)."""
+    if length < 1:
+        raise ValueError("A clip needs at least one frame")
+    if isinstance(frame_time, (int, float)):
+        if frame_time <= 0:
+            raise ValueError("frame_time must be positive")
+        return float(frame_time), None
+    durations = tuple(frame_time)
+    if len(durations) != length or min(durations) <= 0:
+        raise ValueError(f"Need {length} positive frame times, got {durations}")
+    return sum(durations) / length, durations
+
+
+class PhaseClock:
+    """Game time, and the frame every synced clip is on at that time.
+
+    Call ``tick(delta_time)`` once per update, before the sprites animate.
+    """
+
+    def __init__(self):
+        self.time = 0.0
+        self._frames: dict[tuple, int] = {}
+
+    def tick(self, delta_time: float) -> None:
+        self.time += delta_time
+        self._frames.clear()
+
+    def frame(self, frame_time: FrameTime, length: int) -> int:
+        """Frame of a ``length``-frame clip with ``frame_time`` timing right now."""
+        key = (frame_time, length)
+        frame = self._frames.get(key)
+        if frame is None:
+            if isinstance(frame_time, tuple):
+                # Frames of different lengths: find the one this loop is in
+                t = self.time % sum(frame_time)
+                frame = 0
+                while frame < length - 1 and t >= frame_time[frame]:
+                    t -= frame_time[frame]
+                    frame += 1
+            else:
+                frame = int(self.time // frame_time) % length
+            self._frames[key] = frame
+        return frame
+
+
+# One phase clock for the whole program; games tick it in on_update
+PHASE_CLOCK = PhaseClock()
+
+
+class FrameClock:
+    """Frame number and time on that frame for one sprite's looping clip.
+
+    Args:
+        frame_time: Seconds each frame is shown, or a sequence with the
+            seconds of every frame (like GIF frame delays).
+        length: Frames in the clip.
+        frame: Frame to start on.
+        elapsed: Seconds already spent on that frame.
+        phase: Follow this ``PhaseClock`` instead of counting on its own.
+    """
+
+    def __init__(self, frame_time: FrameTime, length: int, frame: int = 0,
+                 elapsed: float = 0.0, phase: PhaseClock | None = None):
+        self.frame = frame
+        self.elapsed = elapsed
+        self.phase = phase
+        self.switch(frame_time, length)
+
+    def advance(self, delta_time: float) -> bool:
+        """Move the clock on; returns True if it is on a different frame now."""
+        if self.phase is not None:
+            frame = self.phase.frame(self.durations or self.base_time, self.length)
+            if frame == self.frame:
+                return False
+            self._set_frame(frame)
+            return True
+        self.elapsed += delta_time
+        if self.elapsed < self.frame_time:
+            return False
+        durations = self.durations
+        if durations is None:
+            # Every whole frame that fits, keeping what is left for the next one
+            steps = int(self.elapsed // self.frame_time)
+            self.elapsed -= steps * self.frame_time
+            frame = (self.frame + steps) % self.length
+        else:
+            if self.elapsed >= self.loop_time:       # whole loops end where they started
+                self.elapsed %= self.loop_time
+            frame = self.frame
+            while self.elapsed >= durations[frame]:
+                self.elapsed -= durations[frame]
+                frame = frame + 1 if frame + 1 < self.length else 0
+        if frame == self.frame:
+            return False
+        self._set_frame(frame)
+        return True
+
+    def switch(self, frame_time: FrameTime, length: int) -> None:
+        """Play another clip: the frame number (wrapped) and time on it are kept."""
+        self.base_time, self.durations = _clip_timing(frame_time, length)
+        self.length = length
+        self.loop_time = self.base_time * length if self.durations is None else sum(self.durations)
+        if self.phase is not None:
+            self._set_frame(self.phase.frame(self.durations or self.base_time, length))
+        else:
+            self._set_frame(self.frame % length)
+
+    def _set_frame(self, frame: int) -> None:
+        self.frame = frame
+        # The time the current frame is shown (only changes with per-frame times)
+        self.frame_time = self.base_time if self.durations is None else self.durations[frame]
@@ -0,0 +1,209 @@
+"""
+Asset pipeline: ready-made small copies of our huge pictures.
+
+The pictures in ``assets/`` are 2500x2500 pixels, but the games draw them at
+1-5% of that (``MUSHROOM_SCALING = 0.015``, ``STONE_SCALING = 0.01``,
+``scale=0.04`` ...). Decoding and shrinking a 2500x2500 PNG every time a game
+starts takes a large part of a second per picture, for a 25-100 pixel result.
+
+``assets/texture_manifest.json`` lists which script uses which picture at
+which scale. Building the pipeline reads it and writes, for every picture:
+
+- a *display variant* for each scale in the manifest, exactly the size the
+  picture is drawn at, and
+- a *mip chain*: copies at 1/2, 1/4, 1/8 ... of the size, down to the
+  smallest display variant, for scales the manifest doesn't know about.
+
+They go into ``.cache/`` next to the picture (``assets/.cache/``), together
+with ``index.json``, which is keyed by the picture's file hash. Change a
+picture and its old variants simply stop matching.
+
+Loaders call ``find_variant(path, scale)``: it returns the smallest variant
+that is at least as big as the picture at ``scale``, or the original file if
+there is none (not built yet, picture changed, scale too big)::
+
+    python -m game_utils.asset_pipeline          # build (or refresh) the cache
+    find_variant("assets/05.png", 0.015)         # -> assets/.cache/<hash>/38x38.png
+
+``game_utils.textures.load_scaled_image`` already does this, so anything
+loaded through it gets faster once the cache is built.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import NamedTuple
+
+from PIL import Image
+
+from game_utils.hitbox_cache import file_hash
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_MANIFEST = ROOT / "assets" / "texture_manifest.json"
+CACHE_DIR_NAME = ".cache"
+INDEX_NAME = "index.json"
+
+
+class Variant(NamedTuple):
+    path: Path
+    width: int
+    height: int
+
+
+def scaled_size(size: tuple[int, int], scale: float) -> tuple[int, int]:
+    """Pixel size of a ``size`` picture drawn at ``scale`` (at least 1x1)."""
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+
+def cache_dir_for(path: str | Path) -> Path:
+    """Cache folder used for the picture at ``path``."""
+    return Path(path).parent / CACHE_DIR_NAME
+
+
+def read_manifest(manifest: str | Path = DEFAULT_MANIFEST) -> dict[Path, list[float]]:
+    """Picture path -> sorted list of the scales it is drawn at.
+
+    Paths in the manifest are relative to the folder above the one it is in
+    (the repo root for ``assets/texture_manifest.json``).
+    """
+    manifest = Path(manifest)
+    base = manifest.parent.parent
+    with open(manifest, encoding="utf-8") as f:
+        data = json.load(f)
+    return {
+        base / name: sorted({usage["scale"] for usage in usages})
+        for name, usages in data["textures"].items()
+    }
+
+
+def plan_sizes(size: tuple[int, int], scales: list[float]) -> list[tuple[int, int]]:
+    """Sizes to build for a ``size`` picture drawn at ``scales``, largest first."""
+    display = {scaled_size(size, s) for s in scales if s < 1}
+    sizes = set(display)
+    if display:
+        smallest = min(w for w, _ in display)
+        level = 1
+        while True:
+            mip = (max(1, size[0] >> level), max(1, size[1] >> level))
+            if mip[0] < smallest:
+                break
+            sizes.add(mip)
+            level += 1
+    return sorted(sizes, reverse=True)
+
+
+def _read_index(cache_dir: Path) -> dict:
+    try:
+        with open(cache_dir / INDEX_NAME, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_index(cache_dir: Path, index: dict) -> None:
+    tmp = cache_dir / f"{INDEX_NAME}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    os.replace(tmp, cache_dir / INDEX_NAME)
+
+
+def build_variants(path: str | Path, scales: list[float], force: bool = False) -> list[Variant]:
+    """Write the display variants and mip chain for one picture.
+
+    Already built variants of the same picture are kept unless ``force``.
+    """
+    path = Path(path)
+    cache_dir = cache_dir_for(path)
+    source_hash = file_hash(path)
+    index = _read_index(cache_dir)
+    entry = index.get(source_hash)
+
+    with Image.open(path) as image:
+        size = image.size
+        sizes = plan_sizes(size, scales)
+        if entry and not force and all(list(s) in entry["variants"] for s in sizes):
+            return _variants(cache_dir, source_hash, entry)
+
+        folder = cache_dir / source_hash[:16]
+        folder.mkdir(parents=True, exist_ok=True)
+        image = image.convert("RGBA")
+        for width, height in sizes:
+            # reducing_gap: shrink quickly by whole factors first, then filter nicely
+            small = image.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+            small.save(folder / f"{width}x{height}.png", optimize=True)
+
+    entry = {"source": path.name, "size": list(size), "variants": [list(s) for s in sizes]}
+    # Drop variants of older versions of the same picture
+    for old_hash, old in list(index.items()):
+        if old["source"] == path.name and old_hash != source_hash:
+            shutil.rmtree(cache_dir / old_hash[:16], ignore_errors=True)
+            del index[old_hash]
+    index[source_hash] = entry
+    _write_index(cache_dir, index)
+    return _variants(cache_dir, source_hash, entry)
+
+
+def _variants(cache_dir: Path, source_hash: str, entry: dict) -> list[Variant]:
+    folder = cache_dir / source_hash[:16]
+    return [Variant(folder / f"{w}x{h}.png", w, h) for w, h in entry["variants"]]
+
+
+def find_variant(path: str | Path, scale: float) -> Variant:
+    """Smallest built copy of ``path`` covering ``scale``, else the original.
+
+    "Covering" means at least as wide and as tall as the picture drawn at
+    ``scale``, so shrinking it the rest of the way never loses detail.
+    """
+    path = Path(path)
+    cache_dir = cache_dir_for(path)
+    entry = None
+    if (cache_dir / INDEX_NAME).exists():
+        source_hash = file_hash(path)
+        entry = _read_index(cache_dir).get(source_hash)
+    if entry is None:
+        with Image.open(path) as image:
+            return Variant(path, *image.size)
+
+    need_w, need_h = scaled_size(entry["size"], scale)
+    covering = [v for v in _variants(cache_dir, source_hash, entry)
+                if v.width >= need_w and v.height >= need_h and v.path.exists()]
+    if not covering:
+        return Variant(path, *entry["size"])
+    return min(covering, key=lambda v: v.width * v.height)
+
+
+def build(manifest: str | Path = DEFAULT_MANIFEST, force: bool = False) -> dict[Path, list[Variant]]:
+    """Build variants for every picture in ``manifest`` that exists."""
+    built = {}
+    for path, scales in read_manifest(manifest).items():
+        if path.exists():
+            built[path] = build_variants(path, scales, force=force)
+    return built
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build small copies of the pictures in assets/.")
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST)
+    parser.add_argument("--force", action="store_true", help="rebuild even if up to date")
+    args = parser.parse_args()
+
+    usages = read_manifest(args.manifest)
+    built = build(args.manifest, force=args.force)
+    for path, scales in usages.items():
+        name = path.relative_to(args.manifest.parent.parent).as_posix()
+        if path not in built:
+            print(f"{name:<18} missing, skipped")
+            continue
+        variants = built[path]
+        kilobytes = sum(v.path.stat().st_size for v in variants) / 1024
+        sizes = ", ".join(f"{v.width}" for v in variants)
+        print(f"{name:<18} scales {', '.join(f'{s:g}' for s in scales):<18} "
+              f"-> {len(variants)} variants ({sizes} px, {kilobytes:.0f} KB)")
+    print(f"Pictures built: {len(built)} of {len(usages)}")
+
+
+if __name__ == "__main__":
+    main()
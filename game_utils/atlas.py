@@ -0,0 +1,219 @@
+"""
+Sprite atlas: many small pictures packed into one image.
+
+13_maze.py, 14_enemy.py, 22_obstacle.py and 23_obstacle_spawning.py each load
+a handful of huge pictures (stone, mushroom, exit, ball, 01-13.png) only to
+draw them at a few dozen pixels. A sprite atlas does the shrinking once: all
+the pictures a game needs are resized to their on-screen size and packed
+side by side into one *page* image (or a few, if they don't fit), and a JSON
+manifest remembers where each one is::
+
+    atlas = load_atlas("maze", {
+        "stone": ("assets/04.png", STONE_SCALING),
+        "exit": ("assets/06.png", STONE_SCALING),
+    })
+    sprite = arcade.Sprite(atlas["stone"])   # already the right size: scale 1
+
+The first ``load_atlas`` builds the pages and manifest in
+``assets/.cache/atlases/``; later runs only map the pages' raw pixels into
+memory (``pixel_cache.py``), nothing is decoded.
+The manifest stores each source picture's hash and scale, so changing a
+picture or a ``*_SCALING`` constant rebuilds the atlas by itself. Hit boxes
+are worked out while building (through the hit-box cache next to each
+picture, ``hitbox_cache.py``) and stored in the manifest too.
+
+Pictures are packed in *shelves*: sorted from tallest to shortest and placed
+left to right in rows, starting a new row when one is full and a new page
+when the page is full.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import arcade
+from PIL import Image
+
+from game_utils.hitbox_cache import DEFAULT_MAX_POINTS, cached_hit_box
+from game_utils.pixel_cache import PIXEL_CACHE, RAW_SUFFIX, read_raw, write_raw
+from game_utils.textures import load_scaled_image
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_FOLDER = ROOT / "assets" / ".cache" / "atlases"
+PAGE_SIZE = 1024   # widest/tallest page, in pixels
+PADDING = 2        # empty pixels around every picture so neighbours never bleed in
+
+Entries = dict  # name -> (path, scale)
+
+
+def pack(sizes: list[tuple[int, int]], page_size: int = PAGE_SIZE,
+         padding: int = PADDING) -> list[tuple[int, int, int]]:
+    """Shelf-pack rectangles; returns ``(page, x, y)`` for each size, in order."""
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    places: list[tuple[int, int, int] | None] = [None] * len(sizes)
+    page = x = y = shelf_height = 0
+    for i in order:
+        w, h = sizes[i][0] + padding * 2, sizes[i][1] + padding * 2
+        if w > page_size or h > page_size:
+            raise ValueError(f"{sizes[i][0]}x{sizes[i][1]} doesn't fit on a {page_size} px page")
+        if x + w > page_size:              # row full: start the next shelf
+            x, y, shelf_height = 0, y + shelf_height, 0
+        if y + h > page_size:              # page full: start the next page
+            page, x, y, shelf_height = page + 1, 0, 0, 0
+        places[i] = (page, x + padding, y + padding)
+        x += w
+        shelf_height = max(shelf_height, h)
+    return places
+
+
+def _sources(entries: Entries) -> dict:
+    """What the atlas is built from; a different answer means rebuild."""
+    return {
+        name: {"path": Path(path).as_posix(), "hash": PIXEL_CACHE.source_hash(path), "scale": scale}
+        for name, (path, scale) in sorted(entries.items())
+    }
+
+
+def build_atlas(
+    name: str,
+    entries: Entries,
+    folder: str | Path = DEFAULT_FOLDER,
+    page_size: int = PAGE_SIZE,
+    max_points: int = DEFAULT_MAX_POINTS,
+) -> Path:
+    """Shrink, pack and save the pictures in ``entries``; returns the manifest path."""
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    sources = _sources(entries)
+
+    # The same picture at the same scale is packed once and shared
+    images, shared = [], {}
+    for entry, source in sources.items():
+        key = (source["hash"], source["scale"])
+        if key not in shared:
+            shared[key] = len(images)
+            images.append(load_scaled_image(source["path"], source["scale"]))
+    places = pack([image.size for image in images], page_size)
+
+    pages = []
+    for page in range(max(p for p, _, _ in places) + 1):
+        on_page = [(image, place) for image, place in zip(images, places) if place[0] == page]
+        width = max(x + image.width for image, (_, x, _) in on_page) + PADDING
+        height = max(y + image.height for image, (_, _, y) in on_page) + PADDING
+        canvas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        for image, (_, x, y) in on_page:
+            canvas.paste(image, (x, y))
+        page_name = f"{name}-{page}.png"
+        canvas.save(folder / page_name)
+        write_raw(canvas, (folder / page_name).with_suffix(RAW_SUFFIX))
+        pages.append(page_name)
+
+    sprites = {}
+    for entry, source in sources.items():
+        index = shared[(source["hash"], source["scale"])]
+        page, x, y = places[index]
+        image = images[index]
+        sprites[entry] = {
+            "page": page, "x": x, "y": y, "width": image.width, "height": image.height,
+            "hit_box": _atlas_hit_box(source, image, max_points),
+        }
+
+    manifest = folder / f"{name}.json"
+    tmp = manifest.with_name(f"{manifest.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"sources": sources, "pages": pages, "sprites": sprites}, f, indent=1)
+    os.replace(tmp, manifest)
+    return manifest
+
+
+def _load_page(path: Path) -> Image.Image:
+    """An atlas page: its raw copy, or the PNG (which then gets a raw copy)."""
+    raw = path.with_suffix(RAW_SUFFIX)
+    if raw.exists() and raw.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+        page = read_raw(raw)
+        if page is not None:
+            return page
+    with Image.open(path) as page:
+        page = page.convert("RGBA")
+    try:
+        write_raw(page, raw)
+    except OSError:
+        pass
+    return page
+
+
+def _atlas_hit_box(source: dict, image: Image.Image, max_points: int) -> list:
+    """Hit box of a packed picture, in its atlas pixels.
+
+    Goes through the hit-box cache next to the picture (``hitbox_cache.py``),
+    so rebuilding an atlas, or loading the picture with ``load_texture`` at
+    the same scale, reuses it.
+    """
+    points = cached_hit_box(source["path"], source["scale"], max_points,
+                            image=image, source_hash=source["hash"])
+    with Image.open(source["path"]) as original:   # reads the size only
+        fx, fy = image.width / original.width, image.height / original.height
+    return [[round(x * fx, 2), round(y * fy, 2)] for x, y in points]
+
+
+class SpriteAtlas:
+    """Textures cut out of atlas pages, looked up by name.
+
+    Each page is loaded once, from its raw ``.rgba`` copy if there is one (no
+    decoding, see ``pixel_cache.py``); every texture is a crop of it with
+    the hit box from the manifest.
+
+    Args:
+        manifest: Path of the atlas JSON written by ``build_atlas``.
+    """
+
+    def __init__(self, manifest: str | Path):
+        manifest = Path(manifest)
+        with open(manifest, encoding="utf-8") as f:
+            data = json.load(f)
+        # Textures from a rebuilt atlas must not be mistaken for old ones
+        version = hashlib.sha1(json.dumps(data["sources"], sort_keys=True).encode()).hexdigest()[:16]
+        pages = []
+        for page_name in data["pages"]:
+            pages.append(_load_page(manifest.parent / page_name))
+
+        self.textures: dict[str, arcade.Texture] = {}
+        for name, sprite in data["sprites"].items():
+            x, y = sprite["x"], sprite["y"]
+            image = pages[sprite["page"]].crop((x, y, x + sprite["width"], y + sprite["height"]))
+            self.textures[name] = arcade.Texture(
+                image,
+                hit_box_points=tuple(tuple(p) for p in sprite["hit_box"]),
+                hash=f"atlas:{manifest.stem}:{version}:{name}",
+            )
+        self.page_count = len(pages)
+
+    def __getitem__(self, name: str) -> arcade.Texture:
+        return self.textures[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.textures
+
+    def __len__(self) -> int:
+        return len(self.textures)
+
+
+def load_atlas(name: str, entries: Entries, folder: str | Path = DEFAULT_FOLDER) -> SpriteAtlas:
+    """Load the atlas called ``name``, building it first if it is missing or stale.
+
+    Args:
+        name: File name of the atlas (``maze`` -> ``maze.json``, ``maze-0.png``).
+        entries: Texture name -> ``(picture path, scale it is drawn at)``.
+        folder: Where atlases are stored.
+    """
+    manifest = Path(folder) / f"{name}.json"
+    try:
+        with open(manifest, encoding="utf-8") as f:
+            up_to_date = json.load(f)["sources"] == _sources(entries)
+    except (OSError, ValueError, KeyError):
+        up_to_date = False
+    if not up_to_date:
+        build_atlas(name, entries, folder)
+    return SpriteAtlas(manifest)
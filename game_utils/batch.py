@@ -0,0 +1,84 @@
+"""
+Retained rectangle batch: draw many filled rectangles with one call.
+
+``arcade.draw_lbwh_rectangle_filled`` is great for learning, but every call
+sends its own little piece of geometry to the GPU. With thousands of food
+squares that adds up quickly.
+
+``RectangleBatch`` keeps every rectangle as a solid-colour sprite inside a
+single ``arcade.SpriteList``. A sprite list owns one GPU buffer for all its
+items and only rewrites the slots of the items that changed, so:
+
+- adding or removing one square only touches that square's entry,
+- moving one square only updates that square's position,
+- ``draw()`` is a single draw call no matter how many squares there are.
+
+Rectangles are stored under a key (usually the game object itself)::
+
+    batch = RectangleBatch()
+    batch.add(food, food.x, food.y, food.size, food.size, food.color)
+    batch.remove(food)   # when it gets eaten
+    batch.draw()         # in on_draw
+"""
+from __future__ import annotations
+
+import arcade
+
+
+class RectangleBatch:
+    """A group of filled, axis-aligned rectangles drawn in one call.
+
+    Positions use the same LBWH convention as
+    ``arcade.draw_lbwh_rectangle_filled`` (left, bottom, width, height).
+    """
+
+    def __init__(self, capacity: int = 100):
+        self._sprites = arcade.SpriteList(capacity=capacity)
+        self._by_key = {}
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._by_key
+
+    def add(self, key, left: float, bottom: float, width: float, height: float, color) -> None:
+        """Add a rectangle (or replace the one already stored under ``key``)."""
+        if key in self._by_key:
+            self.remove(key)
+        rect = arcade.SpriteSolidColor(
+            int(width), int(height),
+            center_x=left + width / 2,
+            center_y=bottom + height / 2,
+            color=color,
+        )
+        self._by_key[key] = rect
+        self._sprites.append(rect)
+
+    def move(self, key, left: float, bottom: float) -> None:
+        """Move an existing rectangle; only its own entry is updated."""
+        rect = self._by_key[key]
+        rect.left = left
+        rect.bottom = bottom
+
+    def set_color(self, key, color) -> None:
+        """Change the colour of an existing rectangle."""
+        self._by_key[key].color = color
+
+    def remove(self, key) -> None:
+        """Remove a rectangle. Raises ``KeyError`` if ``key`` is unknown."""
+        self._by_key.pop(key).remove_from_sprite_lists()
+
+    def discard(self, key) -> None:
+        """Remove a rectangle if it exists."""
+        if key in self._by_key:
+            self.remove(key)
+
+    def clear(self) -> None:
+        """Remove every rectangle."""
+        self._by_key.clear()
+        self._sprites.clear()
+
+    def draw(self) -> None:
+        """Draw all rectangles with a single draw call."""
+        self._sprites.draw()
@@ -0,0 +1,94 @@
+"""
+Collider shapes: pick the cheapest collision test for each pair of sprites.
+
+``arcade.check_for_collision`` always compares hit-box polygons. That is the
+right answer for odd shapes, but our player and enemy are round balls and
+tiles/pickups are happy with boxes, and those have much cheaper tests:
+
+=========  =========  ==============================================
+shape A    shape B    test
+=========  =========  ==============================================
+circle     circle     distance between centers vs. sum of radii
+circle     aabb       closest point of the box vs. radius
+aabb       aabb       overlap on both axes (edges of the hit box)
+polygon    anything   ``arcade.check_for_collision`` (the old way)
+=========  =========  ==============================================
+
+A sprite chooses its shape with a ``collider`` attribute (``CIRCLE``,
+``AABB`` or ``POLYGON``; sprites without one count as ``POLYGON``). A circle
+uses ``collider_radius`` if set, otherwise half the sprite's smaller side.
+
+Use ``collides(a, b)`` anywhere you would call ``arcade.check_for_collision``.
+"""
+from __future__ import annotations
+
+import arcade
+
+CIRCLE = "circle"
+AABB = "aabb"
+POLYGON = "polygon"
+
+
+def collider_shape(sprite) -> str:
+    return getattr(sprite, "collider", POLYGON)
+
+
+def collider_radius(sprite) -> float:
+    radius = getattr(sprite, "collider_radius", None)
+    if radius is None:
+        radius = min(sprite.width, sprite.height) / 2
+    return radius
+
+
+def _circle_circle(a, b) -> bool:
+    dx = a.center_x - b.center_x
+    dy = a.center_y - b.center_y
+    reach = collider_radius(a) + collider_radius(b)
+    return dx * dx + dy * dy <= reach * reach
+
+
+def _circle_aabb(circle, box) -> bool:
+    x = circle.center_x
+    y = circle.center_y
+    # Closest point of the box to the circle center
+    nearest_x = min(max(x, box.left), box.right)
+    nearest_y = min(max(y, box.bottom), box.top)
+    dx = x - nearest_x
+    dy = y - nearest_y
+    radius = collider_radius(circle)
+    return dx * dx + dy * dy <= radius * radius
+
+
+def _aabb_circle(box, circle) -> bool:
+    return _circle_aabb(circle, box)
+
+
+def _aabb_aabb(a, b) -> bool:
+    return a.left <= b.right and a.right >= b.left and a.bottom <= b.top and a.top >= b.bottom
+
+
+# Shape pairs we have a fast test for; everything else falls back to polygons
+NARROW_PHASE_TESTS = {
+    (CIRCLE, CIRCLE): _circle_circle,
+    (CIRCLE, AABB): _circle_aabb,
+    (AABB, CIRCLE): _aabb_circle,
+    (AABB, AABB): _aabb_aabb,
+}
+
+
+def collides(a, b) -> bool:
+    """True if sprites ``a`` and ``b`` touch, using the cheapest test for their shapes."""
+    test = NARROW_PHASE_TESTS.get((collider_shape(a), collider_shape(b)))
+    if test is None:
+        return arcade.check_for_collision(a, b)
+    return test(a, b)
+
+
+def collisions_with_list(sprite, sprite_list) -> list:
+    """Shape-aware version of ``arcade.check_for_collision_with_list``."""
+    spatial_hash = getattr(sprite_list, "spatial_hash", None)
+    if spatial_hash is not None:
+        candidates = spatial_hash.get_sprites_near_sprite(sprite)
+    else:
+        candidates = sprite_list
+    return [other for other in candidates if other is not sprite and collides(sprite, other)]
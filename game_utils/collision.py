@@ -0,0 +1,368 @@
+"""
+Collision events: know when things *start*, *keep* and *stop* touching.
+
+Most of the games ask "what am I touching right now?" every frame and then
+handle the hits straight away. ``CollisionWorld`` remembers last frame's
+contacts instead, so it can tell you:
+
+- ``on_enter(subject, other)``: they just started touching (eat the food!)
+- ``on_stay(subject, other)``: they were touching last frame too
+- ``on_exit(subject, other)``: they stopped touching (or ``other`` is gone)
+
+It also caches the result of the (possibly expensive) narrow-phase check for
+every pair. If neither bounding box moved since last frame the cached answer
+is reused, so standing still next to a wall costs almost nothing.
+
+Example from 12_sprites_countdown.py::
+
+    self.collisions = CollisionWorld(narrow_phase=arcade.check_for_collision)
+    self.collisions.watch(self.player_sprite, self.mushroom_list,
+                          on_enter=self.collect_mushroom)
+    ...
+    self.collisions.update()   # once per on_update
+
+``others`` may also be a function returning the objects to test this frame,
+e.g. ``lambda: index.query_around(player)`` with the quadtree from
+``game_utils.quadtree``.
+
+For levels with many groups (walls, pickups, enemies, ...) ``CollisionLayers``
+names the groups and says which of them can touch, and ``BroadPhase`` is a
+shared grid that never even looks at pairs the layers rule out.
+"""
+from __future__ import annotations
+
+from typing import Callable, Iterable
+
+from game_utils.quadtree import Bounds, sprite_bounds
+
+
+def square_bounds(item) -> Bounds:
+    """Bounds of an LBWH square with ``x``, ``y`` and ``size`` (07-09 style)."""
+    return item.x, item.y, item.x + item.size, item.y + item.size
+
+
+def boxes_overlap(a: Bounds, b: Bounds) -> bool:
+    """Edge-based AABB test; touching edges do not count as overlap."""
+    return a[0] < b[2] and a[2] > b[0] and a[1] < b[3] and a[3] > b[1]
+
+
+class Watch:
+    """One "subject against a group" registration inside a CollisionWorld."""
+
+    def __init__(self, subject, others, on_enter, on_stay, on_exit):
+        self.subject = subject
+        self.others = others
+        self.on_enter = on_enter
+        self.on_stay = on_stay
+        self.on_exit = on_exit
+        self.contacts = set()  # objects touching the subject last update
+
+
+class CollisionWorld:
+    """Tracks contacts between watched objects and fires enter/stay/exit callbacks.
+
+    Args:
+        bounds: Function returning ``(left, bottom, right, top)`` for an object.
+            Defaults to sprite edges; use ``square_bounds`` for 07-09 objects.
+        narrow_phase: Optional exact test ``(a, b) -> bool`` that runs only
+            when the bounding boxes overlap (e.g. ``arcade.check_for_collision``).
+            Without it the bounding-box overlap is the answer.
+    """
+
+    def __init__(
+        self,
+        bounds: Callable[[object], Bounds] = sprite_bounds,
+        narrow_phase: Callable[[object, object], bool] | None = None,
+    ):
+        self.bounds = bounds
+        self.narrow_phase = narrow_phase
+        self._watches: list[Watch] = []
+        self._pair_cache = {}  # (subject, other) -> (subject bounds, other bounds, result)
+
+        # Per-update statistics (handy for HUDs and benchmarks)
+        self.narrow_checks = 0
+        self.cache_hits = 0
+
+    def watch(
+        self,
+        subject,
+        others: Iterable | Callable[[], Iterable],
+        on_enter: Callable | None = None,
+        on_stay: Callable | None = None,
+        on_exit: Callable | None = None,
+    ) -> Watch:
+        """Start tracking contacts between ``subject`` and ``others``.
+
+        ``others`` is read again on every update, so a list or SpriteList that
+        grows and shrinks during the game just works.
+        """
+        watch = Watch(subject, others, on_enter, on_stay, on_exit)
+        self._watches.append(watch)
+        return watch
+
+    def unwatch(self, watch: Watch) -> None:
+        """Stop tracking a registration returned by ``watch``."""
+        self._watches.remove(watch)
+        for other in watch.contacts:
+            self._pair_cache.pop((watch.subject, other), None)
+
+    def forget(self, obj) -> None:
+        """Drop ``obj`` from all contacts without firing ``on_exit`` for it."""
+        for watch in self._watches:
+            watch.contacts.discard(obj)
+            self._pair_cache.pop((watch.subject, obj), None)
+
+    def clear(self) -> None:
+        """Remove all watches and remembered contacts (e.g. on game reset)."""
+        self._watches.clear()
+        self._pair_cache.clear()
+
+    def contacts(self, subject) -> set:
+        """Objects touching ``subject`` as of the last update."""
+        found = set()
+        for watch in self._watches:
+            if watch.subject is subject:
+                found |= watch.contacts
+        return found
+
+    def _touching(self, subject, subject_box, other, cache) -> bool:
+        other_box = self.bounds(other)
+        if not boxes_overlap(subject_box, other_box):
+            return False
+        key = (subject, other)
+        cached = self._pair_cache.get(key)
+        if cached is not None and cached[0] == subject_box and cached[1] == other_box:
+            self.cache_hits += 1
+            result = cached[2]
+        else:
+            self.narrow_checks += 1
+            result = self.narrow_phase(subject, other) if self.narrow_phase else True
+        cache[key] = (subject_box, other_box, result)
+        return result
+
+    def update(self) -> None:
+        """Test every watch once and fire the callbacks.
+
+        All contacts are worked out first and the callbacks run afterwards, so
+        a callback may safely remove objects from the lists being watched.
+        """
+        self.narrow_checks = 0
+        self.cache_hits = 0
+        new_cache = {}
+        events = []
+
+        for watch in self._watches:
+            subject = watch.subject
+            subject_box = self.bounds(subject)
+            others = watch.others() if callable(watch.others) else watch.others
+            now = {
+                other for other in others
+                if other is not subject and self._touching(subject, subject_box, other, new_cache)
+            }
+            before = watch.contacts
+            watch.contacts = now
+            events.append((watch, now - before, now & before, before - now))
+
+        # Only pairs whose boxes overlapped this frame stay cached
+        self._pair_cache = new_cache
+
+        for watch, entered, stayed, exited in events:
+            subject = watch.subject
+            if watch.on_enter:
+                for other in entered:
+                    watch.on_enter(subject, other)
+            if watch.on_stay:
+                for other in stayed:
+                    watch.on_stay(subject, other)
+            if watch.on_exit:
+                for other in exited:
+                    watch.on_exit(subject, other)
+
+
+class CollisionLayers:
+    """Named collision layers and the rules for which layers may touch.
+
+    Every layer gets its own bit. ``interact`` stores which pairs of layers
+    are allowed to collide (the rule works both ways)::
+
+        layers = CollisionLayers("player", "wall", "pickup", "enemy", "exit")
+        layers.interact("player", "wall", "pickup", "enemy", "exit")
+
+    Walls never test against pickups, pickups never against the exit, and so
+    on, because nobody asked for those pairs.
+    """
+
+    def __init__(self, *names: str):
+        if len(set(names)) != len(names):
+            raise ValueError("Layer names must be unique")
+        self._bits = {name: 1 << i for i, name in enumerate(names)}
+        self._masks = {name: 0 for name in names}
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._bits)
+
+    def bit(self, name: str) -> int:
+        """The bit used for layer ``name``."""
+        try:
+            return self._bits[name]
+        except KeyError:
+            raise ValueError(f"Unknown collision layer: {name!r}") from None
+
+    def bits(self, *names: str) -> int:
+        """All the bits of the given layers OR-ed together."""
+        result = 0
+        for name in names:
+            result |= self.bit(name)
+        return result
+
+    def interact(self, layer: str, *others: str) -> None:
+        """Allow ``layer`` to collide with each of ``others`` (and vice versa)."""
+        for other in others:
+            self._masks[layer] |= self.bit(other)
+            self._masks[other] |= self.bit(layer)
+
+    def mask(self, name: str) -> int:
+        """Bits of every layer that ``name`` may collide with."""
+        self.bit(name)  # validates the name
+        return self._masks[name]
+
+    def can_interact(self, a: str, b: str) -> bool:
+        return bool(self.mask(a) & self.bit(b))
+
+
+class BroadPhase:
+    """Shared uniform-grid broad phase that respects collision layers.
+
+    Every body is added once with its layer. Bodies are bucketed by grid cell
+    *and* by layer, so a query only walks the buckets of layers its own layer
+    may interact with: pairs ruled out by the layer masks are never tested.
+
+    ``pair_tests`` counts the bounding-box tests done since the last
+    ``reset_counters()`` call, which makes the saving easy to show on a HUD.
+
+    Args:
+        layers: The ``CollisionLayers`` registry to use.
+        cell_size: Grid cell size in pixels (a couple of tiles works well).
+        bounds: Function returning ``(left, bottom, right, top)`` for a body.
+        narrow_phase: Optional exact test ``(a, b) -> bool`` for ``collisions``.
+    """
+
+    def __init__(
+        self,
+        layers: CollisionLayers,
+        cell_size: float = 64,
+        bounds: Callable[[object], Bounds] = sprite_bounds,
+        narrow_phase: Callable[[object, object], bool] | None = None,
+    ):
+        self.layers = layers
+        self.cell_size = cell_size
+        self.bounds = bounds
+        self.narrow_phase = narrow_phase
+        self._cells = {}   # (col, row) -> {layer bit: {body: None}}
+        self._bodies = {}  # body -> (layer name, layer bit, cell keys, bounds)
+        self.pair_tests = 0
+
+    def __len__(self) -> int:
+        return len(self._bodies)
+
+    def __contains__(self, body) -> bool:
+        return body in self._bodies
+
+    def _cell_keys(self, box: Bounds) -> tuple:
+        size = self.cell_size
+        c0, c1 = int(box[0] // size), int(box[2] // size)
+        r0, r1 = int(box[1] // size), int(box[3] // size)
+        return tuple((c, r) for c in range(c0, c1 + 1) for r in range(r0, r1 + 1))
+
+    def add(self, body, layer: str) -> None:
+        """Register ``body`` on ``layer`` (moves it if already registered)."""
+        if body in self._bodies:
+            self.remove(body)
+        bit = self.layers.bit(layer)
+        box = self.bounds(body)
+        keys = self._cell_keys(box)
+        for key in keys:
+            self._cells.setdefault(key, {}).setdefault(bit, {})[body] = None
+        self._bodies[body] = (layer, bit, keys, box)
+
+    def extend(self, bodies: Iterable, layer: str) -> None:
+        """Register many bodies on the same layer."""
+        for body in bodies:
+            self.add(body, layer)
+
+    def remove(self, body) -> None:
+        """Unregister ``body``. Raises ``KeyError`` if it is unknown."""
+        _, bit, keys, _ = self._bodies.pop(body)
+        for key in keys:
+            cell = self._cells[key]
+            bucket = cell[bit]
+            del bucket[body]
+            if not bucket:
+                del cell[bit]
+                if not cell:
+                    del self._cells[key]
+
+    def discard(self, body) -> None:
+        if body in self._bodies:
+            self.remove(body)
+
+    def move(self, body) -> None:
+        """Call after ``body`` moved so it lands in the right cells."""
+        layer, bit, keys, _ = self._bodies[body]
+        box = self.bounds(body)
+        new_keys = self._cell_keys(box)
+        if new_keys == keys:
+            self._bodies[body] = (layer, bit, keys, box)
+        else:
+            self.remove(body)
+            self.add(body, layer)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._bodies.clear()
+
+    def reset_counters(self) -> None:
+        """Start counting pair tests for a new frame."""
+        self.pair_tests = 0
+
+    def nearby(self, body, *layers: str) -> list:
+        """Bodies whose bounding box overlaps ``body``'s.
+
+        Only layers that ``body``'s layer may interact with are looked at;
+        pass layer names to narrow it down further (e.g. just ``"wall"``).
+        """
+        layer, _, keys, box = self._bodies[body]
+        wanted = self.layers.mask(layer)
+        if layers:
+            wanted &= self.layers.bits(*layers)
+        if not wanted:
+            return []
+
+        left, bottom, right, top = box
+        found = []
+        seen = {body}
+        bodies = self._bodies
+        for key in keys:
+            cell = self._cells.get(key)
+            if not cell:
+                continue
+            for bit, bucket in cell.items():
+                if not bit & wanted:
+                    continue
+                for other in bucket:
+                    if other in seen:
+                        continue
+                    seen.add(other)
+                    self.pair_tests += 1
+                    o = bodies[other][3]
+                    if o[0] <= right and o[2] >= left and o[1] <= top and o[3] >= bottom:
+                        found.append(other)
+        return found
+
+    def collisions(self, body, *layers: str) -> list:
+        """Like ``nearby`` but also runs the narrow phase (if one was given)."""
+        found = self.nearby(body, *layers)
+        if self.narrow_phase is None:
+            return found
+        return [other for other in found if self.narrow_phase(body, other)]
@@ -0,0 +1,134 @@
+"""
+Conveyor: a scrolling world where only the camera moves.
+
+In a side-scroller every obstacle moves left at the same speed, so moving
+each sprite every frame is wasted work: it is the *view* that moves. A
+``Conveyor`` keeps obstacles at fixed world coordinates and only changes one
+number, ``scroll_x`` (how far the world has scrolled). Draw the obstacles
+through an ``arcade.Camera2D`` placed at ``scroll_x`` and they all slide left
+together, whatever their number.
+
+Obstacles are pushed in the order they appear, which is also left-to-right
+order, so the oldest one is always the leftmost. Despawning is a look at the
+front of the queue: once its right edge is left of the screen it is gone,
+and the check stops at the first obstacle that is still visible::
+
+    conveyor = Conveyor()
+    obstacle.left = conveyor.scroll_x + WINDOW_WIDTH   # spawn just off screen
+    conveyor.push(obstacle)
+    ...
+    conveyor.scroll(OBSTACLE_SPEED * delta_time)        # O(1) per frame
+    for gone in conveyor.expire():                      # usually nothing
+        pool.release(gone)
+
+Because the items are sorted by x, ``overlapping(left, right)`` finds the
+few items covering a column (e.g. the player's) with a binary search instead
+of a scan over every obstacle.
+"""
+from __future__ import annotations
+
+import bisect
+import itertools
+
+
+class Conveyor:
+    """World-space items ordered by x, scrolled by a single offset.
+
+    Items need ``left`` and ``right`` attributes (sprites have them) and must
+    not move after being pushed. They are kept sorted by their left edge.
+    """
+
+    _COMPACT_AFTER = 32  # popped slots kept before the list is trimmed
+
+    def __init__(self, scroll_x: float = 0.0):
+        self.scroll_x = scroll_x
+        self._items = []
+        self._lefts = []  # left edges, same order as _items
+        self._head = 0    # index of the leftmost item still on the conveyor
+        self._widest = 0.0  # widest item pushed so far, bounds the search in overlapping
+
+    def __len__(self) -> int:
+        return len(self._items) - self._head
+
+    def __iter__(self):
+        """Items from left to right."""
+        return itertools.islice(self._items, self._head, None)
+
+    def push(self, item) -> None:
+        """Add ``item``, normally at the right end.
+
+        Items of different widths spawned very close together can arrive a
+        little out of order; those are inserted at their sorted place (a
+        short move near the end of the list).
+        """
+        left = item.left
+        if not len(self) or left >= self._lefts[-1]:
+            self._items.append(item)
+            self._lefts.append(left)
+        else:
+            index = bisect.bisect_right(self._lefts, left, self._head)
+            self._items.insert(index, item)
+            self._lefts.insert(index, left)
+        self._widest = max(self._widest, item.right - left)
+
+    def scroll(self, dx: float) -> None:
+        """Move the view ``dx`` pixels to the right (the world slides left)."""
+        self.scroll_x += dx
+
+    def leftmost(self):
+        """The leftmost (oldest) item, or ``None``."""
+        return self._items[self._head] if len(self) else None
+
+    def pop_left(self):
+        """Remove and return the leftmost item. Raises ``IndexError`` if empty."""
+        if not len(self):
+            raise IndexError("pop from an empty Conveyor")
+        item = self._items[self._head]
+        self._items[self._head] = None
+        self._head += 1
+        if self._head >= self._COMPACT_AFTER and self._head * 2 >= len(self._items):
+            del self._items[:self._head]
+            del self._lefts[:self._head]
+            self._head = 0
+        return item
+
+    def expire(self, left_edge: float | None = None) -> list:
+        """Remove and return items entirely left of ``left_edge``.
+
+        ``left_edge`` defaults to ``scroll_x``, the left edge of the screen.
+        Only the front of the queue is looked at.
+        """
+        if left_edge is None:
+            left_edge = self.scroll_x
+        gone = []
+        while len(self) and self._items[self._head].right < left_edge:
+            gone.append(self.pop_left())
+        return gone
+
+    def overlapping(self, left: float, right: float) -> list:
+        """Items whose x-range overlaps ``[left, right]`` (world coordinates).
+
+        Binary search on the sorted left edges: only items starting between
+        ``left - widest`` and ``right`` are looked at.
+        """
+        lefts = self._lefts
+        start = bisect.bisect_left(lefts, left - self._widest, self._head)
+        stop = bisect.bisect_right(lefts, right, start)
+        items = self._items
+        return [items[i] for i in range(start, stop) if items[i].right >= left]
+
+    def clear(self, scroll_x: float = 0.0) -> None:
+        """Remove every item and move the view back to ``scroll_x``."""
+        self._items.clear()
+        self._lefts.clear()
+        self._head = 0
+        self._widest = 0.0
+        self.scroll_x = scroll_x
+
+    def to_screen(self, x: float) -> float:
+        """Screen x of world position ``x``."""
+        return x - self.scroll_x
+
+    def to_world(self, x: float) -> float:
+        """World x of screen position ``x`` (e.g. the player's column)."""
+        return x + self.scroll_x
@@ -0,0 +1,263 @@
+"""
+Animation clips read straight from animated GIFs, one frame at a time.
+
+Every slime clip in assets/SLIME also comes as a single animated GIF
+(``assets/SLIME/BONUS/Gif/Slime_Bonus.gif``), with the artist's own time for
+each frame. A ``GifClip`` plays such a file without decoding it up front:
+
+- opening a clip only reads the GIF's block list to count the frames and
+  get each frame's delay, no pixels are decoded;
+- a frame is decoded the first time it is shown. The file stays open while
+  the clip plays forward, so the next frame costs one decoding step and no
+  new disk open;
+- decoded frames live in a cache with a size limit (least recently used
+  frames are dropped first), so clips that are never shown never take up
+  memory.
+
+The loader can be used from loading threads and the game at the same time
+(see ``preloader.py``). The cache's lock is only held to look a frame up or
+store it; decoding holds just its own clip's lock (a clip's open file can
+only read one frame at a time), so different clips decode side by side and
+the game never waits for a clip it isn't showing.
+
+A clip works like the list of textures a sprite animates through::
+
+    clip = GIF_CLIPS.clip("assets/SLIME/IDLE/Gif/Slime_Idle.gif")
+    clips = GIF_CLIPS.clips_in("assets/SLIME")   # {"IDLE": clip, "BONUS": ..., ...}
+    len(clip)          # 4 frames, nothing decoded yet
+    clip.durations     # (0.15, 0.15, 0.15, 0.15) seconds
+    clip[0]            # decodes and caches the first frame
+"""
+from __future__ import annotations
+
+import glob
+import os
+import struct
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple
+
+import arcade
+from PIL import Image
+
+from game_utils.hitbox_cache import compute_hit_box
+
+GIF_FOLDER = "Gif"
+DEFAULT_DELAY = 0.1  # seconds, for frames whose delay is 0 (as browsers do)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB of decoded pixels
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from memory (0.0-1.0)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def texture_bytes(texture: arcade.Texture) -> int:
+    """Decoded size of ``texture`` (RGBA: 4 bytes per pixel)."""
+    return texture.width * texture.height * 4
+
+
+def read_gif_delays(path: str | Path) -> tuple[float, ...]:
+    """Seconds each frame of the GIF at ``path`` is shown, without decoding it.
+
+    Walks the file's blocks: a Graphic Control Extension holds the delay (in
+    hundredths of a second) of the image that follows it.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:3] != b"GIF":
+        raise ValueError(f"{path} is not a GIF file")
+
+    def skip_sub_blocks(pos: int) -> int:
+        while data[pos]:
+            pos += data[pos] + 1
+        return pos + 1
+
+    pos = 13
+    if data[10] & 0x80:                              # global color table
+        pos += 3 * (2 << (data[10] & 0x07))
+    delays, delay = [], 0
+    while pos < len(data):
+        block = data[pos]
+        if block == 0x21:                            # extension
+            if data[pos + 1] == 0xF9:                # graphic control: delay of the next image
+                delay = struct.unpack_from("<H", data, pos + 4)[0]
+            pos = skip_sub_blocks(pos + 2)
+        elif block == 0x2C:                          # image
+            packed = data[pos + 9]
+            pos += 10
+            if packed & 0x80:                        # local color table
+                pos += 3 * (2 << (packed & 0x07))
+            pos = skip_sub_blocks(pos + 1)           # after the LZW code size
+            delays.append(delay / 100 if delay else DEFAULT_DELAY)
+            delay = 0
+        elif block == 0x3B:                          # trailer
+            break
+        else:
+            raise ValueError(f"{path}: unexpected GIF block {block:#x} at byte {pos}")
+    return tuple(delays)
+
+
+def find_gif_clips(root: str | Path) -> dict[str, str]:
+    """Clip name -> GIF file, for every ``<root>/<clip>/Gif/*.gif``."""
+    clips = {}
+    for folder in sorted(glob.glob(os.path.join(root, "*", GIF_FOLDER))):
+        files = sorted(glob.glob(os.path.join(folder, "*.gif")))
+        if files:
+            clips[os.path.basename(os.path.dirname(folder))] = files[0]
+    return clips
+
+
+class GifClip:
+    """The frames of one animated GIF, decoded when they are first needed.
+
+    Made by ``GifClipLoader.clip``; indexing returns an ``arcade.Texture``.
+    """
+
+    def __init__(self, path: str, loader: GifClipLoader):
+        self.path = path
+        self.loader = loader
+        self.durations = read_gif_delays(path)
+        self.version = os.stat(path).st_mtime_ns
+        self._reader: Image.Image | None = None
+        self._lock = threading.RLock()   # guards _reader
+
+    def __len__(self) -> int:
+        return len(self.durations)
+
+    def __getitem__(self, index: int) -> arcade.Texture:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"{self.path} has {len(self)} frames, not {index + 1}")
+        return self.loader.frame(self, index)
+
+    @property
+    def length(self) -> float:
+        """Seconds for one loop through the clip."""
+        return sum(self.durations)
+
+    def decode(self, index: int) -> arcade.Texture:
+        """Decode frame ``index`` (use ``clip[index]`` to go through the cache)."""
+        with self._lock:
+            reader = self._reader
+            opened = reader is None or reader.tell() > index
+            if opened:
+                # GIF frames build on each other: going back means starting over
+                self.close()
+                reader = self._reader = Image.open(self.path)
+            reader.seek(index)
+            image = reader.convert("RGBA")
+            if index == len(self) - 1:
+                self.close()                         # played to the end: free the file
+        if opened:
+            self.loader.count_open()
+        return arcade.Texture(
+            image,
+            hit_box_points=compute_hit_box(image, 1.0),
+            hash=f"gif:{Path(self.path).as_posix()}:{self.version}:{index}",
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+
+class GifClipLoader:
+    """GIF clips by path, and their decoded frames with least-recently-used eviction.
+
+    Args:
+        max_bytes: Most decoded pixel bytes to keep, over all clips.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._clips: dict[str, GifClip] = {}
+        self._folders: dict[str, dict[str, GifClip]] = {}
+        self._frames: OrderedDict[tuple[str, int], arcade.Texture] = OrderedDict()
+        self.size_bytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self.opens = 0
+        self._lock = threading.RLock()
+
+    def clip(self, path: str) -> GifClip:
+        """The clip for the GIF at ``path`` (its delays are read once)."""
+        key = os.path.normpath(path)
+        with self._lock:
+            clip = self._clips.get(key)
+            if clip is None:
+                clip = self._clips[key] = GifClip(key, self)
+            return clip
+
+    def clips_in(self, root: str | Path) -> dict[str, GifClip]:
+        """Clip name -> clip for every ``<root>/<clip>/Gif/*.gif``; looked up once."""
+        key = os.path.normpath(root)
+        with self._lock:
+            clips = self._folders.get(key)
+            if clips is None:
+                clips = self._folders[key] = {name: self.clip(path) for name, path in find_gif_clips(root).items()}
+            return dict(clips)
+
+    def frame(self, clip: GifClip, index: int) -> arcade.Texture:
+        """Frame ``index`` of ``clip``, decoded only if it isn't cached."""
+        key = (clip.path, index)
+        with self._lock:
+            texture = self._frames.get(key)
+            if texture is not None:
+                self._frames.move_to_end(key)
+                self.hits += 1
+                return texture
+            self.misses += 1
+
+        # Decoded without the cache's lock: other clips and cached frames stay available
+        texture = clip.decode(index)
+
+        with self._lock:
+            cached = self._frames.get(key)
+            if cached is not None:               # another thread decoded it meanwhile
+                return cached
+            self._frames[key] = texture
+            self.size_bytes += texture_bytes(texture)
+            while self.size_bytes > self.max_bytes and len(self._frames) > 1:
+                _, old = self._frames.popitem(last=False)
+                self.size_bytes -= texture_bytes(old)
+                self.evictions += 1
+            return texture
+
+    def count_open(self) -> None:
+        """Called by a clip each time it opens its file."""
+        with self._lock:
+            self.opens += 1
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.evictions, len(self._frames), self.size_bytes)
+
+    def clear(self) -> None:
+        """Forget every clip and frame and reset the counters."""
+        with self._lock:
+            clips = list(self._clips.values())
+            self._clips.clear()
+            self._folders.clear()
+            self._frames.clear()
+            self.size_bytes = 0
+            self.hits = self.misses = self.evictions = self.opens = 0
+        # Outside the cache's lock, so it isn't held while waiting for a clip that is decoding
+        for clip in clips:
+            clip.close()
+
+
+# One loader for the whole program, so every sprite shares the same frames
+GIF_CLIPS = GifClipLoader()
@@ -0,0 +1,221 @@
+"""
+Cached, simplified hit boxes for big textures.
+
+Our mushroom, exit and ball pictures are huge (2500x2500 and 834x834 pixels)
+but are drawn at 1-5% of that size. When Arcade loads a texture it walks the
+full-resolution alpha channel to build the hit-box polygon, which takes about
+half a second per picture, and that detail is wasted once the sprite is
+shrunk to 37 pixels.
+
+``load_texture(path, scale)`` does this instead:
+
+1. Hash the file bytes (fast: no decoding needed).
+2. Look in ``<asset>.hitbox.json`` next to the image for a hit box made for
+   that hash and scale.
+3. If there isn't one, shrink the alpha channel to about the on-screen size,
+   take the convex hull of the visible pixels, simplify it to a few points
+   and store it in the JSON file for next time.
+4. Build the texture with those points, so Arcade skips its own hit-box pass.
+
+Fewer hit-box points also make every polygon collision check cheaper.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import arcade
+from PIL import Image
+
+HIT_BOX_SUFFIX = ".hitbox.json"
+MIN_SAMPLE_SIZE = 32     # never decide the shape from fewer pixels than this
+DEFAULT_MAX_POINTS = 8   # like Arcade's "simple" hit boxes
+
+# Loading threads (see preloader.py) may add hit boxes to the same sidecar
+_SIDECAR_LOCK = threading.Lock()
+
+
+def file_hash(path: str | Path) -> str:
+    """SHA-1 of the file contents; changes whenever the picture changes."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def convex_hull(points) -> list:
+    """Convex hull (counter-clockwise) using Andrew's monotone chain."""
+    pts = sorted(set(points))
+    if len(pts) <= 2:
+        return pts
+    lower = []
+    for p in pts:
+        while len(lower) >= 2 and _cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    upper = []
+    for p in reversed(pts):
+        while len(upper) >= 2 and _cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return lower[:-1] + upper[:-1]
+
+
+def simplify_polygon(points: list, max_points: int) -> list:
+    """Drop the vertices that add the least area until ``max_points`` are left."""
+    pts = list(points)
+    while len(pts) > max(3, max_points):
+        n = len(pts)
+        smallest = min(
+            range(n),
+            key=lambda i: abs(_cross(pts[i - 1], pts[i], pts[(i + 1) % n])),
+        )
+        del pts[smallest]
+    return pts
+
+
+def compute_hit_box(
+    image: Image.Image,
+    scale: float = 1.0,
+    max_points: int = DEFAULT_MAX_POINTS,
+    alpha_threshold: int = 0,
+) -> tuple:
+    """Hit-box points for ``image`` drawn at ``scale``.
+
+    Points are in texture pixels relative to the image center (the format
+    Arcade expects); the sprite applies its scale on top of them.
+    """
+    width, height = image.size
+    # Look at the picture at roughly twice its on-screen size
+    sample_w = max(1, min(width, max(MIN_SAMPLE_SIZE, round(width * scale * 2))))
+    sample_h = max(1, min(height, max(MIN_SAMPLE_SIZE, round(height * scale * 2))))
+    alpha = image.getchannel("A") if "A" in image.getbands() else image.convert("L")
+    alpha = alpha.resize((sample_w, sample_h), Image.Resampling.BOX)
+    data = alpha.tobytes()
+
+    corners = []
+    for row in range(sample_h):
+        line = data[row * sample_w:(row + 1) * sample_w]
+        solid = [x for x, a in enumerate(line) if a > alpha_threshold]
+        if solid:
+            for x in (solid[0], solid[-1] + 1):
+                corners.append((x, row))
+                corners.append((x, row + 1))
+
+    if not corners:
+        # Fully transparent: fall back to the whole rectangle
+        hw, hh = width / 2, height / 2
+        return ((-hw, -hh), (hw, -hh), (hw, hh), (-hw, hh))
+
+    hull = simplify_polygon(convex_hull(corners), max_points)
+    sx = width / sample_w
+    sy = height / sample_h
+    # Image rows go down, Arcade's y axis goes up
+    return tuple(
+        (round(x * sx - width / 2, 2), round(height / 2 - y * sy, 2))
+        for x, y in reversed(hull)
+    )
+
+
+def _sidecar_path(path: Path) -> Path:
+    return path.with_name(path.name + HIT_BOX_SUFFIX)
+
+
+def _read_sidecar(path: Path) -> dict:
+    try:
+        with open(_sidecar_path(path), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_sidecar(path: Path, data: dict) -> None:
+    sidecar = _sidecar_path(path)
+    tmp = sidecar.with_name(sidecar.name + f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, sidecar)
+    except OSError:
+        # Read-only folder or similar: the cache is just an optimization
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def cached_hit_box(
+    path: str | Path,
+    scale: float = 1.0,
+    max_points: int = DEFAULT_MAX_POINTS,
+    image: Image.Image | None = None,
+    source_hash: str | None = None,
+) -> tuple:
+    """Hit-box points for the image at ``path``, computed once and stored on disk.
+
+    ``image`` is the decoded picture if the caller already has it. It may
+    also be a shrunk copy (like the ones packed into a sprite atlas): the
+    hit box is then worked out from the copy and scaled back up, so it is
+    stored in the full picture's pixels like every other entry.
+    """
+    path = Path(path)
+    source_hash = source_hash or file_hash(path)
+    key = f"{scale:g}/{max_points}"
+
+    data = _read_sidecar(path)
+    if data.get("source_hash") == source_hash:
+        points = data["hit_boxes"].get(key)
+        if points is not None:
+            return tuple(tuple(p) for p in points)
+
+    if image is None:
+        image = Image.open(path)
+        full_width, full_height = image.size
+    else:
+        with Image.open(path) as original:   # reads the size only
+            full_width, full_height = original.size
+    if image.size == (full_width, full_height):
+        points = compute_hit_box(image, scale, max_points)
+    else:
+        fx, fy = full_width / image.width, full_height / image.height
+        points = tuple(
+            (round(x * fx, 2), round(y * fy, 2))
+            for x, y in compute_hit_box(image, scale * fx, max_points)
+        )
+    with _SIDECAR_LOCK:
+        # Read again: another thread may have added its own hit box meanwhile
+        data = _read_sidecar(path)
+        if data.get("source_hash") != source_hash:
+            data = {"source_hash": source_hash, "hit_boxes": {}}
+        data["hit_boxes"][key] = [list(p) for p in points]
+        _write_sidecar(path, data)
+    return points
+
+
+def load_texture(
+    path: str | Path,
+    scale: float = 1.0,
+    max_points: int = DEFAULT_MAX_POINTS,
+) -> arcade.Texture:
+    """Load a texture and attach a cached hit box made for ``scale``.
+
+    Drop-in replacement for ``arcade.load_texture(path)`` in the games.
+    """
+    path = Path(path)
+    source_hash = file_hash(path)
+    image = Image.open(path)
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+    points = cached_hit_box(path, scale, max_points, image=image, source_hash=source_hash)
+    # Passing our own hash also saves Arcade from hashing every decoded pixel
+    texture = arcade.Texture(image, hit_box_points=points, hash=source_hash)
+    texture.file_path = path
+    return texture
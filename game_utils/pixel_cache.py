@@ -0,0 +1,187 @@
+"""
+Decoded pictures kept on disk as raw pixels, so they never need decoding again.
+
+A PNG is compressed: every time a game starts, each picture is *inflated*
+(unzipped) and un-filtered line by line before a single pixel can be used.
+For the 2500x2500 pictures in ``assets/`` that is most of the work of
+loading them, and it is the same work on every run.
+
+The pixel cache stores the result instead: the picture, already shrunk to
+the size it is drawn at, as plain RGBA bytes in a ``.rgba`` file (a 16-byte
+header with the size, then 4 bytes per pixel). Loading it unpacks nothing:
+the file is *memory-mapped*, so the operating system hands its pages to
+Pillow as they are touched, straight from its own file cache::
+
+    image = PIXEL_CACHE.load("assets/05.png", (38, 38), decode_and_shrink)
+
+Files are named after the picture's hash and the size, and live in
+``.cache/pixels/`` next to the picture (``assets/.cache/pixels/``). Change
+the picture and the old file simply stops matching.
+
+Hashing a picture means reading all of it, which would undo much of the
+win, so hashes are remembered too (``.cache/hashes.json``), together with
+the file's size and modification time: as long as those stay the same the
+stored hash is used, like ``anim_bundle`` decides whether a bundle is stale.
+
+``textures.load_scaled_image`` (and so the sprite atlases) loads through
+``PIXEL_CACHE``; atlas pages are kept as ``.rgba`` files next to their PNGs.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Callable
+
+from PIL import Image
+
+from game_utils.asset_pipeline import cache_dir_for
+from game_utils.hitbox_cache import file_hash
+
+RAW_SUFFIX = ".rgba"
+PIXELS_FOLDER = "pixels"
+HASHES_NAME = "hashes.json"
+MAGIC = b"RGBA"
+HEADER = struct.Struct("<4sIII")   # magic, width, height, unused: 16 bytes keeps pixels aligned
+
+
+def write_raw(image: Image.Image, path: str | Path) -> None:
+    """Save ``image`` as raw RGBA pixels at ``path`` (written to a temp file, then renamed)."""
+    path = Path(path)
+    image = image if image.mode == "RGBA" else image.convert("RGBA")
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, image.width, image.height, 0))
+        f.write(image.tobytes())
+    os.replace(tmp, path)
+
+
+def read_raw(path: str | Path, size: tuple[int, int] | None = None) -> Image.Image | None:
+    """Memory-map the raw picture at ``path``; None if it is missing or broken.
+
+    Args:
+        path: A file written by ``write_raw``.
+        size: The size the picture must have, if known.
+
+    The returned image uses the mapped file as its pixels (nothing is
+    copied); Pillow makes a private copy if the image is ever changed.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):   # missing, or empty (can't map 0 bytes)
+        return None
+    if len(data) < HEADER.size:
+        return None
+    magic, width, height, _ = HEADER.unpack_from(data)
+    if (magic != MAGIC or len(data) != HEADER.size + width * height * 4
+            or (size is not None and (width, height) != tuple(size))):
+        return None
+    return Image.frombuffer("RGBA", (width, height), memoryview(data)[HEADER.size:], "raw", "RGBA", 0, 1)
+
+
+class PixelCache:
+    """Shrunk pictures by (picture hash, size), stored as memory-mapped raw files.
+
+    Args:
+        folder: Where to keep the files; by default ``.cache/`` next to each picture.
+    """
+
+    def __init__(self, folder: str | Path | None = None):
+        self.folder = None if folder is None else Path(folder)
+        self._hashes: dict[Path, dict] = {}   # cache folder -> contents of its hashes.json
+        self.hits = self.misses = 0
+        self._lock = threading.RLock()
+
+    def cache_dir(self, path: str | Path) -> Path:
+        return self.folder if self.folder is not None else cache_dir_for(path)
+
+    def source_hash(self, path: str | Path) -> str:
+        """Hash of the file at ``path``, only re-read when its size or time changed."""
+        path = Path(path)
+        stat = os.stat(path)
+        cache_dir = self.cache_dir(path)
+        key = path.resolve().as_posix()
+        with self._lock:
+            hashes = self._read_hashes(cache_dir)
+            known = hashes.get(key)
+            if known and known[:2] == [stat.st_size, stat.st_mtime_ns]:
+                return known[2]
+            digest = file_hash(path)
+            hashes[key] = [stat.st_size, stat.st_mtime_ns, digest]
+            if known and known[2] != digest:
+                self._drop_version(cache_dir, known[2])
+            self._write_hashes(cache_dir)
+            return digest
+
+    def pixels_path(self, path: str | Path, size: tuple[int, int]) -> Path:
+        """Raw file for ``path`` shrunk to ``size``."""
+        digest = self.source_hash(path)
+        return self.cache_dir(path) / PIXELS_FOLDER / f"{digest[:16]}-{size[0]}x{size[1]}{RAW_SUFFIX}"
+
+    def load(self, path: str | Path, size: tuple[int, int],
+             decode: Callable[[], Image.Image]) -> Image.Image:
+        """The picture at ``path`` at ``size``: from the cache, or ``decode()`` and store it.
+
+        Args:
+            path: The picture the pixels come from (its hash is the key).
+            size: Width and height ``decode`` returns.
+            decode: Makes the RGBA picture when it isn't cached yet.
+        """
+        raw = self.pixels_path(path, size)
+        image = read_raw(raw, size)
+        if image is not None:
+            self.hits += 1
+            return image
+        self.misses += 1
+        image = decode()
+        try:
+            raw.parent.mkdir(parents=True, exist_ok=True)
+            write_raw(image, raw)
+        except OSError:
+            pass   # read-only folder and the like: just decode again next time
+        return image
+
+    def clear(self) -> None:
+        """Forget the hashes read so far and reset the counters (files stay)."""
+        with self._lock:
+            self._hashes.clear()
+            self.hits = self.misses = 0
+
+    def _read_hashes(self, cache_dir: Path) -> dict:
+        hashes = self._hashes.get(cache_dir)
+        if hashes is None:
+            try:
+                with open(cache_dir / HASHES_NAME, encoding="utf-8") as f:
+                    hashes = json.load(f)
+            except (OSError, ValueError):
+                hashes = {}
+            self._hashes[cache_dir] = hashes
+        return hashes
+
+    def _write_hashes(self, cache_dir: Path) -> None:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = cache_dir / f"{HASHES_NAME}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._hashes[cache_dir], f, indent=1, sort_keys=True)
+            os.replace(tmp, cache_dir / HASHES_NAME)
+        except OSError:
+            pass
+
+    def _drop_version(self, cache_dir: Path, old_hash: str) -> None:
+        """Delete the raw files of a picture's old version, unless another file still has it."""
+        if any(entry[2] == old_hash for entry in self._hashes[cache_dir].values()):
+            return
+        for old in (cache_dir / PIXELS_FOLDER).glob(f"{old_hash[:16]}-*{RAW_SUFFIX}"):
+            try:
+                old.unlink()
+            except OSError:
+                pass   # still mapped (Windows): it goes with the next change
+
+
+# One cache for the whole program
+PIXEL_CACHE = PixelCache()
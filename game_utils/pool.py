@@ -0,0 +1,114 @@
+"""
+Sprite pool: reuse sprites instead of creating and deleting them.
+
+Games like 23_obstacle_spawning.py create a new ``arcade.Sprite`` for every
+obstacle and remove it from its SpriteList when it leaves the screen. Each
+append/remove moves slots around in the sprite list's GPU buffers, and every
+new sprite is a new Python object for the garbage collector.
+
+``SpritePool`` creates a fixed number of sprites up front, all inside one
+SpriteList and all hidden. ``acquire`` takes a free one, gives it a texture
+and makes it visible; ``release`` hides it and puts it back. The SpriteList
+never changes size, so nothing is allocated while the game runs. Only when
+every sprite is in use does the pool grow (doubling its size), and
+``allocations`` counts how often that happened::
+
+    pool = SpritePool(capacity=16)
+    obstacle = pool.acquire(texture, scale=0.04)   # when spawning
+    pool.release(obstacle)                         # when it leaves the screen
+    pool.sprite_list.draw()                        # hidden sprites draw nothing
+"""
+from __future__ import annotations
+
+from typing import Callable
+
+import arcade
+
+
+class SpritePool:
+    """A fixed set of reusable sprites stored in one SpriteList.
+
+    Args:
+        capacity: Number of sprites to create up front.
+        factory: Function creating one (hidden) sprite; defaults to a plain
+            ``arcade.Sprite``.
+        sprite_list: SpriteList to keep the sprites in (a new one by default).
+    """
+
+    def __init__(
+        self,
+        capacity: int = 16,
+        factory: Callable[[], arcade.Sprite] = arcade.Sprite,
+        sprite_list: arcade.SpriteList | None = None,
+    ):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.factory = factory
+        self.sprite_list = sprite_list if sprite_list is not None else arcade.SpriteList(capacity=capacity)
+        self._free = []
+        self._active = {}  # sprite -> None; a dict keeps spawn order
+        self.allocations = 0  # sprites created so far (including the first batch)
+        self._grow(capacity)
+
+    def _grow(self, count: int) -> None:
+        for _ in range(count):
+            sprite = self.factory()
+            sprite.visible = False
+            self.sprite_list.append(sprite)
+            self._free.append(sprite)
+        self.allocations += count
+
+    @property
+    def capacity(self) -> int:
+        """Total number of sprites owned by the pool (free and in use)."""
+        return len(self._free) + len(self._active)
+
+    @property
+    def active(self):
+        """Sprites in use, oldest first (a live view; don't release while looping)."""
+        return self._active.keys()
+
+    def __len__(self) -> int:
+        return len(self._active)
+
+    def __contains__(self, sprite) -> bool:
+        return sprite in self._active
+
+    def oldest(self) -> arcade.Sprite | None:
+        """The sprite that has been in use the longest, or ``None``."""
+        return next(iter(self._active), None)
+
+    def acquire(self, texture: arcade.Texture | None = None, scale: float | None = None) -> arcade.Sprite:
+        """Take a free sprite, set its texture and scale, and make it visible.
+
+        Position and speed are left to the caller. If no sprite is free the
+        pool doubles in size first.
+        """
+        if not self._free:
+            self._grow(self.capacity)
+        sprite = self._free.pop()
+        if texture is not None:
+            sprite.texture = texture
+        if scale is not None:
+            sprite.scale = scale
+        sprite.change_x = 0
+        sprite.change_y = 0
+        sprite.visible = True
+        self._active[sprite] = None
+        return sprite
+
+    def release(self, sprite: arcade.Sprite) -> None:
+        """Hide ``sprite`` and make it available again. Raises ``KeyError`` if not in use."""
+        del self._active[sprite]
+        sprite.visible = False
+        self._free.append(sprite)
+
+    def release_all(self) -> None:
+        """Release every sprite in use (e.g. on reset)."""
+        for sprite in self._active:
+            sprite.visible = False
+            self._free.append(sprite)
+        self._active.clear()
+
+    def draw(self) -> None:
+        self.sprite_list.draw()
@@ -0,0 +1,169 @@
+"""
+Load a game's pictures in the background while a loading screen is shown.
+
+Until now every game loaded its textures before opening its window (or while
+creating its ``GameView``), so nothing appeared on screen until the last
+picture was decoded. A ``Preloader`` runs the loading *jobs* on a small pool
+of threads instead; image decoding in Pillow mostly runs outside Python's
+global lock, so several pictures really are decoded at the same time.
+
+Jobs are plain functions without arguments, by name. Some are *required*:
+the game can't start without them. The others keep loading in the
+background after the game has started::
+
+    preloader = Preloader({
+        "character": lambda: load_texture("assets/ball.png", 0.05),
+        "mushroom": lambda: load_texture("assets/05.png", 0.04),
+    })
+
+``LoadingView`` is the loading screen: it draws a progress bar for the
+required jobs and, as soon as they are done, hands their results to a
+function that builds the game view and shows it::
+
+    def start_game(results):
+        TEXTURES.update(results)
+        game_view = GameView()
+        game_view.setup()
+        return game_view
+
+    window.show_view(LoadingView(preloader, start_game))
+
+Textures are only *created* on the worker threads; Arcade uploads them to
+the graphics card on the main thread the first time they are drawn.
+"""
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+import arcade
+
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+Job = Callable[[], Any]
+
+
+class Preloader:
+    """Runs loading jobs on a thread pool and reports how far they got.
+
+    Args:
+        jobs: Name -> function that loads something and returns it.
+        required: Names the game needs before it can start (default: all).
+        workers: Number of loading threads.
+    """
+
+    def __init__(self, jobs: dict[str, Job], required: Iterable[str] | None = None,
+                 workers: int = DEFAULT_WORKERS):
+        self.jobs = dict(jobs)
+        self.required = list(self.jobs if required is None else required)
+        unknown = [name for name in self.required if name not in self.jobs]
+        if unknown:
+            raise ValueError(f"Required jobs that don't exist: {unknown}")
+        self.workers = workers
+        self.started_at: float | None = None
+        self.ready_at: float | None = None
+        self._futures: dict[str, Future] = {}
+        self._pool: ThreadPoolExecutor | None = None
+
+    def start(self) -> Preloader:
+        """Start loading (required jobs first); calling it again does nothing."""
+        if self._pool is None:
+            self.started_at = time.perf_counter()
+            self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="preload")
+            later = [name for name in self.jobs if name not in self.required]
+            for name in self.required + later:
+                self._futures[name] = self._pool.submit(self.jobs[name])
+            self._pool.shutdown(wait=False)  # threads end once the last job is done
+        return self
+
+    @property
+    def total(self) -> int:
+        return len(self.required)
+
+    @property
+    def done(self) -> int:
+        """How many required jobs have finished."""
+        return sum(1 for name in self.required if name in self._futures and self._futures[name].done())
+
+    @property
+    def progress(self) -> float:
+        """Share of the required jobs that have finished (0.0-1.0)."""
+        return self.done / self.total if self.total else 1.0
+
+    @property
+    def ready(self) -> bool:
+        """True once every required job has finished (the game can start)."""
+        if self._pool is None:
+            return False
+        if self.ready_at is None and self.done == self.total:
+            self.ready_at = time.perf_counter()
+        return self.ready_at is not None
+
+    @property
+    def finished(self) -> bool:
+        """True once every job, required or not, has finished."""
+        return self._pool is not None and all(f.done() for f in self._futures.values())
+
+    def result(self, name: str) -> Any:
+        """What job ``name`` returned; raises the job's exception if it failed.
+
+        Waits for the job if it isn't done yet.
+        """
+        return self.start()._futures[name].result()
+
+    def results(self) -> dict[str, Any]:
+        """Results of the required jobs (waits for them if needed)."""
+        return {name: self.result(name) for name in self.required}
+
+    def wait(self) -> dict[str, Any]:
+        """Wait for every job; returns all results."""
+        self.start()
+        return {name: self.result(name) for name in self.jobs}
+
+
+def load_now(jobs: dict[str, Job]) -> dict[str, Any]:
+    """Run ``jobs`` one after the other on this thread (no loading screen)."""
+    return {name: job() for name, job in jobs.items()}
+
+
+class LoadingView(arcade.View):
+    """A progress bar shown while a ``Preloader`` runs.
+
+    Args:
+        preloader: The jobs to wait for (started if it isn't yet).
+        on_ready: Called with the required results; returns the view to show.
+        title: Text above the progress bar.
+    """
+
+    BAR_WIDTH = 400
+    BAR_HEIGHT = 24
+
+    def __init__(self, preloader: Preloader, on_ready: Callable[[dict[str, Any]], arcade.View],
+                 title: str = "Loading..."):
+        super().__init__()
+        self.preloader = preloader.start()
+        self.on_ready = on_ready
+        self.background_color = arcade.color.BLACK
+        self.title = arcade.Text(title, 0, 0, arcade.color.WHITE, 20, anchor_x="center")
+        self.status = arcade.Text("", 0, 0, arcade.color.LIGHT_GRAY, 12, anchor_x="center")
+
+    def on_draw(self):
+        self.clear()
+        cx, cy = self.window.width / 2, self.window.height / 2
+        left, bottom = cx - self.BAR_WIDTH / 2, cy - self.BAR_HEIGHT / 2
+        arcade.draw_lbwh_rectangle_filled(left, bottom, self.BAR_WIDTH * self.preloader.progress,
+                                          self.BAR_HEIGHT, arcade.color.AMAZON)
+        arcade.draw_lbwh_rectangle_outline(left, bottom, self.BAR_WIDTH, self.BAR_HEIGHT,
+                                           arcade.color.WHITE, 2)
+        self.title.position = (cx, cy + self.BAR_HEIGHT)
+        self.title.draw()
+        self.status.text = f"{self.preloader.done} / {self.preloader.total}"
+        self.status.position = (cx, cy - self.BAR_HEIGHT * 1.5)
+        self.status.draw()
+
+    def on_update(self, delta_time: float):
+        if self.preloader.ready:
+            # A failed job raises its error here, on the main thread
+            self.window.show_view(self.on_ready(self.preloader.results()))
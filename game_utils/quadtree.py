@@ -0,0 +1,208 @@
+"""
+Loose quadtree for fast "what is near me?" questions.
+
+A normal quadtree stores each item in the smallest node that fully contains
+it, so items sitting on a node border get stuck near the root. A *loose*
+quadtree lets every node accept items that stick out a little (up to
+``looseness`` times the node size), so an item is placed by its center and
+size only. That keeps inserts and removals cheap and the tree shallow.
+
+Typical use in a game::
+
+    index = LooseQuadtree(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+    index.extend(mushroom_list)                  # bulk insert on spawn
+    nearby = index.query_around(player_sprite)   # only the close ones
+    index.remove(mushroom)                       # when it gets eaten
+
+Items are anything with ``left``, ``bottom``, ``right`` and ``top``
+attributes (every ``arcade.Sprite`` has them). Pass ``bounds=`` to use a
+different shape.
+"""
+from __future__ import annotations
+
+from typing import Callable, Iterable, Iterator
+
+Bounds = tuple[float, float, float, float]  # (left, bottom, right, top)
+
+
+def sprite_bounds(item) -> Bounds:
+    """Return ``(left, bottom, right, top)`` of a sprite-like object."""
+    return item.left, item.bottom, item.right, item.top
+
+
+class _Node:
+    """One square (or rectangular) cell of the tree."""
+
+    __slots__ = ("cx", "cy", "half_w", "half_h", "depth", "parent", "children", "items", "count")
+
+    def __init__(self, cx, cy, half_w, half_h, depth, parent):
+        self.cx = cx
+        self.cy = cy
+        self.half_w = half_w
+        self.half_h = half_h
+        self.depth = depth
+        self.parent = parent
+        self.children = None  # created lazily: [bottom-left, bottom-right, top-left, top-right]
+        self.items = {}       # item -> bounds stored in this node
+        self.count = 0        # items in this node and all nodes below it
+
+    def child_for(self, x, y):
+        """Return (creating if needed) the child quadrant containing (x, y)."""
+        if self.children is None:
+            qw = self.half_w / 2
+            qh = self.half_h / 2
+            d = self.depth + 1
+            self.children = [
+                _Node(self.cx - qw, self.cy - qh, qw, qh, d, self),
+                _Node(self.cx + qw, self.cy - qh, qw, qh, d, self),
+                _Node(self.cx - qw, self.cy + qh, qw, qh, d, self),
+                _Node(self.cx + qw, self.cy + qh, qw, qh, d, self),
+            ]
+        index = (1 if x >= self.cx else 0) + (2 if y >= self.cy else 0)
+        return self.children[index]
+
+
+class LooseQuadtree:
+    """Spatial index with O(log n) insert/remove and fast range queries.
+
+    Args:
+        left, bottom, right, top: Area covered by the tree (usually the window).
+            Items outside it still work; they are just kept near the root.
+        max_depth: How many times the area may be split in four.
+        looseness: How far (as a multiple of the node size) a node's area is
+            stretched when looking for overlaps. ``2.0`` is the classic value.
+        bounds: Function returning ``(left, bottom, right, top)`` for an item.
+    """
+
+    def __init__(
+        self,
+        left: float,
+        bottom: float,
+        right: float,
+        top: float,
+        max_depth: int = 8,
+        looseness: float = 2.0,
+        bounds: Callable[[object], Bounds] = sprite_bounds,
+    ):
+        if right <= left or top <= bottom:
+            raise ValueError("Quadtree area must have a positive width and height")
+        if looseness < 1.0:
+            raise ValueError("looseness must be >= 1.0")
+        self.max_depth = max_depth
+        self.looseness = looseness
+        self.bounds = bounds
+        self._root = _Node((left + right) / 2, (bottom + top) / 2,
+                           (right - left) / 2, (top - bottom) / 2, 0, None)
+        self._where = {}  # item -> node that holds it
+
+    # -------- size helpers --------
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, item) -> bool:
+        return item in self._where
+
+    def __iter__(self) -> Iterator:
+        return iter(self._where)
+
+    # -------- adding and removing --------
+    def _place(self, item, box: Bounds) -> None:
+        left, bottom, right, top = box
+        x = (left + right) / 2
+        y = (bottom + top) / 2
+        ext_x = (right - left) / 2
+        ext_y = (top - bottom) / 2
+        slack = self.looseness - 1.0
+
+        node = self._root
+        while node.depth < self.max_depth:
+            # Only descend while the center is inside this node's tight area...
+            if abs(x - node.cx) > node.half_w or abs(y - node.cy) > node.half_h:
+                break
+            # ...and the item still fits inside the child's loose margin.
+            if ext_x > node.half_w / 2 * slack or ext_y > node.half_h / 2 * slack:
+                break
+            node = node.child_for(x, y)
+
+        node.items[item] = box
+        self._where[item] = node
+        while node is not None:
+            node.count += 1
+            node = node.parent
+
+    def insert(self, item) -> None:
+        """Add one item (re-inserts it if it is already in the tree)."""
+        if item in self._where:
+            self.remove(item)
+        self._place(item, self.bounds(item))
+
+    def extend(self, items: Iterable) -> None:
+        """Bulk insert, e.g. all the mushrooms created by one spawn call."""
+        bounds = self.bounds
+        where = self._where
+        for item in items:
+            if item in where:
+                self.remove(item)
+            self._place(item, bounds(item))
+
+    def remove(self, item) -> None:
+        """Remove an item. Raises ``KeyError`` if it is not in the tree."""
+        node = self._where.pop(item)
+        del node.items[item]
+        while node is not None:
+            node.count -= 1
+            node = node.parent
+
+    def discard(self, item) -> None:
+        """Remove an item if present; do nothing otherwise."""
+        if item in self._where:
+            self.remove(item)
+
+    def update(self, item) -> None:
+        """Call after an item moved so the tree knows its new position."""
+        self.insert(item)
+
+    def clear(self) -> None:
+        """Remove everything (keeps the covered area and settings)."""
+        root = self._root
+        root.children = None
+        root.items = {}
+        root.count = 0
+        self._where.clear()
+
+    # -------- queries --------
+    def query(self, left: float, bottom: float, right: float, top: float) -> list:
+        """Return every item whose bounds overlap the given rectangle."""
+        found = []
+        slack = self.looseness
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.count == 0:
+                continue
+            # Loose area of this node; skip the whole branch if we miss it.
+            # The root is always visited because it also holds stray items.
+            if node.depth:
+                lw = node.half_w * slack
+                lh = node.half_h * slack
+                if (node.cx - lw > right or node.cx + lw < left
+                        or node.cy - lh > top or node.cy + lh < bottom):
+                    continue
+            for item, (l, b, r, t) in node.items.items():
+                if l <= right and r >= left and b <= top and t >= bottom:
+                    found.append(item)
+            if node.children is not None:
+                stack.extend(node.children)
+        return found
+
+    def query_around(self, item, margin: float = 0.0) -> list:
+        """Return items overlapping ``item``'s bounds (grown by ``margin``).
+
+        ``item`` itself is never part of the result, so this also works for
+        objects that are stored in the tree.
+        """
+        left, bottom, right, top = self.bounds(item)
+        found = self.query(left - margin, bottom - margin, right + margin, top + margin)
+        if item in self._where:
+            found = [other for other in found if other is not item]
+        return found
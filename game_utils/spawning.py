@@ -0,0 +1,261 @@
+"""
+Even spawn placement with Poisson-disk sampling.
+
+Picking every spawn with ``random.randint`` is quick, but nothing stops two
+mushrooms from landing on top of each other, or a piece of food from
+appearing right under the player or behind the score text. Retrying until a
+spot is "far enough" from everything gets slow once the board fills up.
+
+Bridson's algorithm gives an even spread where no two points are closer than
+``min_distance``, in time proportional to the number of points:
+
+1. A background grid with cells of ``min_distance / sqrt(2)`` holds the
+   points, so checking "is anything too close?" only looks at the 5x5 cells
+   around a candidate instead of at every point.
+2. Start from one point and keep an *active* list. For a random active point,
+   try up to ``tries`` candidates in the ring between ``min_distance`` and
+   ``2 * min_distance`` around it. Keep the first one that fits; if none fit,
+   that point is done and leaves the active list.
+
+Exclusion zones are ``(left, bottom, right, top)`` boxes where nothing may
+spawn: the player's area, walls, the HUD panel. They are bucketed into the
+same grid, so a candidate only checks the zones touching its own cell.
+
+Example from 11_sprite_collision.py::
+
+    points = spawn_points(
+        count, (50, 50, WINDOW_WIDTH - 50, WINDOW_HEIGHT - 50), SPAWN_SPACING,
+        exclude=[HUD_PANEL, around(self.player_sprite.position, PLAYER_CLEARANCE)],
+        existing=[m.position for m in self.mushroom_list],
+    )
+"""
+from __future__ import annotations
+
+import math
+import random
+from typing import Iterable
+
+from game_utils.quadtree import Bounds
+
+Point = tuple[float, float]
+
+DEFAULT_TRIES = 30  # Bridson's suggested number of candidates per active point
+
+
+def around(center: Point, radius: float) -> Bounds:
+    """Square exclusion zone of half-size ``radius`` around ``center``."""
+    x, y = center
+    return x - radius, y - radius, x + radius, y + radius
+
+
+class PoissonDiskSampler:
+    """Bridson Poisson-disk sampler over a rectangle with exclusion zones.
+
+    Args:
+        left, bottom, right, top: Area where points may be placed.
+        min_distance: Smallest allowed distance between two points.
+        exclude: Boxes ``(left, bottom, right, top)`` where no point may go.
+        clearance: Extra margin kept around every exclusion zone, e.g. the
+            radius of the thing being spawned so it doesn't poke into a wall.
+        tries: Candidates tried around each active point before giving up.
+        rng: A ``random.Random`` to use (defaults to the ``random`` module,
+            so ``random.seed`` makes the layout repeatable).
+    """
+
+    def __init__(
+        self,
+        left: float,
+        bottom: float,
+        right: float,
+        top: float,
+        min_distance: float,
+        exclude: Iterable[Bounds] = (),
+        clearance: float = 0.0,
+        tries: int = DEFAULT_TRIES,
+        rng: random.Random | None = None,
+    ):
+        if min_distance <= 0:
+            raise ValueError("min_distance must be positive")
+        self.area = (left, bottom, right, top)
+        self.min_distance = min_distance
+        self.clearance = clearance
+        self.tries = tries
+        self.rng = rng or random
+
+        self.cell_size = min_distance / math.sqrt(2)
+        self.cols = max(1, math.ceil((right - left) / self.cell_size))
+        self.rows = max(1, math.ceil((top - bottom) / self.cell_size))
+        self._grid = [None] * (self.cols * self.rows)  # row-major cells -> [points]
+        self._zones = {}   # (col, row) -> [zones touching that cell]
+        self._active = []
+        self.points: list[Point] = []
+
+        for zone in exclude:
+            self.exclude(zone)
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        left, bottom = self.area[0], self.area[1]
+        col = min(self.cols - 1, max(0, int((x - left) // self.cell_size)))
+        row = min(self.rows - 1, max(0, int((y - bottom) // self.cell_size)))
+        return col, row
+
+    def exclude(self, zone: Bounds) -> None:
+        """Add an exclusion zone (before calling ``fill``)."""
+        c = self.clearance
+        zone = (zone[0] - c, zone[1] - c, zone[2] + c, zone[3] + c)
+        c0, r0 = self._cell(zone[0], zone[1])
+        c1, r1 = self._cell(zone[2], zone[3])
+        for col in range(c0, c1 + 1):
+            for row in range(r0, r1 + 1):
+                self._zones.setdefault((col, row), []).append(zone)
+
+    def add(self, point: Point) -> None:
+        """Add an already placed point (e.g. food already on the board).
+
+        New points keep their distance from it, and the fill grows around it.
+        Points outside the area are ignored.
+        """
+        x, y = point
+        left, bottom, right, top = self.area
+        if not (left <= x <= right and bottom <= y <= top):
+            return
+        self._place(point)
+
+    def in_bounds(self, x: float, y: float) -> bool:
+        """True if ``(x, y)`` is inside the area and outside every exclusion zone."""
+        left, bottom, right, top = self.area
+        if not (left <= x <= right and bottom <= y <= top):
+            return False
+        for zone in self._zones.get(self._cell(x, y), ()):
+            if zone[0] <= x <= zone[2] and zone[1] <= y <= zone[3]:
+                return False
+        return True
+
+    def is_free(self, x: float, y: float) -> bool:
+        """True if a point could go at ``(x, y)`` (also far enough from the others)."""
+        # Same checks as in_bounds, inlined: this is the hot loop of fill()
+        left, bottom, right, top = self.area
+        if not (left <= x <= right and bottom <= y <= top):
+            return False
+        col = min(self.cols - 1, int((x - left) // self.cell_size))
+        row = min(self.rows - 1, int((y - bottom) // self.cell_size))
+        zones = self._zones.get((col, row))
+        if zones:
+            for zone in zones:
+                if zone[0] <= x <= zone[2] and zone[1] <= y <= zone[3]:
+                    return False
+        limit = self.min_distance * self.min_distance
+        grid = self._grid
+        cols = self.cols
+        c0, c1 = max(0, col - 2), min(cols, col + 3)
+        for r in range(max(0, row - 2), min(self.rows, row + 3)):
+            base = r * cols
+            for cell in grid[base + c0:base + c1]:
+                if cell is None:
+                    continue
+                for px, py in cell:
+                    dx = px - x
+                    dy = py - y
+                    if dx * dx + dy * dy < limit:
+                        return False
+        return True
+
+    def _place(self, point: Point) -> None:
+        col, row = self._cell(*point)
+        index = row * self.cols + col
+        if self._grid[index] is None:
+            self._grid[index] = [point]
+        else:
+            self._grid[index].append(point)
+        self.points.append(point)
+        self._active.append(point)
+
+    def random_point(self, spaced: bool = True) -> Point | None:
+        """A random free point, or ``None`` if ``tries`` attempts all failed.
+
+        With ``spaced=False`` only the area and exclusion zones are checked.
+        The point is not added; use ``add`` for that.
+        """
+        left, bottom, right, top = self.area
+        uniform = self.rng.uniform
+        check = self.is_free if spaced else self.in_bounds
+        for _ in range(self.tries):
+            x = uniform(left, right)
+            y = uniform(bottom, top)
+            if check(x, y):
+                return x, y
+        return None
+
+    def fill(self, limit: int | None = None) -> list[Point]:
+        """Add points until the area is full (or ``limit`` new points were added).
+
+        Returns only the new points. When the active list runs dry a few
+        random restarts are tried, so regions cut off by exclusion zones get
+        filled too.
+        """
+        new = []
+        rng = self.rng
+        r = self.min_distance
+        while limit is None or len(new) < limit:
+            if not self._active:
+                seed = self.random_point()
+                if seed is None:
+                    break
+                self._place(seed)
+                new.append(seed)
+                continue
+
+            index = rng.randrange(len(self._active))
+            px, py = self._active[index]
+            for _ in range(self.tries):
+                angle = rng.uniform(0, math.tau)
+                distance = rng.uniform(r, 2 * r)
+                x = px + distance * math.cos(angle)
+                y = py + distance * math.sin(angle)
+                if self.is_free(x, y):
+                    self._place((x, y))
+                    new.append((x, y))
+                    break
+            else:
+                # Nothing fits around this point any more: swap-remove it
+                self._active[index] = self._active[-1]
+                self._active.pop()
+        return new
+
+
+def spawn_points(
+    count: int,
+    area: Bounds,
+    min_distance: float,
+    exclude: Iterable[Bounds] = (),
+    existing: Iterable[Point] = (),
+    clearance: float = 0.0,
+    rng: random.Random | None = None,
+) -> list[Point]:
+    """Up to ``count`` evenly spread spawn points inside ``area``.
+
+    The whole free area is filled once and ``count`` points are picked from
+    the fill at random, so they are spread over the board instead of bunched
+    around the first point. ``existing`` points (things already on the board)
+    are kept at ``min_distance`` too.
+
+    If the board is too crowded for ``count`` more points at that spacing,
+    the rest are placed at random free spots that only avoid the exclusion
+    zones, so pressing SPACE a hundred times still adds a hundred mushrooms.
+    """
+    rng = rng or random
+    sampler = PoissonDiskSampler(*area, min_distance, exclude=exclude,
+                                 clearance=clearance, rng=rng)
+    for point in existing:
+        sampler.add(point)
+    points = sampler.fill()
+    if len(points) >= count:
+        return rng.sample(points, count)
+
+    # Crowded: keep the zones but drop the spacing for the leftovers
+    while len(points) < count:
+        point = sampler.random_point(spaced=False)
+        if point is None:
+            break
+        points.append(point)
+    return points
@@ -0,0 +1,80 @@
+"""
+Sprite sheets decoded once, sliced once.
+
+17_gforce_spritesheet.py used to open each sheet with PIL just to read its
+size, decode it again with ``arcade.load_spritesheet`` and slice it into
+frames, every time a character was created. ``SpriteSheetCache`` does each
+step only once per program:
+
+- a sheet file is decoded once, and its size is read from that decoded image;
+- the list of frames for a ``(path, frame size)`` pair is sliced once and
+  handed out again on later calls.
+
+::
+
+    frames = SPRITE_SHEETS.strip("assets/.../Blue Idle - no slime.png", 32, 32)
+    SPRITE_SHEETS.hits, SPRITE_SHEETS.misses    # 0, 1 -> 1, 1 on the next call
+"""
+from __future__ import annotations
+
+import os
+
+import arcade
+from PIL import Image
+
+
+class SpriteSheetCache:
+    """Decoded sprite sheets by path, and their frames by ``(path, frame size)``."""
+
+    def __init__(self):
+        self._sheets: dict[str, arcade.SpriteSheet] = {}
+        self._grids: dict[tuple[str, int, int], list[arcade.Texture]] = {}
+        self.hits = self.misses = 0
+        self.decodes = 0
+
+    def sheet(self, path: str) -> arcade.SpriteSheet:
+        """The decoded sheet at ``path`` (read from disk the first time only)."""
+        key = os.path.normpath(path)
+        sheet = self._sheets.get(key)
+        if sheet is None:
+            with Image.open(path) as image:
+                sheet = arcade.SpriteSheet(image=image.convert("RGBA"))
+            self.decodes += 1
+            self._sheets[key] = sheet
+        return sheet
+
+    def strip(self, path: str, frame_width: int | None = None,
+              frame_height: int | None = None) -> list[arcade.Texture]:
+        """Frames of a sheet, left to right and top to bottom.
+
+        Without a frame size the frames are squares as tall as the image
+        (one horizontal strip). Returns a new list, but the textures in it
+        are shared by every caller.
+        """
+        sheet = self.sheet(path)
+        width, height = sheet.image.size
+        frame_width = frame_width or height
+        frame_height = frame_height or height
+        key = (os.path.normpath(path), frame_width, frame_height)
+        frames = self._grids.get(key)
+        if frames is not None:
+            self.hits += 1
+            return list(frames)
+
+        self.misses += 1
+        columns = max(1, width // frame_width)
+        rows = max(1, height // frame_height)
+        frames = sheet.get_texture_grid(size=(frame_width, frame_height),
+                                        columns=columns, count=columns * rows)
+        self._grids[key] = frames
+        return list(frames)
+
+    def clear(self) -> None:
+        """Forget every sheet and frame list and reset the counters."""
+        self._sheets.clear()
+        self._grids.clear()
+        self.hits = self.misses = self.decodes = 0
+
+
+# One cache for the whole program, shared by every character
+SPRITE_SHEETS = SpriteSheetCache()
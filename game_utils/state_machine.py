@@ -0,0 +1,192 @@
+"""
+Animation state machines written as a table instead of an if/else chain.
+
+A character like the slime in 15_slime_animation.py is always in one *state*
+(idle, resting, walking left, very tired, ...) and each state shows one
+*clip*. It leaves a state for two reasons:
+
+- the input changes (an arrow key is pressed or let go), or
+- it has been in the state for long enough (5 seconds idle -> rest).
+
+Instead of checking every rule on every frame, the rules are written down
+once as data and *compiled* into a transition table::
+
+    STATES = {
+        "IDLE": State("IDLE", on={"left": "WALK_L", "right": "WALK_R"},
+                      after=[(5.0, "REST")]),
+        "REST": State("IDLE_SLOW", on={"left": "WALK_L", "right": "WALK_R"}),
+        ...
+    }
+    TABLE = compile_machine(STATES, initial="REST")
+    machine = StateMachine(TABLE)
+    if machine.update(delta_time, "left"):   # True when the state changed
+        sprite.textures = clips[machine.clip]
+
+At run time a frame costs two comparisons: "is this input different from the
+last one?" and "has the next timer run out?". The table lookup, the new clip
+and the next timer's deadline are only worked out when one of them says yes.
+
+Timers count from when the state was entered. States can share a *group*;
+a group's timers keep counting while the machine moves between states of the
+group (walking left, walking right and short stops are all "walking", and
+15 seconds of walking make the slime tired, whichever way it went).
+"""
+from __future__ import annotations
+
+import math
+from typing import NamedTuple, Sequence
+
+
+class State(NamedTuple):
+    clip: str                                   # name of the clip this state shows
+    on: dict | None = None                      # input -> next state
+    after: Sequence[tuple[float, str]] = ()     # (seconds in this state, next state)
+    group: str | None = None                    # states whose group timers are shared
+
+
+class TransitionTable(NamedTuple):
+    names: list[str]                            # state index -> name
+    clips: list[str]                            # state index -> clip name
+    groups: list[str | None]                    # state index -> group
+    on: list[dict[str, int]]                    # state index -> {input: next state index}
+    timers: list[list[tuple[float, int, bool]]]  # (seconds, next state, counted from group entry?)
+    initial: int
+
+    def index(self, name: str) -> int:
+        return self.names.index(name)
+
+
+def compile_machine(
+    states: dict[str, State],
+    initial: str,
+    group_timers: dict[str, Sequence[tuple[float, str]]] | None = None,
+) -> TransitionTable:
+    """Check a state machine spec and turn it into a ``TransitionTable``.
+
+    Args:
+        states: State name -> ``State``.
+        initial: Name of the state to start in.
+        group_timers: Group name -> ``(seconds in the group, next state)`` timers.
+
+    Raises:
+        ValueError: A transition leads to an unknown state or group, a timer
+            isn't positive or a group timer stays in its group, or one input
+            would send the machine round in a circle forever.
+    """
+    group_timers = group_timers or {}
+    names = list(states)
+    index = {name: i for i, name in enumerate(names)}
+
+    def target(source: str, name: str) -> int:
+        if name not in index:
+            raise ValueError(f"State {source!r} leads to unknown state {name!r}")
+        return index[name]
+
+    def timer(source: str, seconds: float, name: str, from_group: bool) -> tuple[float, int, bool]:
+        if seconds <= 0:
+            raise ValueError(f"Timer of {source!r} must be positive, got {seconds}")
+        return (seconds, target(source, name), from_group)
+
+    known_groups = {state.group for state in states.values()}
+    for group, group_after in group_timers.items():
+        if group not in known_groups:
+            raise ValueError(f"Timers for group {group!r}, which no state belongs to")
+        for _, to in group_after:
+            if to in states and states[to].group == group:
+                raise ValueError(f"Timer of group {group!r} must lead out of the group, not to {to!r}")
+
+    on, timers = [], []
+    for name, state in states.items():
+        on.append({key: target(name, to) for key, to in (state.on or {}).items()})
+        own = [timer(name, seconds, to, False) for seconds, to in state.after]
+        shared = [timer(state.group, seconds, to, True) for seconds, to in group_timers.get(state.group, ())]
+        timers.append(own + shared)
+
+    # Entering a state re-checks the input that is already held, so an input
+    # must not lead back to a state it has already passed through
+    inputs = {key for table in on for key in table}
+    for key in inputs:
+        for start in range(len(names)):
+            seen, state = {start}, on[start].get(key)
+            while state is not None:
+                if state in seen:
+                    raise ValueError(f"Input {key!r} loops forever from state {names[start]!r}")
+                seen.add(state)
+                state = on[state].get(key)
+
+    return TransitionTable(
+        names=names,
+        clips=[state.clip for state in states.values()],
+        groups=[state.group for state in states.values()],
+        on=on,
+        timers=timers,
+        initial=target("initial", initial),
+    )
+
+
+class StateMachine:
+    """One character's place in a ``TransitionTable``.
+
+    The machine keeps its own clock (seconds since it was created) and
+    remembers when the current state and group were entered.
+
+    Args:
+        table: The compiled spec, usually shared by every character.
+    """
+
+    def __init__(self, table: TransitionTable):
+        self.table = table
+        self.clock = 0.0
+        self.input = None
+        self.state = table.initial
+        self.state_since = self.group_since = 0.0
+        self._deadline = math.inf
+        self._timer_target = table.initial
+        self._enter(table.initial)
+
+    @property
+    def name(self) -> str:
+        return self.table.names[self.state]
+
+    @property
+    def clip(self) -> str:
+        return self.table.clips[self.state]
+
+    def time_in_state(self) -> float:
+        return self.clock - self.state_since
+
+    def update(self, delta_time: float, key) -> bool:
+        """Advance the clock and react to the input ``key``.
+
+        Returns True if the machine is in a different state than before.
+        """
+        self.clock += delta_time
+        before = self.state
+        if key != self.input:
+            self.input = key
+            to = self.table.on[self.state].get(key)
+            if to is not None:
+                self._enter(to)
+        while self.clock >= self._deadline:
+            self._enter(self._timer_target)
+        return self.state != before
+
+    def _enter(self, state: int) -> None:
+        table = self.table
+        group = table.groups[state]
+        if group is None or group != table.groups[self.state]:
+            self.group_since = self.clock
+        self.state = state
+        self.state_since = self.clock
+
+        # Only the timer that runs out first matters until the state changes
+        self._deadline, self._timer_target = math.inf, state
+        for seconds, to, from_group in table.timers[state]:
+            deadline = (self.group_since if from_group else self.clock) + seconds
+            if deadline < self._deadline:
+                self._deadline, self._timer_target = deadline, to
+
+        # An input that is already held acts straight away
+        to = table.on[state].get(self.input)
+        if to is not None:
+            self._enter(to)
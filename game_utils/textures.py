@@ -0,0 +1,53 @@
+"""
+Downscaled pictures for sprites drawn much smaller than they are.
+
+The obstacle pictures in 23_obstacle_spawning.py are 2500x2500 pixels but
+are drawn at ``scale=0.04``, i.e. 100x100. ``arcade.load_texture`` would
+decode about 25 MB of pixels for each of them and keep them all in memory.
+
+``load_scaled_image`` shrinks each picture to its on-screen size straight
+after decoding; the full-size pixels are dropped right away.
+
+- If ``python -m game_utils.asset_pipeline`` has been run, a ready-made
+  small copy is decoded instead of the 2500x2500 original.
+- The shrunk pixels are kept on disk (``pixel_cache.py``); later runs map
+  them straight into memory without decoding anything.
+
+The sprite atlases (``atlas.py``) pack these small pictures, so sprites
+using them are drawn at ``scale=1``::
+
+    image = load_scaled_image("assets/03.png", 0.04)   # 100x100
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+from PIL import Image
+
+from game_utils.asset_pipeline import find_variant, scaled_size
+from game_utils.pixel_cache import PIXEL_CACHE
+
+
+def load_scaled_image(path: str | Path, scale: float) -> Image.Image:
+    """Decode ``path`` and shrink it to ``scale`` of its size (RGBA).
+
+    The shrunk pixels are kept in the pixel cache (``pixel_cache.py``), so
+    this only decodes anything the first time. If the asset pipeline has
+    built a smaller copy that is still big enough, that copy is decoded
+    instead of the original.
+    """
+    with Image.open(path) as original:
+        target = scaled_size(original.size, scale)
+    return PIXEL_CACHE.load(path, target, lambda: _decode_scaled(path, scale, target))
+
+
+def _decode_scaled(path: str | Path, scale: float, target: tuple[int, int]) -> Image.Image:
+    with Image.open(find_variant(path, scale).path) as image:
+        if image.size != target:
+            # JPEGs can skip most of the work while decoding; PNGs ignore this
+            image.draft("RGBA", target)
+        image = image.convert("RGBA")
+    if image.size != target:
+        # reducing_gap: shrink quickly by whole factors first, then filter nicely
+        image = image.resize(target, Image.Resampling.LANCZOS, reducing_gap=3.0)
+    return image
@@ -0,0 +1,151 @@
+"""
+Spawn timeline: decide *when* things spawn ahead of time, from a seed.
+
+A spawn timer that adds up ``delta_time`` every frame has two problems: the
+result depends on the frame rate (a long frame spawns one obstacle late
+instead of two on time), and there is no way to replay or preview a run.
+
+``SpawnTimeline`` turns a seed and a *difficulty curve* into a list of spawn
+events sorted by time, kept in a heap:
+
+- The curve is a function ``seconds since start -> seconds until the next
+  spawn``; ``constant``, ``ramp`` and ``exponential`` make common ones.
+- Events are generated in time order from one ``random.Random(seed)``, so the
+  same seed always gives the same obstacles at the same times, no matter how
+  the frames fall.
+- ``advance(delta_time)`` returns every event whose time has come, oldest
+  first. After a long frame that can be several; each event knows its exact
+  time, so the game can place it where it *would* be by now.
+- ``upcoming(seconds)`` previews events without using them up, and calling
+  ``advance`` with a big step fast-forwards without drawing anything.
+
+Example from 23_obstacle_spawning.py::
+
+    timeline = SpawnTimeline(variants=13, curve=ramp(2.0, 1.0, 120), seed=SPAWN_SEED)
+    for event in timeline.advance(delta_time):
+        late = timeline.time - event.time    # seconds since it should have spawned
+        ...
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import random
+from typing import Callable, NamedTuple
+
+Curve = Callable[[float], float]
+
+DEFAULT_LOOKAHEAD = 10.0  # seconds of events generated in advance
+
+
+class SpawnEvent(NamedTuple):
+    time: float   # seconds since the start of the run
+    variant: int  # which kind of thing to spawn (e.g. texture index)
+
+
+def constant(interval: float) -> Curve:
+    """Difficulty curve with the same gap between all spawns."""
+    return lambda t: interval
+
+
+def ramp(start: float, end: float, over: float) -> Curve:
+    """Gap shrinks (or grows) linearly from ``start`` to ``end`` during ``over`` seconds."""
+    def curve(t: float) -> float:
+        if t >= over:
+            return end
+        return start + (end - start) * t / over
+    return curve
+
+
+def exponential(start: float, end: float, over: float) -> Curve:
+    """Gap changes by the same *factor* every second, from ``start`` to ``end``.
+
+    Good for stress tests: the spawn rate doubles at a steady pace instead of
+    creeping up slowly and then exploding at the end like ``ramp``.
+    """
+    def curve(t: float) -> float:
+        if t >= over:
+            return end
+        return start * (end / start) ** (t / over)
+    return curve
+
+
+class SpawnTimeline:
+    """Seeded, precomputed spawn events played back against a clock.
+
+    Args:
+        variants: Number of different things to spawn; each event gets a
+            random ``variant`` in ``range(variants)``.
+        curve: Seconds between spawns as a function of the time of the
+            previous spawn.
+        seed: Seed for the random choices. ``None`` picks one at random; the
+            chosen seed is kept in ``self.seed`` so the run can be replayed.
+        jitter: Random extra gap, as a fraction of the curve (0.2 = up to 20%
+            longer).
+        lookahead: How many seconds of events to keep generated ahead of the
+            clock.
+    """
+
+    def __init__(
+        self,
+        variants: int,
+        curve: Curve = constant(2.0),
+        seed: int | None = None,
+        jitter: float = 0.0,
+        lookahead: float = DEFAULT_LOOKAHEAD,
+    ):
+        if variants < 1:
+            raise ValueError("variants must be at least 1")
+        self.variants = variants
+        self.curve = curve
+        self.jitter = jitter
+        self.lookahead = lookahead
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.reset()
+
+    def reset(self) -> None:
+        """Rewind to time 0; the same seed gives the same events again."""
+        self._rng = random.Random(self.seed)
+        self._heap = []             # (time, order, event)
+        self._order = itertools.count()
+        self._next_time = self._gap(0.0)
+        self.time = 0.0
+        self.emitted = 0
+
+    def _gap(self, t: float) -> float:
+        gap = self.curve(t)
+        if gap <= 0:
+            raise ValueError(f"Difficulty curve must stay positive (got {gap} at t={t})")
+        if self.jitter:
+            gap *= 1 + self._rng.random() * self.jitter
+        return t + gap
+
+    def _generate(self, until: float) -> None:
+        while self._next_time <= until:
+            t = self._next_time
+            event = SpawnEvent(t, self._rng.randrange(self.variants))
+            heapq.heappush(self._heap, (t, next(self._order), event))
+            self._next_time = self._gap(t)
+
+    def schedule(self, time: float, variant: int) -> SpawnEvent:
+        """Add an extra event (e.g. a scripted one) to the timeline."""
+        event = SpawnEvent(time, variant)
+        heapq.heappush(self._heap, (time, next(self._order), event))
+        return event
+
+    def advance(self, delta_time: float) -> list[SpawnEvent]:
+        """Move the clock forward and return every event that is now due."""
+        self.time += delta_time
+        self._generate(self.time + self.lookahead)
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= self.time:
+            due.append(heapq.heappop(heap)[2])
+        self.emitted += len(due)
+        return due
+
+    def upcoming(self, seconds: float) -> list[SpawnEvent]:
+        """Events due in the next ``seconds``, without using them up."""
+        until = self.time + seconds
+        self._generate(until)
+        return [entry[2] for entry in sorted(self._heap) if entry[0] <= until]
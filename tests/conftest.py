@@ -0,0 +1,14 @@
+"""
+Shared pytest setup.
+
+The example scripts import helpers from the ``game_utils`` package in the repo
+root. Make sure that folder is importable no matter where pytest is started.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
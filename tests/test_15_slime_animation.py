@@ -0,0 +1,118 @@
+import importlib.util
+import pathlib
+import tempfile
+
+import pytest
+
+STEP = 1 / 60
+BUNDLE_FOLDER = None   # set by the bundle_folder fixture
+
+
+def load_module_from_path(path: pathlib.Path):
+    spec = importlib.util.spec_from_file_location(path.stem, str(path))
+    module = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    spec.loader.exec_module(module)  # type: ignore[attr-defined]
+    return module
+
+
+def load_game():
+    try:
+        import arcade  # noqa: F401
+    except Exception as e:  # pragma: no cover - environment specific
+        pytest.skip(f"arcade not available: {e}")
+    root = pathlib.Path(__file__).resolve().parents[1]
+    module = load_module_from_path(root / "15_slime_animation.py")
+    module.BUNDLE_FOLDER = BUNDLE_FOLDER
+    return module
+
+
+@pytest.fixture(scope="module", autouse=True)
+def bundle_folder():
+    """Build the slime bundle in a temporary folder, so assets/ is left alone."""
+    global BUNDLE_FOLDER
+    with tempfile.TemporaryDirectory() as tmp:
+        BUNDLE_FOLDER = tmp
+        yield tmp
+
+
+def play(slime, seconds, change_x=0.0, change_y=0.0):
+    """Run ``seconds`` of frames with the given input, like GameView does."""
+    states = []
+    for _ in range(round(seconds / STEP)):
+        slime.change_x = 0 if slime.is_tired_active else change_x
+        slime.change_y = 0 if slime.is_tired_active else change_y
+        slime.update_animation(STEP)
+        states.append(slime.state)
+    return states
+
+
+def test_15_idle_rest_walk_tired_cycle():
+    mod = load_game()
+    slime = mod.AnimatedSlime()
+    assert slime.state == "REST"
+    assert slime.textures is slime.idle_slow_textures
+
+    # Walking right, with a pause shorter than the grace time
+    assert play(slime, 1.0, change_x=mod.MOVE_SPEED)[-1] == "WALK_R"
+    assert slime.textures is slime.walk_right_textures
+    assert "IDLE" not in play(slime, mod.MOVE_BREAK_GRACE / 2)
+    assert play(slime, 1.0, change_x=-mod.MOVE_SPEED)[-1] == "WALK_L"
+
+    # Standing still: idle after the grace time, resting after the rest delay
+    states = play(slime, mod.ANIM_IDLE_REST_DELAY - 0.2)
+    assert states[-1] == "IDLE"
+    assert slime.textures is slime.idle_textures
+    assert play(slime, 0.5)[-1] == "REST"
+
+    # Up/down alone walks the way the slime last faced
+    assert play(slime, 0.5, change_y=mod.MOVE_SPEED)[-1] == "WALK_L"
+
+    # Walking (either way) for too long: very tired, and input is ignored
+    assert play(slime, 1.0)[-1] == "IDLE"
+    states = play(slime, mod.TIRED_WALK_DELAY + 0.1, change_x=mod.MOVE_SPEED)
+    assert "TIRED" not in states[: round((mod.TIRED_WALK_DELAY - 0.1) / STEP)]
+    assert states[-1] == "TIRED" and slime.is_tired_active
+    assert slime.textures is slime.tired_textures
+    states = play(slime, mod.TIRED_LOCK_DURATION - 0.5, change_x=mod.MOVE_SPEED)
+    assert set(states) == {"TIRED"}
+
+    # After the lock the slime reacts to the keys again
+    states = play(slime, 1.0, change_x=mod.MOVE_SPEED)
+    assert states[-1] == "WALK_R" and not slime.is_tired_active
+
+
+def test_15_texture_is_only_set_on_new_frames_and_states():
+    mod = load_game()
+    sets = []
+
+    class CountingSlime(mod.AnimatedSlime):
+        @mod.AnimatedSlime.texture.setter
+        def texture(self, value):
+            sets.append(value)
+            mod.arcade.Sprite.texture.fset(self, value)
+
+    slime = CountingSlime()
+    sets.clear()
+    play(slime, 2.0, change_x=mod.MOVE_SPEED)
+    # The switch to walking plus one texture per walk frame, not one per update
+    assert len(sets) <= 1 + 2.0 / mod.ANIM_WALK_FRAME_TIME
+
+
+def test_15_gif_clips_decode_only_the_frames_shown():
+    mod = load_game()
+    from game_utils.gif_clips import GIF_CLIPS
+
+    GIF_CLIPS.clear()
+    mod.USE_GIF_CLIPS = True
+    slime = mod.AnimatedSlime()
+    assert slime.state == "REST"
+    assert GIF_CLIPS.stats.misses == 1          # only the first resting frame
+    rest = slime.idle_slow_textures
+    play(slime, rest.length)                    # one loop of the GIF's own frame times
+    assert GIF_CLIPS.stats.misses == len(rest)
+    assert GIF_CLIPS.opens == 1
+    play(slime, 1.0, change_x=mod.MOVE_SPEED)
+    assert slime.textures is slime.walk_right_textures
+    # The tired and idle clips were never shown, so never decoded
+    assert GIF_CLIPS.stats.entries == len(rest) + len(slime.walk_right_textures)
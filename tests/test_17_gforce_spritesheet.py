@@ -33,3 +33,60 @@ def test_17_module_imports_and_textures_load():
     jump_tex = mod.load_strip_spritesheet(mod.JUMP_SHEET)
     assert isinstance(idle_tex, list) and len(idle_tex) > 0
     assert isinstance(jump_tex, list) and len(jump_tex) > 0
+
+
+def test_17_repeated_loads_hit_the_sheet_cache():
+    root = pathlib.Path(__file__).resolve().parents[1]
+    try:
+        import arcade  # noqa: F401
+    except Exception as e:  # pragma: no cover - environment specific
+        pytest.skip(f"arcade not available: {e}")
+
+    mod = load_module_from_path(root / "17_gforce_spritesheet.py")
+    cache = mod.SPRITE_SHEETS
+    cache.clear()
+
+    first = mod.AnimatedCharacter()
+    assert (cache.decodes, cache.misses, cache.hits) == (2, 2, 0)
+
+    # A second character reuses both decoded sheets and both frame grids
+    second = mod.AnimatedCharacter()
+    assert (cache.decodes, cache.misses, cache.hits) == (2, 2, 2)
+    assert second.idle_textures[0] is first.idle_textures[0]
+    assert second.jump_textures is not first.jump_textures  # own list, shared textures
+
+    # The automatic frame size (image height) is the same 32x32 grid
+    mod.load_strip_spritesheet(mod.IDLE_SHEET)
+    assert cache.hits == 3
+
+    # Another frame size is sliced again, from the already decoded sheet
+    mod.load_strip_spritesheet(mod.IDLE_SHEET, 16, 16)
+    assert (cache.decodes, cache.misses) == (2, 3)
+
+
+def test_17_missing_jump_sheet_still_uses_jump_speed():
+    root = pathlib.Path(__file__).resolve().parents[1]
+    try:
+        import arcade  # noqa: F401
+    except Exception as e:  # pragma: no cover - environment specific
+        pytest.skip(f"arcade not available: {e}")
+
+    mod = load_module_from_path(root / "17_gforce_spritesheet.py")
+    character = mod.AnimatedCharacter()
+    character.jump_textures = []   # as if the jump sheet were missing
+
+    character.on_ground = True
+    character.set_anim_state()
+    assert character.clock.base_time == mod.IDLE_FRAME_TIME
+
+    # In the air the idle frames are kept, but timed like the jump
+    character.on_ground = False
+    character.vertical_speed = 5.0
+    character.set_anim_state()
+    assert character.textures is character.idle_textures
+    assert character.clock.base_time == mod.JUMP_FRAME_TIME
+
+    character.on_ground = True
+    character.vertical_speed = 0.0
+    character.set_anim_state()
+    assert character.clock.base_time == mod.IDLE_FRAME_TIME
@@ -0,0 +1,74 @@
+"""
+Tests for game_utils/anim_bundle.py (prebaked animation bundles).
+Uses small generated frame folders in a temporary folder; no window is opened.
+"""
+from __future__ import annotations
+
+import importlib.util
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ARCADE_AVAILABLE = importlib.util.find_spec("arcade") is not None
+
+
+@unittest.skipUnless(ARCADE_AVAILABLE, "Arcade not installed; skipping animation bundle tests")
+class TestAnimationBundle(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name) / "HERO"
+        self.out = Path(self.tmp.name) / "out"
+        # WALK frames 1..11 are shaded by number, so their order can be checked
+        for i in range(1, 12):
+            self.frame("WALK", f"Hero_W{i}.png", (i * 20, 0, 0, 255))
+        self.frame("IDLE", "Hero_I1.png", (0, 255, 0, 255), size=(8, 12))
+        (self.root / "Gif").mkdir()  # not a clip: no Frame folder
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def frame(self, clip, name, color, size=(10, 10)):
+        from PIL import Image
+        folder = self.root / clip / "Frame"
+        folder.mkdir(parents=True, exist_ok=True)
+        Image.new("RGBA", size, color).save(folder / name)
+
+    def test_natural_order(self):
+        from game_utils.anim_bundle import natural_key
+        names = ["a10.png", "a2.png", "a1.png", "b.png"]
+        self.assertEqual(sorted(names, key=natural_key), ["a1.png", "a2.png", "a10.png", "b.png"])
+
+    def test_clips_frames_and_durations(self):
+        from game_utils.anim_bundle import AnimationBundle, build_bundle
+        manifest = build_bundle("hero", self.root, {"WALK": 0.12}, self.out)
+        bundle = AnimationBundle(manifest)
+        self.assertEqual(sorted(bundle.clips), ["IDLE", "WALK"])
+        walk = bundle["WALK"]
+        self.assertEqual([t.image.getpixel((5, 5))[0] for t in walk.textures],
+                         [i * 20 for i in range(1, 12)])
+        self.assertEqual(walk.durations, [0.12] * 11)
+        self.assertAlmostEqual(walk.length, 1.32)
+        self.assertEqual(bundle["IDLE"].textures[0].size, (8, 12))
+        self.assertEqual(bundle.textures("JUMP"), [])
+        self.assertEqual(len(list(self.out.glob("*.png"))), 1)
+
+    def test_load_is_shared_and_rebuilds_when_frames_change(self):
+        from game_utils import anim_bundle
+        first = anim_bundle.load_bundle("hero", self.root, folder=self.out)
+        self.assertIs(anim_bundle.load_bundle("hero", self.root, folder=self.out), first)
+        self.frame("IDLE", "Hero_I2.png", (0, 0, 255, 255))
+        anim_bundle._LOADED.clear()
+        again = anim_bundle.load_bundle("hero", self.root, folder=self.out)
+        self.assertEqual(len(again["IDLE"].textures), 2)
+        anim_bundle._LOADED.clear()
+
+    def test_missing_frames_raise(self):
+        from game_utils.anim_bundle import build_bundle
+        with self.assertRaises(FileNotFoundError):
+            build_bundle("none", os.path.join(self.tmp.name, "missing"), folder=self.out)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Tests for game_utils/animation.py (FrameClock, PhaseClock).
+Clocks only count frames, so neither a window nor Arcade is needed.
+"""
+from __future__ import annotations
+
+import unittest
+
+from game_utils.animation import FrameClock, PhaseClock
+
+
+class ReferenceAnimation:
+    """Frame timing that keeps the leftover time, one frame at a time."""
+
+    def __init__(self, length, frame_time):
+        self.length, self.frame_time = length, frame_time
+        self.elapsed = 0.0
+        self.frame = 0
+
+    def update(self, delta_time):
+        self.elapsed += delta_time
+        while self.elapsed >= self.frame_time:
+            self.elapsed -= self.frame_time
+            self.frame = (self.frame + 1) % self.length
+
+
+class TestFrameClock(unittest.TestCase):
+    def test_keeps_the_remainder(self):
+        clock = FrameClock(0.25, 4)
+        self.assertFalse(clock.advance(0.2))
+        self.assertTrue(clock.advance(0.1))      # 0.3 s: frame 1, 0.05 s into it
+        self.assertEqual(clock.frame, 1)
+        self.assertAlmostEqual(clock.elapsed, 0.05)
+
+    def test_long_update_moves_several_frames(self):
+        clock = FrameClock(0.25, 4)
+        self.assertTrue(clock.advance(0.8))      # 3 frames and 0.05 s
+        self.assertEqual(clock.frame, 3)
+        self.assertFalse(clock.advance(1.0))     # a whole loop: same frame again
+        self.assertEqual(clock.frame, 3)
+
+    def test_keeps_its_speed_at_any_frame_rate(self):
+        for fps in (60, 24, 13, 7):
+            clock, reference = FrameClock(0.12, 1000), ReferenceAnimation(1000, 0.12)
+            for _ in range(fps * 6):
+                clock.advance(1 / fps)
+                reference.update(1 / fps)
+            # 6 seconds of 0.12 s frames is 50 frames, whatever the frame rate
+            self.assertIn(clock.frame, (49, 50))
+            self.assertEqual(clock.frame, reference.frame)
+
+    def test_per_frame_times(self):
+        clock = FrameClock([0.1, 0.3, 0.1], 3)
+        self.assertEqual(clock.frame_time, 0.1)
+        self.assertTrue(clock.advance(0.15))     # into the long frame
+        self.assertEqual((clock.frame, clock.frame_time), (1, 0.3))
+        self.assertFalse(clock.advance(0.2))
+        self.assertFalse(clock.advance(1.0))     # two whole loops: same frame again
+        self.assertTrue(clock.advance(0.1))      # 0.35 s into the 0.3 s frame
+        self.assertEqual(clock.frame, 2)
+        self.assertAlmostEqual(clock.elapsed, 0.05)
+        with self.assertRaises(ValueError):
+            FrameClock([0.1, 0.2], 3)
+
+    def test_switch_keeps_frame_and_time(self):
+        clock = FrameClock(0.25, 6, frame=5, elapsed=0.1)
+        clock.switch(0.5, 4)
+        self.assertEqual((clock.frame, clock.elapsed, clock.length), (1, 0.1, 4))
+        with self.assertRaises(ValueError):
+            clock.switch(0.5, 0)
+
+    def test_phase_clock_syncs_every_sprite_on_a_clip(self):
+        phase = PhaseClock()
+        phase.tick(0.6)
+        late = FrameClock(0.25, 4, phase=phase)
+        early = FrameClock(0.25, 4, frame=3, elapsed=0.2, phase=phase)
+        self.assertEqual((late.frame, early.frame), (2, 2))
+        phase.tick(0.5)                          # 1.1 s: frame 4 -> 0
+        self.assertTrue(late.advance(0.5))
+        self.assertTrue(early.advance(0.5))
+        self.assertEqual((late.frame, early.frame), (0, 0))
+        phase.tick(0.1)
+        self.assertFalse(late.advance(0.1))
+        gif = FrameClock((0.1, 0.3, 0.1), 3, phase=phase)   # 1.2 s: 0.2 s into the 2nd loop
+        self.assertEqual(gif.frame, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
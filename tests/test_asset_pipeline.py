@@ -0,0 +1,99 @@
+"""
+Tests for game_utils/asset_pipeline.py (small copies of big pictures and finding them).
+Uses small generated images in a temporary folder; no window is opened.
+"""
+from __future__ import annotations
+
+import ast
+import importlib.util
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
+ARCADE_AVAILABLE = importlib.util.find_spec("arcade") is not None
+
+
+@unittest.skipUnless(PIL_AVAILABLE, "Pillow not installed; skipping asset pipeline tests")
+class TestAssetPipeline(unittest.TestCase):
+    def setUp(self):
+        from game_utils import asset_pipeline
+
+        self.ap = asset_pipeline
+        self.tmp = tempfile.TemporaryDirectory()
+        assets = Path(self.tmp.name) / "assets"
+        assets.mkdir()
+        self.path = assets / "disk.png"
+        self.draw_disk((255, 0, 0, 255))
+        self.manifest = assets / "texture_manifest.json"
+        self.manifest.write_text(json.dumps({"textures": {
+            "assets/disk.png": [{"script": "a.py", "scale": 0.1}, {"script": "b.py", "scale": 0.25}],
+        }}))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def draw_disk(self, color):
+        from PIL import Image, ImageDraw
+        image = Image.new("RGBA", (400, 400), (0, 0, 0, 0))
+        ImageDraw.Draw(image).ellipse((100, 100, 299, 299), fill=color)
+        image.save(self.path)
+
+    def test_plan_has_display_sizes_and_mips(self):
+        sizes = self.ap.plan_sizes((400, 400), [0.1, 0.25])
+        self.assertEqual([w for w, _ in sizes], [200, 100, 50, 40])
+
+    def test_find_variant_picks_smallest_covering(self):
+        self.ap.build(self.manifest)
+        self.assertEqual(self.ap.find_variant(self.path, 0.1)[1:], (40, 40))
+        self.assertEqual(self.ap.find_variant(self.path, 0.11)[1:], (50, 50))
+        self.assertEqual(self.ap.find_variant(self.path, 0.3)[1:], (200, 200))
+        too_big = self.ap.find_variant(self.path, 0.8)
+        self.assertEqual(too_big, (self.path, 400, 400))
+        from PIL import Image
+        with Image.open(self.ap.find_variant(self.path, 0.1).path) as image:
+            self.assertEqual(image.size, (40, 40))
+
+    def test_falls_back_to_original_until_built_or_after_change(self):
+        self.assertEqual(self.ap.find_variant(self.path, 0.1).path, self.path)
+        self.ap.build(self.manifest)
+        old = self.ap.find_variant(self.path, 0.1).path
+        self.draw_disk((0, 0, 255, 255))
+        self.assertEqual(self.ap.find_variant(self.path, 0.1).path, self.path)
+        # Rebuilding replaces the stale variants
+        self.ap.build(self.manifest)
+        self.assertNotEqual(self.ap.find_variant(self.path, 0.1).path, old)
+        self.assertFalse(old.exists())
+
+    @unittest.skipUnless(ARCADE_AVAILABLE, "Arcade not installed")
+    def test_scaled_loader_uses_variant(self):
+        from game_utils.textures import load_scaled_image
+        self.ap.build(self.manifest)
+        image = load_scaled_image(self.path, 0.1)
+        self.assertEqual(image.size, (40, 40))
+        self.assertEqual(image.getpixel((20, 20)), (255, 0, 0, 255))
+
+
+class TestTextureManifest(unittest.TestCase):
+    def test_manifest_matches_scaling_constants(self):
+        manifest = json.loads((ROOT / "assets" / "texture_manifest.json").read_text())
+        for asset, usages in manifest["textures"].items():
+            for usage in usages:
+                script = ROOT / usage["script"]
+                self.assertTrue(script.exists(), usage["script"])
+                if "constant" not in usage:
+                    continue
+                constants = {
+                    node.targets[0].id: node.value.value
+                    for node in ast.parse(script.read_text(encoding="utf-8")).body
+                    if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant)
+                    and isinstance(node.targets[0], ast.Name)
+                }
+                with self.subTest(asset=asset, script=usage["script"]):
+                    self.assertEqual(constants[usage["constant"]], usage["scale"])
+
+
+if __name__ == "__main__":
+    unittest.main()
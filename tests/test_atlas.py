@@ -0,0 +1,109 @@
+"""
+Tests for game_utils/atlas.py (sprite atlas packing and loading).
+Uses small generated images in a temporary folder; no window is opened.
+"""
+from __future__ import annotations
+
+import importlib.util
+import json
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ARCADE_AVAILABLE = importlib.util.find_spec("arcade") is not None
+
+
+@unittest.skipUnless(ARCADE_AVAILABLE, "Arcade not installed; skipping atlas tests")
+class TestPack(unittest.TestCase):
+    def test_rectangles_never_overlap_and_stay_on_page(self):
+        from game_utils.atlas import pack
+        rng = random.Random(3)
+        sizes = [(rng.randint(5, 200), rng.randint(5, 200)) for _ in range(80)]
+        places = pack(sizes, page_size=512, padding=2)
+        self.assertGreater(max(p for p, _, _ in places), 0)  # needed several pages
+        rects = [(p, x, y, x + w, y + h) for (p, x, y), (w, h) in zip(places, sizes)]
+        for page, left, bottom, right, top in rects:
+            self.assertGreaterEqual(min(left, bottom), 2)
+            self.assertLessEqual(max(right, top), 510)
+        for i, a in enumerate(rects):
+            for b in rects[i + 1:]:
+                if a[0] == b[0]:
+                    self.assertTrue(a[3] <= b[1] or b[3] <= a[1] or a[4] <= b[2] or b[4] <= a[2])
+
+    def test_too_big_raises(self):
+        from game_utils.atlas import pack
+        with self.assertRaises(ValueError):
+            pack([(600, 10)], page_size=512)
+
+
+@unittest.skipUnless(ARCADE_AVAILABLE, "Arcade not installed; skipping atlas tests")
+class TestSpriteAtlas(unittest.TestCase):
+    def setUp(self):
+        from PIL import Image, ImageDraw
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+        self.paths = {}
+        for name, color in [("red", (255, 0, 0, 255)), ("blue", (0, 0, 255, 255))]:
+            image = Image.new("RGBA", (400, 200), (0, 0, 0, 0))
+            ImageDraw.Draw(image).rectangle((100, 50, 299, 149), fill=color)
+            self.paths[name] = self.folder / f"{name}.png"
+            image.save(self.paths[name])
+        self.entries = {
+            "red": (self.paths["red"], 0.1),
+            "red_too": (self.paths["red"], 0.1),
+            "blue": (self.paths["blue"], 0.25),
+        }
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_textures_have_drawn_size_and_right_pixels(self):
+        from game_utils.atlas import load_atlas
+        atlas = load_atlas("test", self.entries, self.folder)
+        self.assertEqual(len(atlas), 3)
+        self.assertEqual(atlas.page_count, 1)
+        self.assertEqual(atlas["red"].size, (40, 20))
+        self.assertEqual(atlas["blue"].size, (100, 50))
+        self.assertEqual(atlas["red"].image.getpixel((20, 10)), (255, 0, 0, 255))
+        self.assertEqual(atlas["blue"].image.getpixel((50, 25)), (0, 0, 255, 255))
+        self.assertLessEqual(len(atlas["blue"].hit_box_points), 8)
+
+    def test_same_picture_is_packed_once(self):
+        from game_utils.atlas import load_atlas
+        load_atlas("test", self.entries, self.folder)
+        sprites = json.loads((self.folder / "test.json").read_text())["sprites"]
+        self.assertEqual(
+            {k: sprites["red"][k] for k in "xy"}, {k: sprites["red_too"][k] for k in "xy"}
+        )
+
+    def test_rebuilds_when_scale_changes(self):
+        from game_utils.atlas import load_atlas
+        load_atlas("test", self.entries, self.folder)
+        self.entries["red"] = (self.paths["red"], 0.2)
+        atlas = load_atlas("test", self.entries, self.folder)
+        self.assertEqual(atlas["red"].size, (80, 40))
+
+    def test_hit_boxes_come_from_the_hit_box_cache(self):
+        from game_utils.atlas import load_atlas
+        from game_utils.hitbox_cache import cached_hit_box, compute_hit_box
+        atlas = load_atlas("test", self.entries, self.folder)
+        sidecar = json.loads((self.folder / "red.png.hitbox.json").read_text())
+        self.assertIn("0.1/8", sidecar["hit_boxes"])
+
+        # Same hit box as working it out on the packed texture, in atlas pixels
+        expected = compute_hit_box(atlas["red"].image, 1.0, 8)
+        self.assertEqual(len(atlas["red"].hit_box_points), len(expected))
+        for point, want in zip(atlas["red"].hit_box_points, expected):
+            self.assertAlmostEqual(point[0], want[0], delta=0.05)
+            self.assertAlmostEqual(point[1], want[1], delta=0.05)
+
+        # Stored in the full picture's pixels (10x bigger), so load_texture reuses it
+        points = cached_hit_box(self.paths["red"], 0.1, 8)
+        self.assertAlmostEqual(max(x for x, _ in points), 10 * max(x for x, _ in expected), delta=0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
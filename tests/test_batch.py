@@ -0,0 +1,46 @@
+"""
+Bookkeeping tests for game_utils/batch.py (RectangleBatch).
+No window is opened, so nothing is drawn; we only check the batch contents.
+"""
+from __future__ import annotations
+
+import importlib.util
+import unittest
+
+
+ARCADE_AVAILABLE = importlib.util.find_spec("arcade") is not None
+
+
+@unittest.skipUnless(ARCADE_AVAILABLE, "Arcade not installed; skipping batch tests")
+class TestRectangleBatch(unittest.TestCase):
+    def setUp(self):
+        from game_utils.batch import RectangleBatch
+        self.batch = RectangleBatch()
+
+    def test_add_remove_clear(self):
+        keys = [object() for _ in range(5)]
+        for i, key in enumerate(keys):
+            self.batch.add(key, i * 30, 10, 20, 20, (255, 255, 0))
+        self.assertEqual(len(self.batch), 5)
+        self.assertEqual(len(self.batch._sprites), 5)
+
+        self.batch.remove(keys[2])
+        self.assertNotIn(keys[2], self.batch)
+        self.assertEqual(len(self.batch._sprites), 4)
+        with self.assertRaises(KeyError):
+            self.batch.remove(keys[2])
+
+        self.batch.clear()
+        self.assertEqual(len(self.batch), 0)
+        self.assertEqual(len(self.batch._sprites), 0)
+
+    def test_lbwh_position_and_move(self):
+        key = object()
+        self.batch.add(key, 10, 20, 30, 40, (255, 0, 0))
+        rect = self.batch._by_key[key]
+        self.assertEqual((rect.left, rect.bottom, rect.width, rect.height), (10, 20, 30, 40))
+        self.batch.move(key, 100, 200)
+        self.assertEqual((rect.left, rect.bottom), (100, 200))
+        # Re-adding the same key replaces the old rectangle
+        self.batch.add(key, 0, 0, 5, 5, (0, 0, 255))
+        self.assertEqual(len(self.batch._sprites), 1)
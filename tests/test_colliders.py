@@ -0,0 +1,60 @@
+"""
+Tests for game_utils/colliders.py shape dispatch.
+Uses plain objects with sprite-like attributes; no window or textures needed.
+"""
+from __future__ import annotations
+
+import importlib.util
+import unittest
+
+
+ARCADE_AVAILABLE = importlib.util.find_spec("arcade") is not None
+
+
+class Shape:
+    """Axis-aligned stand-in for a sprite: center plus width/height."""
+
+    def __init__(self, collider, x, y, w, h=None):
+        self.collider = collider
+        self.center_x = x
+        self.center_y = y
+        self.width = w
+        self.height = w if h is None else h
+
+    left = property(lambda self: self.center_x - self.width / 2)
+    right = property(lambda self: self.center_x + self.width / 2)
+    bottom = property(lambda self: self.center_y - self.height / 2)
+    top = property(lambda self: self.center_y + self.height / 2)
+
+
+@unittest.skipUnless(ARCADE_AVAILABLE, "Arcade not installed; skipping collider tests")
+class TestColliders(unittest.TestCase):
+    def setUp(self):
+        from game_utils import colliders
+        self.c = colliders
+
+    def test_circle_circle(self):
+        a = Shape(self.c.CIRCLE, 0, 0, 20)
+        self.assertTrue(self.c.collides(a, Shape(self.c.CIRCLE, 19, 0, 20)))
+        self.assertFalse(self.c.collides(a, Shape(self.c.CIRCLE, 15, 15, 20)))  # 21.2 apart
+
+    def test_circle_aabb_corner(self):
+        box = Shape(self.c.AABB, 0, 0, 20)  # corners at (+-10, +-10)
+        # Beyond the corner diagonally: the AABB of the circle overlaps, the circle does not
+        near_corner = Shape(self.c.CIRCLE, 17, 17, 18)
+        self.assertFalse(self.c.collides(near_corner, box))
+        self.assertFalse(self.c.collides(box, near_corner))
+        self.assertTrue(self.c.collides(Shape(self.c.CIRCLE, 17, 0, 18), box))
+
+    def test_aabb_aabb(self):
+        a = Shape(self.c.AABB, 0, 0, 10)
+        self.assertTrue(self.c.collides(a, Shape(self.c.AABB, 9, 9, 10)))
+        self.assertFalse(self.c.collides(a, Shape(self.c.AABB, 11, 0, 10)))
+
+    def test_collider_radius_override_and_list(self):
+        a = Shape(self.c.CIRCLE, 0, 0, 10)
+        b = Shape(self.c.CIRCLE, 30, 0, 10)
+        self.assertFalse(self.c.collides(a, b))
+        a.collider_radius = 26
+        self.assertTrue(self.c.collides(a, b))
+        self.assertEqual(self.c.collisions_with_list(a, [a, b]), [b])
@@ -0,0 +1,116 @@
+"""
+Tests for game_utils/collision.py (CollisionWorld events and pair caching).
+Pure Python: uses tiny square objects instead of sprites.
+"""
+from __future__ import annotations
+
+import unittest
+
+from game_utils.collision import BroadPhase, CollisionLayers, CollisionWorld, square_bounds
+
+
+class Square:
+    def __init__(self, x, y, size=10):
+        self.x = x
+        self.y = y
+        self.size = size
+
+
+class TestCollisionWorld(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.narrow_calls = 0
+
+        def narrow(a, b):
+            self.narrow_calls += 1
+            return True
+
+        self.world = CollisionWorld(bounds=square_bounds, narrow_phase=narrow)
+        self.player = Square(0, 0)
+        self.food = [Square(5, 5), Square(100, 100)]
+        self.world.watch(
+            self.player, self.food,
+            on_enter=lambda s, o: self.calls.append(("enter", o)),
+            on_stay=lambda s, o: self.calls.append(("stay", o)),
+            on_exit=lambda s, o: self.calls.append(("exit", o)),
+        )
+
+    def test_enter_stay_exit(self):
+        near, far = self.food
+        self.world.update()
+        self.assertEqual(self.calls, [("enter", near)])
+        self.world.update()
+        self.assertEqual(self.calls[-1], ("stay", near))
+        self.player.x = 200
+        self.world.update()
+        self.assertEqual(self.calls[-1], ("exit", near))
+        self.assertEqual(self.world.contacts(self.player), set())
+
+    def test_unmoved_pairs_skip_narrow_phase(self):
+        self.world.update()
+        self.assertEqual(self.narrow_calls, 1)
+        self.world.update()
+        self.assertEqual(self.narrow_calls, 1)
+        self.assertEqual(self.world.cache_hits, 1)
+        self.player.x += 1  # moved: must test again
+        self.world.update()
+        self.assertEqual(self.narrow_calls, 2)
+
+    def test_callback_may_remove_and_forget(self):
+        def eat(subject, other):
+            self.food.remove(other)
+            self.world.forget(other)
+
+        self.world.clear()
+        self.calls.clear()
+        self.world.watch(self.player, self.food, on_enter=eat,
+                         on_exit=lambda s, o: self.calls.append(("exit", o)))
+        self.world.update()
+        self.assertEqual(len(self.food), 1)
+        self.world.update()
+        self.assertEqual(self.calls, [])  # forgotten objects don't fire on_exit
+
+    def test_callable_others(self):
+        world = CollisionWorld(bounds=square_bounds)
+        entered = []
+        world.watch(self.player, lambda: self.food[:1], on_enter=lambda s, o: entered.append(o))
+        world.update()
+        self.assertEqual(entered, [self.food[0]])
+
+
+class TestBroadPhaseLayers(unittest.TestCase):
+    def setUp(self):
+        self.layers = CollisionLayers("player", "wall", "pickup", "enemy", "exit")
+        self.layers.interact("player", "wall", "pickup", "enemy", "exit")
+        self.broad = BroadPhase(self.layers, cell_size=32, bounds=square_bounds)
+        self.player = Square(0, 0)
+        self.wall = Square(5, 0)
+        self.food = Square(0, 5)
+        self.broad.add(self.player, "player")
+        self.broad.add(self.wall, "wall")
+        self.broad.add(self.food, "pickup")
+        # A wall far away and a wall overlapping the food
+        self.broad.add(Square(500, 500), "wall")
+        self.broad.add(Square(2, 7), "wall")
+
+    def test_masks(self):
+        self.assertTrue(self.layers.can_interact("wall", "player"))
+        self.assertFalse(self.layers.can_interact("wall", "pickup"))
+        with self.assertRaises(ValueError):
+            self.layers.bit("lava")
+
+    def test_masked_pairs_are_never_tested(self):
+        self.broad.reset_counters()
+        self.assertEqual(self.broad.nearby(self.food), [self.player])
+        # Only the player bucket was walked: the overlapping walls were skipped
+        self.assertEqual(self.broad.pair_tests, 1)
+
+    def test_layer_filter_and_move(self):
+        self.assertEqual(self.broad.nearby(self.player, "pickup"), [self.food])
+        self.assertEqual(len(self.broad.nearby(self.player, "wall")), 2)
+        self.player.x = 495
+        self.player.y = 495
+        self.broad.move(self.player)
+        self.assertEqual(len(self.broad.nearby(self.player)), 1)
+        self.broad.remove(self.food)
+        self.assertNotIn(self.food, self.broad)
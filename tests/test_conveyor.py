@@ -0,0 +1,73 @@
+"""
+Tests for game_utils/conveyor.py (scrolling world queue).
+Pure Python; uses small stand-ins with left/right edges.
+"""
+from __future__ import annotations
+
+import unittest
+
+from game_utils.conveyor import Conveyor
+
+
+class Box:
+    def __init__(self, left, width=10):
+        self.left = left
+        self.right = left + width
+
+
+class TestConveyor(unittest.TestCase):
+    def test_scroll_and_coordinate_helpers(self):
+        conveyor = Conveyor()
+        conveyor.scroll(30)
+        conveyor.scroll(12.5)
+        self.assertEqual(conveyor.scroll_x, 42.5)
+        self.assertEqual(conveyor.to_world(150), 192.5)
+        self.assertEqual(conveyor.to_screen(192.5), 150)
+
+    def test_expire_only_pops_items_left_of_screen(self):
+        conveyor = Conveyor()
+        boxes = [Box(x) for x in (0, 20, 40, 60)]
+        for box in boxes:
+            conveyor.push(box)
+        conveyor.scroll(35)  # right edges 10 and 30 are gone, 50 is still visible
+        self.assertEqual(conveyor.expire(), boxes[:2])
+        self.assertEqual(conveyor.expire(), [])
+        self.assertIs(conveyor.leftmost(), boxes[2])
+        self.assertEqual(list(conveyor), boxes[2:])
+
+    def test_overlapping_uses_x_order(self):
+        conveyor = Conveyor()
+        boxes = [Box(x, width=w) for x, w in ((0, 10), (20, 40), (30, 5), (100, 10))]
+        for box in boxes:
+            conveyor.push(box)
+        self.assertEqual(conveyor.overlapping(50, 55), [boxes[1]])  # the wide one reaches 60
+        self.assertEqual(conveyor.overlapping(32, 34), boxes[1:3])
+        self.assertEqual(conveyor.overlapping(70, 90), [])
+        conveyor.scroll(15)
+        conveyor.expire()
+        self.assertEqual(conveyor.overlapping(0, 200), boxes[1:])
+
+    def test_push_out_of_order_is_inserted_sorted(self):
+        conveyor = Conveyor()
+        boxes = [Box(x) for x in (0, 100, 50, 100, 75)]
+        for box in boxes:
+            conveyor.push(box)
+        self.assertEqual([b.left for b in conveyor], [0, 50, 75, 100, 100])
+        self.assertEqual(conveyor.overlapping(55, 70), [boxes[2]])
+
+    def test_long_run_compacts_and_clear_resets(self):
+        conveyor = Conveyor()
+        for i in range(1000):
+            conveyor.push(Box(i * 20))
+            conveyor.scroll(20)
+            conveyor.expire()
+        self.assertLessEqual(len(conveyor), 2)
+        self.assertLess(len(conveyor._items), 100)  # popped slots were trimmed
+        conveyor.clear()
+        self.assertEqual((len(conveyor), conveyor.scroll_x), (0, 0))
+        with self.assertRaises(IndexError):
+            conveyor.pop_left()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Tests for game_utils/gif_clips.py (lazily decoded GIF animation clips).
+Uses small generated GIFs in a temporary folder; no window is opened.
+"""
+from __future__ import annotations
+
+import importlib.util
+import os
+import tempfile
+import unittest
+
+ARCADE_AVAILABLE = importlib.util.find_spec("arcade") is not None
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SLIME = os.path.join(ROOT, "assets", "SLIME")
+
+COLORS = [(255, 0, 0, 255), (0, 255, 0, 255), (0, 0, 255, 255), (255, 255, 0, 255)]
+DELAYS_MS = [100, 250, 40, 100]
+
+
+@unittest.skipUnless(ARCADE_AVAILABLE, "Arcade not installed; skipping GIF clip tests")
+class TestGifClips(unittest.TestCase):
+    def setUp(self):
+        from PIL import Image
+        from game_utils.gif_clips import GifClipLoader
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "blink.gif")
+        frames = [Image.new("RGBA", (8, 6), color) for color in COLORS]
+        frames[0].save(self.path, save_all=True, append_images=frames[1:],
+                       duration=DELAYS_MS, loop=0, disposal=2)
+        self.loader = GifClipLoader()
+
+    def tearDown(self):
+        self.loader.clear()
+        self.tmp.cleanup()
+
+    def test_delays_are_read_without_decoding(self):
+        clip = self.loader.clip(self.path)
+        self.assertEqual(len(clip), 4)
+        self.assertEqual(clip.durations, tuple(ms / 1000 for ms in DELAYS_MS))
+        self.assertAlmostEqual(clip.length, 0.49)
+        self.assertEqual((self.loader.stats.misses, self.loader.opens), (0, 0))
+        self.assertIs(self.loader.clip(os.path.join(self.tmp.name, ".", "blink.gif")), clip)
+
+    def test_frames_are_decoded_on_first_use_and_cached(self):
+        clip = self.loader.clip(self.path)
+        first = clip[1]
+        self.assertEqual(first.image.getpixel((0, 0)), COLORS[1])
+        self.assertIs(clip[1], first)
+        self.assertEqual(clip[-1].image.getpixel((3, 3)), COLORS[3])
+        stats = self.loader.stats
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 2, 2))
+        self.assertAlmostEqual(stats.hit_rate, 1 / 3)
+        with self.assertRaises(IndexError):
+            clip[4]
+
+    def test_playing_forward_opens_the_file_once(self):
+        clip = self.loader.clip(self.path)
+        for _ in range(3):                      # three loops
+            for texture in clip:
+                self.assertEqual(texture.width, 8)
+        self.assertEqual(self.loader.opens, 1)
+        self.assertEqual(self.loader.stats.misses, 4)
+
+    def test_least_recently_used_frames_are_evicted(self):
+        self.loader.max_bytes = 2 * 8 * 6 * 4   # room for two frames
+        clip = self.loader.clip(self.path)
+        clip[0], clip[1]
+        clip[0]                                 # frame 1 is now the oldest
+        clip[2]
+        stats = self.loader.stats
+        self.assertEqual((stats.evictions, stats.entries), (1, 2))
+        clip[0]
+        self.assertEqual(self.loader.stats.hits, 2)
+        clip[1]                                 # decoded again
+        self.assertEqual(self.loader.stats.misses, 4)
+
+    def test_decoding_one_clip_does_not_block_the_others(self):
+        import shutil
+        import threading
+        other_path = os.path.join(self.tmp.name, "blink2.gif")
+        shutil.copy(self.path, other_path)
+        slow, other = self.loader.clip(self.path), self.loader.clip(other_path)
+        cached = other[0]
+
+        # A background job is stuck halfway through decoding a frame of ``slow``
+        started, release = threading.Event(), threading.Event()
+        decode = slow.decode
+
+        def stuck_decode(index):
+            started.set()
+            release.wait(5)
+            return decode(index)
+
+        slow.decode = stuck_decode
+        job = threading.Thread(target=lambda: slow[2])
+        job.start()
+        self.assertTrue(started.wait(5))
+        try:
+            # The game still gets cached frames and new frames of other clips
+            done = threading.Event()
+            game = threading.Thread(target=lambda: (other[0], other[1], done.set()))
+            game.start()
+            self.assertTrue(done.wait(2), "the game waited for another clip's decode")
+            self.assertIs(other[0], cached)
+        finally:
+            release.set()
+            job.join(5)
+        self.assertEqual(slow[2].image.getpixel((0, 0)), COLORS[2])
+
+    def test_not_a_gif(self):
+        from PIL import Image
+        from game_utils.gif_clips import read_gif_delays
+
+        path = os.path.join(self.tmp.name, "frame.png")
+        Image.new("RGBA", (2, 2)).save(path)
+        with self.assertRaises(ValueError):
+            read_gif_delays(path)
+
+    @unittest.skipUnless(os.path.isdir(SLIME), "Slime assets not found")
+    def test_slime_gifs_match_their_frame_pictures(self):
+        from PIL import Image
+        from game_utils.anim_bundle import find_clips
+        from game_utils.gif_clips import find_gif_clips
+
+        frames = find_clips(SLIME)
+        gifs = find_gif_clips(SLIME)
+        self.assertEqual(set(gifs), set(frames))
+        clip = self.loader.clip(gifs["WALK_R"])
+        self.assertEqual(len(clip), len(frames["WALK_R"]))
+        for texture, path in zip(clip, frames["WALK_R"]):
+            with Image.open(path) as image:
+                self.assertEqual(texture.image.tobytes(), image.convert("RGBA").tobytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests for game_utils/hitbox_cache.py.
+Uses small generated images in a temporary folder; no window is opened.
+"""
+from __future__ import annotations
+
+import importlib.util
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ARCADE_AVAILABLE = importlib.util.find_spec("arcade") is not None
+
+
+@unittest.skipUnless(ARCADE_AVAILABLE, "Arcade not installed; skipping hit box cache tests")
+class TestHitBoxCache(unittest.TestCase):
+    def setUp(self):
+        from PIL import Image, ImageDraw
+        from game_utils import hitbox_cache
+
+        self.hc = hitbox_cache
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "disk.png"
+        image = Image.new("RGBA", (400, 400), (0, 0, 0, 0))
+        ImageDraw.Draw(image).ellipse((100, 100, 299, 299), fill=(255, 0, 0, 255))
+        image.save(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_hit_box_hugs_visible_pixels(self):
+        from PIL import Image
+        points = self.hc.compute_hit_box(Image.open(self.path), scale=0.1, max_points=8)
+        self.assertLessEqual(len(points), 8)
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        # Disk spans -100..100 around the center; allow one sample pixel of slack
+        for value in (min(xs), min(ys)):
+            self.assertAlmostEqual(value, -100, delta=13)
+        for value in (max(xs), max(ys)):
+            self.assertAlmostEqual(value, 100, delta=13)
+
+    def test_sidecar_cache_roundtrip_and_invalidation(self):
+        texture = self.hc.load_texture(self.path, 0.1)
+        sidecar = self.path.with_name(self.path.name + self.hc.HIT_BOX_SUFFIX)
+        data = json.loads(sidecar.read_text())
+        self.assertEqual(data["source_hash"], self.hc.file_hash(self.path))
+        self.assertIn("0.1/8", data["hit_boxes"])
+        self.assertEqual(tuple(map(tuple, data["hit_boxes"]["0.1/8"])), tuple(texture.hit_box_points))
+
+        # A cached entry is used as-is
+        data["hit_boxes"]["0.1/8"] = [[-1, -1], [1, -1], [1, 1]]
+        sidecar.write_text(json.dumps(data))
+        self.assertEqual(self.hc.cached_hit_box(self.path, 0.1), ((-1, -1), (1, -1), (1, 1)))
+
+        # Changing the picture invalidates the cache
+        from PIL import Image
+        Image.new("RGBA", (400, 400), (255, 255, 255, 255)).save(self.path)
+        points = self.hc.cached_hit_box(self.path, 0.1)
+        self.assertEqual(len(points), 4)
+        self.assertEqual(max(p[0] for p in points), 200)
+
+    def test_threads_adding_hit_boxes_keep_each_others_entries(self):
+        import threading
+        from PIL import Image
+        image = Image.open(self.path).convert("RGBA")
+        source_hash = self.hc.file_hash(self.path)
+        scales = [0.01 * i for i in range(1, 17)]
+        threads = [threading.Thread(target=self.hc.cached_hit_box,
+                                    args=(self.path, scale, 8, image, source_hash))
+                   for scale in scales]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        sidecar = self.path.with_name(self.path.name + self.hc.HIT_BOX_SUFFIX)
+        data = json.loads(sidecar.read_text())
+        self.assertEqual(set(data["hit_boxes"]), {f"{scale:g}/8" for scale in scales})
+        self.assertEqual(list(Path(self.tmp.name).glob("*.tmp")), [])
@@ -0,0 +1,148 @@
+"""
+Tests for game_utils/pixel_cache.py (decoded pictures kept as raw pixels).
+Uses small generated images in a temporary folder; no window is opened.
+"""
+from __future__ import annotations
+
+import importlib.util
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ARCADE_AVAILABLE = importlib.util.find_spec("arcade") is not None
+
+
+@unittest.skipUnless(ARCADE_AVAILABLE, "Arcade not installed; skipping pixel cache tests")
+class TestRawFiles(unittest.TestCase):
+    def setUp(self):
+        from PIL import Image, ImageDraw
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+        self.image = Image.new("RGBA", (30, 20), (0, 0, 0, 0))
+        ImageDraw.Draw(self.image).ellipse((5, 2, 24, 17), fill=(200, 40, 10, 255))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_keeps_every_pixel(self):
+        from game_utils.pixel_cache import read_raw, write_raw
+        path = self.folder / "disk.rgba"
+        write_raw(self.image, path)
+        image = read_raw(path, (30, 20))
+        self.assertEqual(image.size, (30, 20))
+        self.assertEqual(image.mode, "RGBA")
+        self.assertEqual(image.tobytes(), self.image.tobytes())
+        self.assertEqual(path.stat().st_size, 16 + 30 * 20 * 4)
+
+    def test_changing_a_mapped_image_leaves_the_file_alone(self):
+        from game_utils.pixel_cache import read_raw, write_raw
+        path = self.folder / "disk.rgba"
+        write_raw(self.image, path)
+        image = read_raw(path)
+        image.putpixel((0, 0), (1, 2, 3, 4))
+        self.assertEqual(image.getpixel((0, 0)), (1, 2, 3, 4))
+        self.assertEqual(read_raw(path).getpixel((0, 0)), (0, 0, 0, 0))
+
+    def test_missing_broken_or_wrong_size_files_give_none(self):
+        from game_utils.pixel_cache import read_raw, write_raw
+        path = self.folder / "disk.rgba"
+        self.assertIsNone(read_raw(path))
+        write_raw(self.image, path)
+        self.assertIsNone(read_raw(path, (20, 30)))
+        path.write_bytes(path.read_bytes()[:-4])     # cut short
+        self.assertIsNone(read_raw(path))
+        path.write_bytes(b"")
+        self.assertIsNone(read_raw(path))
+
+
+@unittest.skipUnless(ARCADE_AVAILABLE, "Arcade not installed; skipping pixel cache tests")
+class TestPixelCache(unittest.TestCase):
+    def setUp(self):
+        from PIL import Image, ImageDraw
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "disk.png"
+        image = Image.new("RGBA", (400, 400), (0, 0, 0, 0))
+        ImageDraw.Draw(image).ellipse((100, 100, 299, 299), fill=(255, 0, 0, 255))
+        image.save(self.path)
+        self.decodes = 0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def decode(self):
+        from PIL import Image
+        self.decodes += 1
+        with Image.open(self.path) as image:
+            return image.convert("RGBA").resize((40, 40))
+
+    def test_decodes_once_across_program_runs(self):
+        from game_utils.pixel_cache import PixelCache
+        first = PixelCache().load(self.path, (40, 40), self.decode)
+        cache = PixelCache()   # a new start: only the files are left
+        second = cache.load(self.path, (40, 40), self.decode)
+        self.assertEqual(self.decodes, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+        self.assertEqual(second.tobytes(), first.tobytes())
+        self.assertTrue((Path(self.tmp.name) / ".cache" / "pixels").is_dir())
+
+    def test_each_size_is_cached_separately(self):
+        from game_utils.pixel_cache import PixelCache
+        cache = PixelCache()
+        cache.load(self.path, (40, 40), self.decode)
+        self.assertNotEqual(cache.pixels_path(self.path, (40, 40)), cache.pixels_path(self.path, (20, 20)))
+
+    def test_hash_is_only_read_again_when_size_or_time_changes(self):
+        from game_utils.hitbox_cache import file_hash
+        from game_utils.pixel_cache import PixelCache
+        original = file_hash(self.path)
+        self.assertEqual(PixelCache().source_hash(self.path), original)
+
+        # Same size and time: the remembered hash is trusted, the file isn't read
+        stat = os.stat(self.path)
+        data = bytearray(self.path.read_bytes())
+        data[-20] ^= 0xFF
+        self.path.write_bytes(bytes(data))
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(PixelCache().source_hash(self.path), original)
+
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(PixelCache().source_hash(self.path), file_hash(self.path))
+
+    def test_changed_picture_is_decoded_again_and_old_pixels_dropped(self):
+        from PIL import Image
+        from game_utils.pixel_cache import PixelCache
+        cache = PixelCache()
+        cache.load(self.path, (40, 40), self.decode)
+        old = cache.pixels_path(self.path, (40, 40))
+
+        stat = os.stat(self.path)
+        Image.new("RGBA", (400, 400), (0, 255, 0, 255)).save(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        image = PixelCache().load(self.path, (40, 40), self.decode)
+        self.assertEqual(self.decodes, 2)
+        self.assertEqual(image.getpixel((20, 20)), (0, 255, 0, 255))
+        self.assertFalse(old.exists())
+
+    def test_scaled_textures_and_atlas_pages_skip_decoding(self):
+        from game_utils.atlas import load_atlas
+        from game_utils.pixel_cache import PIXEL_CACHE
+        from game_utils.textures import load_scaled_image
+        first = load_scaled_image(self.path, 0.1)
+        hits = PIXEL_CACHE.hits
+        second = load_scaled_image(self.path, 0.1)
+        self.assertEqual(PIXEL_CACHE.hits, hits + 1)
+        self.assertEqual(second.tobytes(), first.tobytes())
+
+        folder = Path(self.tmp.name) / "atlases"
+        built = load_atlas("disk", {"disk": (self.path, 0.1)}, folder)
+        self.assertTrue((folder / "disk-0.rgba").exists())
+        loaded = load_atlas("disk", {"disk": (self.path, 0.1)}, folder)
+        self.assertEqual(loaded["disk"].image.tobytes(), built["disk"].image.tobytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
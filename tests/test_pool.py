@@ -0,0 +1,63 @@
+"""
+Tests for game_utils/pool.py (SpritePool).
+Sprites and SpriteLists are only created, never drawn, so no window is needed.
+"""
+from __future__ import annotations
+
+import importlib.util
+import unittest
+
+
+ARCADE_AVAILABLE = importlib.util.find_spec("arcade") is not None
+
+
+@unittest.skipUnless(ARCADE_AVAILABLE, "Arcade not installed; skipping sprite pool tests")
+class TestSpritePool(unittest.TestCase):
+    def setUp(self):
+        import arcade
+        from game_utils.pool import SpritePool
+        self.red = arcade.make_soft_square_texture(8, arcade.color.RED, name="pool-red")
+        self.blue = arcade.make_soft_square_texture(8, arcade.color.BLUE, name="pool-blue")
+        self.pool = SpritePool(capacity=4)
+
+    def test_starts_hidden_and_full_size(self):
+        self.assertEqual(len(self.pool.sprite_list), 4)
+        self.assertEqual(len(self.pool), 0)
+        self.assertTrue(all(not s.visible for s in self.pool.sprite_list))
+
+    def test_acquire_release_recycles_same_sprite(self):
+        a = self.pool.acquire(self.red, scale=2)
+        self.assertTrue(a.visible)
+        self.assertIs(a.texture, self.red)
+        self.assertEqual(a.scale, (2, 2))
+        self.pool.release(a)
+        self.assertFalse(a.visible)
+        b = self.pool.acquire(self.blue, scale=1)
+        self.assertIs(a, b)
+        self.assertIs(b.texture, self.blue)
+        self.pool.release(b)
+        with self.assertRaises(KeyError):
+            self.pool.release(b)
+
+    def test_steady_state_does_not_allocate(self):
+        for _ in range(100):
+            for _ in range(3):
+                self.pool.acquire(self.red)
+            while self.pool.oldest() is not None:
+                self.pool.release(self.pool.oldest())
+        self.assertEqual(self.pool.allocations, 4)
+        self.assertEqual(len(self.pool.sprite_list), 4)
+
+    def test_grows_when_dry_and_keeps_spawn_order(self):
+        sprites = [self.pool.acquire(self.red) for _ in range(5)]
+        self.assertEqual(self.pool.capacity, 8)
+        self.assertEqual(self.pool.allocations, 8)
+        self.assertEqual(list(self.pool.active), sprites)
+        self.assertIs(self.pool.oldest(), sprites[0])
+        self.pool.release_all()
+        self.assertEqual(len(self.pool), 0)
+        self.assertIsNone(self.pool.oldest())
+
+
+if __name__ == "__main__":
+    unittest.main()
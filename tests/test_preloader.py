@@ -0,0 +1,105 @@
+"""
+Tests for game_utils/preloader.py (background loading with a loading screen).
+The jobs are small functions, so no pictures are decoded.
+"""
+from __future__ import annotations
+
+import importlib.util
+import os
+import platform
+import threading
+import time
+import unittest
+
+ARCADE_AVAILABLE = importlib.util.find_spec("arcade") is not None
+CI = os.environ.get("CI") == "true"
+IS_LINUX = platform.system() == "Linux"
+WINDOW_TESTS = os.environ.get("WINDOW_TESTS") == "1"
+
+
+@unittest.skipUnless(ARCADE_AVAILABLE, "Arcade not installed; skipping preloader tests")
+class TestPreloader(unittest.TestCase):
+    def test_jobs_run_side_by_side(self):
+        from game_utils.preloader import Preloader
+
+        # Both jobs only get past the barrier if they run at the same time
+        barrier = threading.Barrier(2, timeout=5)
+        jobs = {name: (lambda name=name: (barrier.wait(), name)[1]) for name in ("a", "b")}
+        results = Preloader(jobs, workers=2).start().results()
+        self.assertEqual(results, {"a": "a", "b": "b"})
+
+    def test_ready_only_waits_for_required_jobs(self):
+        from game_utils.preloader import Preloader
+
+        release = threading.Event()
+        preloader = Preloader({"level": lambda: 1, "music": lambda: release.wait(5)},
+                              required=["level"], workers=2)
+        self.assertFalse(preloader.ready)           # not started yet
+        preloader.start()
+        deadline = time.monotonic() + 5
+        while not preloader.ready and time.monotonic() < deadline:
+            time.sleep(0.001)
+        self.assertTrue(preloader.ready)
+        self.assertEqual((preloader.done, preloader.total, preloader.progress), (1, 1, 1.0))
+        self.assertFalse(preloader.finished)       # still loading in the background
+        self.assertEqual(preloader.results(), {"level": 1})
+        release.set()
+        self.assertEqual(preloader.wait(), {"level": 1, "music": True})
+        self.assertTrue(preloader.finished)
+
+    def test_required_jobs_start_first(self):
+        from game_utils.preloader import Preloader
+
+        order = []
+        jobs = {name: (lambda name=name: order.append(name)) for name in ("sky", "ground", "player")}
+        Preloader(jobs, required=["player"], workers=1).wait()
+        self.assertEqual(order[0], "player")
+
+    def test_errors_reach_the_caller(self):
+        from game_utils.preloader import Preloader
+
+        def broken():
+            raise FileNotFoundError("assets/missing.png")
+
+        preloader = Preloader({"broken": broken})
+        with self.assertRaises(FileNotFoundError):
+            preloader.results()
+        with self.assertRaises(ValueError):
+            Preloader({"a": broken}, required=["b"])
+
+    def test_load_now(self):
+        from game_utils.preloader import load_now
+
+        self.assertEqual(load_now({"x": lambda: 2, "y": lambda: 3}), {"x": 2, "y": 3})
+
+
+@unittest.skipIf(CI and not (IS_LINUX and WINDOW_TESTS), "Skip GUI window tests in CI except Linux with Xvfb")
+@unittest.skipUnless(ARCADE_AVAILABLE, "Arcade not installed; skipping loading view tests")
+class TestLoadingView(unittest.TestCase):
+    def test_switches_to_the_game_when_ready(self):
+        import arcade
+        from game_utils.preloader import LoadingView, Preloader
+
+        window = arcade.Window(100, 100, "test")
+        try:
+            game = arcade.View()
+            started = []
+
+            def start_game(results):
+                started.append(results)
+                return game
+
+            loading = LoadingView(Preloader({"level": lambda: "map"}), start_game)
+            window.show_view(loading)
+            deadline = time.monotonic() + 5
+            while window.current_view is loading and time.monotonic() < deadline:
+                loading.on_draw()
+                loading.on_update(1 / 60)
+            self.assertIs(window.current_view, game)
+            self.assertEqual(started, [{"level": "map"}])
+        finally:
+            window.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Tests for game_utils/quadtree.py.
+Pure Python: no Arcade window or textures needed.
+"""
+from __future__ import annotations
+
+import random
+import unittest
+
+from game_utils.quadtree import LooseQuadtree
+
+
+class Box:
+    """Minimal stand-in for a sprite: just the four edges."""
+
+    def __init__(self, x, y, size):
+        self.left = x
+        self.bottom = y
+        self.right = x + size
+        self.top = y + size
+
+
+def brute_force(boxes, left, bottom, right, top):
+    return {
+        id(b) for b in boxes
+        if b.left <= right and b.right >= left and b.bottom <= top and b.top >= bottom
+    }
+
+
+class TestLooseQuadtree(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(1234)
+        self.boxes = [Box(rng.uniform(0, 1260), rng.uniform(0, 700), rng.uniform(2, 60))
+                      for _ in range(2000)]
+        self.tree = LooseQuadtree(0, 0, 1280, 720)
+        self.tree.extend(self.boxes)
+
+    def test_query_matches_brute_force(self):
+        rng = random.Random(99)
+        for _ in range(200):
+            x, y = rng.uniform(-50, 1280), rng.uniform(-50, 720)
+            w, h = rng.uniform(1, 200), rng.uniform(1, 200)
+            got = {id(b) for b in self.tree.query(x, y, x + w, y + h)}
+            self.assertEqual(got, brute_force(self.boxes, x, y, x + w, y + h))
+
+    def test_remove_and_len(self):
+        self.assertEqual(len(self.tree), 2000)
+        for b in self.boxes[:500]:
+            self.tree.remove(b)
+        self.assertEqual(len(self.tree), 1500)
+        self.assertNotIn(self.boxes[0], self.tree)
+        got = {id(b) for b in self.tree.query(0, 0, 1280, 720)}
+        self.assertEqual(got, {id(b) for b in self.boxes[500:]})
+        with self.assertRaises(KeyError):
+            self.tree.remove(self.boxes[0])
+        self.tree.discard(self.boxes[0])  # no error
+
+    def test_query_around_excludes_self_and_sees_outside_items(self):
+        player = Box(100, 100, 30)
+        outside = Box(-500, -500, 10)  # outside the tree area
+        self.tree.clear()
+        self.tree.extend([player, outside, Box(120, 120, 10), Box(900, 600, 10)])
+        self.assertEqual(len(self.tree.query_around(player)), 1)
+        self.assertEqual(self.tree.query(-505, -505, -495, -495), [outside])
+
+    def test_update_after_move(self):
+        b = self.boxes[0]
+        b.left, b.bottom, b.right, b.top = 5000, 5000, 5010, 5010
+        self.tree.update(b)
+        self.assertEqual(self.tree.query(4990, 4990, 5020, 5020), [b])
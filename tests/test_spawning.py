@@ -0,0 +1,61 @@
+"""
+Tests for game_utils/spawning.py (Poisson-disk spawn placement).
+Pure Python; no window needed.
+"""
+from __future__ import annotations
+
+import math
+import random
+import unittest
+
+from game_utils.spawning import PoissonDiskSampler, around, spawn_points
+
+
+def closest_pair(points):
+    return min(math.dist(a, b) for i, a in enumerate(points) for b in points[i + 1:])
+
+
+class TestPoissonDiskSampler(unittest.TestCase):
+    def test_fill_keeps_min_distance_and_covers_area(self):
+        sampler = PoissonDiskSampler(0, 0, 400, 300, 30, rng=random.Random(1))
+        points = sampler.fill()
+        self.assertGreaterEqual(closest_pair(points), 30)
+        # Dense enough: at least one point per (2 * min_distance) square
+        self.assertGreater(len(points), 400 * 300 / (2 * 30) ** 2)
+
+    def test_exclusion_zones_and_clearance(self):
+        hud = (0, 200, 150, 300)
+        sampler = PoissonDiskSampler(0, 0, 400, 300, 20, exclude=[hud], clearance=10,
+                                     rng=random.Random(2))
+        for x, y in sampler.fill():
+            self.assertFalse(-10 <= x <= 160 and 190 <= y <= 310, (x, y))
+
+    def test_limit_and_seeded_repeatable(self):
+        a = PoissonDiskSampler(0, 0, 500, 500, 25, rng=random.Random(7)).fill(limit=10)
+        b = PoissonDiskSampler(0, 0, 500, 500, 25, rng=random.Random(7)).fill(limit=10)
+        self.assertEqual(len(a), 10)
+        self.assertEqual(a, b)
+
+
+class TestSpawnPoints(unittest.TestCase):
+    def test_respects_existing_and_player(self):
+        rng = random.Random(3)
+        existing = [(300, 300), (900, 400)]
+        player = around((100, 100), 100)
+        points = spawn_points(5, (50, 50, 1230, 670), 100, exclude=[player],
+                              existing=existing, rng=rng)
+        self.assertEqual(len(points), 5)
+        self.assertGreaterEqual(closest_pair(points + existing), 100)
+        for x, y in points:
+            self.assertFalse(x <= 200 and y <= 200)
+
+    def test_crowded_board_still_returns_count_outside_zones(self):
+        rng = random.Random(4)
+        points = spawn_points(200, (0, 0, 300, 300), 100, exclude=[(0, 0, 100, 100)], rng=rng)
+        self.assertEqual(len(points), 200)
+        for x, y in points:
+            self.assertFalse(x <= 100 and y <= 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Tests for game_utils/state_machine.py (compiled, table-driven state machines).
+No Arcade needed: states only name their clips.
+"""
+from __future__ import annotations
+
+import unittest
+
+from game_utils.state_machine import State, StateMachine, compile_machine
+
+STEP = 0.25  # exact in binary, so timers land on known updates
+
+STATES = {
+    "IDLE": State("idle", on={"go": "RUN"}, after=[(1.0, "SLEEP")]),
+    "SLEEP": State("sleep", on={"go": "RUN"}),
+    "RUN": State("run", on={"stop": "PAUSE"}, group="busy"),
+    "PAUSE": State("run", on={"go": "RUN"}, after=[(0.5, "IDLE")], group="busy"),
+    "DONE": State("done", after=[(2.0, "IDLE")]),
+}
+GROUP_TIMERS = {"busy": [(3.0, "DONE")]}
+
+
+class TestStateMachine(unittest.TestCase):
+    def setUp(self):
+        self.table = compile_machine(STATES, initial="IDLE", group_timers=GROUP_TIMERS)
+        self.machine = StateMachine(self.table)
+
+    def steps(self, keys):
+        return [(self.machine.update(STEP, key), self.machine.name)[1] for key in keys]
+
+    def test_timer_fires_after_its_time(self):
+        self.assertEqual(self.steps(["stop"] * 5), ["IDLE", "IDLE", "IDLE", "SLEEP", "SLEEP"])
+        self.assertEqual(self.machine.clip, "sleep")
+
+    def test_input_only_acts_when_it_changes(self):
+        self.assertTrue(self.machine.update(STEP, "go"))
+        self.assertEqual(self.machine.name, "RUN")
+        self.assertFalse(self.machine.update(STEP, "go"))
+        self.assertTrue(self.machine.update(STEP, "stop"))
+        self.assertEqual(self.machine.name, "PAUSE")
+
+    def test_group_timer_keeps_counting_inside_the_group(self):
+        # RUN and PAUSE are both "busy": 3 seconds of them in a row -> DONE
+        keys = ["go", "stop", "go", "stop", "go", "go"] * 2 + ["go"]
+        names = self.steps(keys)
+        self.assertEqual(names[:12], ["RUN", "PAUSE", "RUN", "PAUSE", "RUN", "RUN"] * 2)
+        self.assertEqual(names[12], "DONE")
+
+    def test_leaving_the_group_restarts_its_timer(self):
+        self.steps(["go", "stop", "stop", "stop"])          # the pause runs out -> IDLE
+        self.assertEqual(self.machine.name, "IDLE")
+        names = self.steps(["go"] * 13)
+        self.assertEqual(names.index("DONE"), 12)
+
+    def test_held_input_acts_when_a_state_is_entered(self):
+        self.steps(["go"] * 13)                              # busy for 3 s -> DONE
+        self.assertEqual(self.machine.name, "DONE")
+        # DONE ignores input; when it times out into IDLE, "go" is still held
+        names = self.steps(["go"] * 8)
+        self.assertEqual(names[-1], "RUN")
+        self.assertEqual(names.count("IDLE"), 0)
+
+    def test_spec_errors(self):
+        with self.assertRaises(ValueError):
+            compile_machine({"A": State("a", on={"x": "NOPE"})}, "A")
+        with self.assertRaises(ValueError):
+            compile_machine({"A": State("a", after=[(0, "A")])}, "A")
+        with self.assertRaises(ValueError):
+            compile_machine({"A": State("a", on={"x": "B"}), "B": State("b", on={"x": "A"})}, "A")
+        with self.assertRaises(ValueError):
+            compile_machine(STATES, "IDLE", group_timers={"busy": [(1.0, "PAUSE")]})
+        with self.assertRaises(ValueError):
+            compile_machine(STATES, "IDLE", group_timers={"nobody": [(1.0, "IDLE")]})
+
+
+if __name__ == "__main__":
+    unittest.main()
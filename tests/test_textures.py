@@ -0,0 +1,47 @@
+"""
+Tests for game_utils/textures.py (downscaled pictures).
+Uses small generated images in a temporary folder; no window is opened.
+"""
+from __future__ import annotations
+
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ARCADE_AVAILABLE = importlib.util.find_spec("arcade") is not None
+
+
+@unittest.skipUnless(ARCADE_AVAILABLE, "Arcade not installed; skipping scaled texture tests")
+class TestScaledTextures(unittest.TestCase):
+    def setUp(self):
+        from PIL import Image, ImageDraw
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i, color in enumerate([(255, 0, 0, 255), (0, 0, 255, 255)]):
+            image = Image.new("RGBA", (400, 400), (0, 0, 0, 0))
+            ImageDraw.Draw(image).ellipse((100, 100, 299, 299), fill=color)
+            path = Path(self.tmp.name) / f"disk{i}.png"
+            image.save(path)
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_image_has_on_screen_size(self):
+        from game_utils.textures import load_scaled_image
+        image = load_scaled_image(self.paths[0], 0.1)
+        self.assertEqual((image.size, image.mode), ((40, 40), "RGBA"))
+        self.assertEqual(image.getpixel((20, 20)), (255, 0, 0, 255))
+        self.assertEqual(image.getpixel((0, 0))[3], 0)
+
+    def test_each_file_and_scale_gets_its_own_image(self):
+        from game_utils.textures import load_scaled_image
+        self.assertEqual(load_scaled_image(self.paths[1], 0.1).getpixel((20, 20)), (0, 0, 255, 255))
+        self.assertEqual(load_scaled_image(self.paths[0], 0.05).size, (20, 20))
+
+
+if __name__ == "__main__":
+    unittest.main()
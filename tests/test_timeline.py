@@ -0,0 +1,63 @@
+"""
+Tests for game_utils/timeline.py (seeded spawn timeline).
+Pure Python; no window needed.
+"""
+from __future__ import annotations
+
+import random
+import unittest
+
+from game_utils.timeline import SpawnTimeline, constant, exponential, ramp
+
+
+def play(timeline, steps):
+    events = []
+    for dt in steps:
+        events.extend(timeline.advance(dt))
+    return events
+
+
+class TestSpawnTimeline(unittest.TestCase):
+    def test_same_seed_same_events_whatever_the_frame_rate(self):
+        smooth = play(SpawnTimeline(13, ramp(2.0, 0.5, 30), seed=5, jitter=0.3), [1 / 60] * 3600)
+        rng = random.Random(0)
+        choppy_steps = [rng.choice([1 / 144, 1 / 30, 0.4]) for _ in range(400)]
+        choppy_steps.append(60 - sum(choppy_steps))
+        choppy = play(SpawnTimeline(13, ramp(2.0, 0.5, 30), seed=5, jitter=0.3), choppy_steps)
+        # Float sums of the steps differ slightly, so compare up to just before 60 s
+        smooth = [e for e in smooth if e.time < 59.9]
+        self.assertGreater(len(smooth), 40)
+        self.assertEqual(smooth, [e for e in choppy if e.time < 59.9])
+
+    def test_long_frame_catches_up_in_order(self):
+        timeline = SpawnTimeline(3, constant(1.0), seed=1)
+        events = timeline.advance(5.5)
+        self.assertEqual([e.time for e in events], [1.0, 2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(timeline.emitted, 5)
+        self.assertEqual(timeline.advance(0.4), [])
+
+    def test_upcoming_previews_without_consuming(self):
+        timeline = SpawnTimeline(4, constant(0.5), seed=2)
+        preview = timeline.upcoming(2.0)
+        self.assertEqual([e.time for e in preview], [0.5, 1.0, 1.5, 2.0])
+        self.assertEqual(timeline.advance(2.0), preview)
+
+    def test_schedule_reset_and_curves(self):
+        timeline = SpawnTimeline(2, constant(10.0), seed=3)
+        extra = timeline.schedule(1.5, 1)
+        self.assertEqual(timeline.advance(2.0), [extra])
+        first_run = play(timeline, [10.0] * 5)
+        timeline.reset()
+        self.assertEqual(play(timeline, [10.0] * 5 + [2.0])[:len(first_run)], first_run)
+
+        curve = ramp(2.0, 1.0, 100)
+        self.assertEqual((curve(0), curve(50), curve(500)), (2.0, 1.5, 1.0))
+        curve = exponential(1.0, 0.01, 10)
+        self.assertAlmostEqual(curve(5), 0.1)
+        self.assertEqual(curve(20), 0.01)
+        with self.assertRaises(ValueError):
+            SpawnTimeline(1, constant(0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()